@@ -11,6 +11,7 @@ from typing import Any
 from . import gevent_patch  # noqa: F401
 from .abstract_node import NodeSideType  # noqa: F401
 from .abstract_node import NodeType  # noqa: F401
+from .client import aio  # noqa: F401
 from .client.client import connect  # noqa: F401
 from .client.client import login  # noqa: F401
 from .client.client import login_as_guest  # noqa: F401
@@ -41,6 +42,9 @@ from .serde import NOTHING  # noqa: F401
 from .serde.deserialize import _deserialize as deserialize  # noqa: F401
 from .serde.serializable import serializable  # noqa: F401
 from .serde.serialize import _serialize as serialize  # noqa: F401
+from .serde.stream import deserialize_from_file  # noqa: F401
+from .serde.stream import deserialize_from_stream  # noqa: F401
+from .serde.stream import serialize_to_stream  # noqa: F401
 from .service.action.action_data_empty import ActionDataEmpty  # noqa: F401
 from .service.action.action_object import ActionObject  # noqa: F401
 from .service.action.plan import Plan  # noqa: F401
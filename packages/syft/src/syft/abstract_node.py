@@ -42,3 +42,9 @@ class AbstractNode:
 
     def get_service(self, path_or_func: str | Callable) -> "AbstractService":
         raise NotImplementedError
+
+    def clear_settings_cache(self) -> None:
+        raise NotImplementedError
+
+    def clear_api_cache(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,173 @@
+# stdlib
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+from typing import Any
+from typing import TypeVar
+
+# relative
+from ..abstract_node import AbstractNode
+from ..service.response import SyftError
+from ..types.grid_url import GridURL
+from .api import APIModule
+from .api import SyftAPI
+from .client import DEFAULT_PYGRID_ADDRESS
+from .client import SyftClient
+from .client import login as sync_login
+from .client import login_as_guest as sync_login_as_guest
+from .connection import HTTP_POOL_SIZE
+
+T = TypeVar("T")
+
+# calls in flight at once, one per pooled HTTP connection
+AIO_MAX_CONCURRENCY = HTTP_POOL_SIZE
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Threads that make the blocking calls of the async clients."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=AIO_MAX_CONCURRENCY, thread_name_prefix="syft-aio"
+                )
+    return _executor
+
+
+async def run_in_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def gather(
+    aws: Iterable[Awaitable[T]], limit: int = AIO_MAX_CONCURRENCY
+) -> list[T]:
+    """Await all of `aws` with at most `limit` of them running at once, in order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+
+def _wrap(attr: Any) -> Any:
+    if isinstance(attr, APIModule | SyftAPI):
+        return AsyncAPIModule(attr)
+    if callable(attr) and not isinstance(attr, type):
+        return AsyncRemoteFunction(attr)
+    return attr
+
+
+class AsyncRemoteFunction:
+    """Awaitable version of a remote function, signed and serialized as usual."""
+
+    def __init__(self, func: Callable) -> None:
+        self._func = func
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_executor(self._func, *args, **kwargs)
+
+    async def map(
+        self, items: Iterable[Any], limit: int = AIO_MAX_CONCURRENCY
+    ) -> list[Any]:
+        """Call the function once per item, `limit` calls at a time."""
+        return await gather((self(item) for item in items), limit=limit)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _wrap(getattr(self._func, name))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._func!r})"
+
+
+class AsyncAPIModule:
+    def __init__(self, module: APIModule | SyftAPI) -> None:
+        self._module = module
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _wrap(getattr(self._module, name))
+
+    def __dir__(self) -> list[str]:
+        return dir(self._module)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._module!r})"
+
+
+class AsyncSyftClient:
+    """Client whose methods and remote functions are coroutines.
+
+    Calls started together with `gather` run concurrently over the pooled
+    connection of the wrapped client instead of one round trip at a time.
+    """
+
+    def __init__(self, client: SyftClient) -> None:
+        self.client = client
+
+    @property
+    def api(self) -> AsyncAPIModule:
+        return AsyncAPIModule(self.client.api)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _wrap(getattr(self.client, name))
+
+    def __repr__(self) -> str:
+        return f"<Async{self.client!r}>"
+
+
+async def login(
+    email: str,
+    # HTTPConnection
+    url: str | GridURL = DEFAULT_PYGRID_ADDRESS,
+    port: int | None = None,
+    # PythonConnection
+    node: AbstractNode | None = None,
+    password: str | None = None,
+    cache: bool = True,
+) -> AsyncSyftClient | SyftError:
+    client = await run_in_executor(
+        sync_login,
+        email=email,
+        url=url,
+        port=port,
+        node=node,
+        password=password,
+        cache=cache,
+    )
+    if isinstance(client, SyftError):
+        return client
+    return AsyncSyftClient(client)
+
+
+async def login_as_guest(
+    # HTTPConnection
+    url: str | GridURL = DEFAULT_PYGRID_ADDRESS,
+    port: int | None = None,
+    # PythonConnection
+    node: AbstractNode | None = None,
+    verbose: bool = True,
+) -> AsyncSyftClient | SyftError:
+    client = await run_in_executor(
+        sync_login_as_guest, url=url, port=port, node=node, verbose=verbose
+    )
+    if isinstance(client, SyftError):
+        return client
+    return AsyncSyftClient(client)
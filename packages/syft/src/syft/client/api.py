@@ -4,6 +4,8 @@ from __future__ import annotations
 # stdlib
 from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextvars import ContextVar
 import inspect
 from inspect import Parameter
 from inspect import signature
@@ -29,8 +31,11 @@ from ..node.credentials import SyftVerifyKey
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
 from ..protocol.data_protocol import migrate_args_and_kwargs
+from ..protocol.data_protocol import supports_batch_api_call
+from ..protocol.data_protocol import supports_flat_serde
 from ..serde.deserialize import _deserialize
 from ..serde.recursive import index_syft_by_module_name
+from ..serde.recursive_flat import is_flat_serde
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
 from ..serde.signature import Signature
@@ -40,6 +45,7 @@ from ..service.context import AuthedServiceContext
 from ..service.context import ChangeContext
 from ..service.response import SyftAttributeError
 from ..service.response import SyftError
+from ..service.response import SyftException
 from ..service.response import SyftSuccess
 from ..service.service import UserLibConfigRegistry
 from ..service.service import UserServiceConfigRegistry
@@ -48,6 +54,7 @@ from ..service.warnings import APIEndpointWarning
 from ..service.warnings import WarningContext
 from ..types.cache_object import CachedSyftObject
 from ..types.identity import Identity
+from ..types.syft_object import SYFT_OBJECT_VERSION_1
 from ..types.syft_object import SYFT_OBJECT_VERSION_2
 from ..types.syft_object import SyftBaseObject
 from ..types.syft_object import SyftMigrationRegistry
@@ -159,6 +166,10 @@ class SignedSyftAPICall(SyftObject):
 
         return self.cached_deseralized_message
 
+    @property
+    def is_flat_serde(self) -> bool:
+        return is_flat_serde(self.serialized_message)
+
     @property
     def is_valid(self) -> Result[SyftSuccess, SyftError]:
         try:
@@ -185,8 +196,12 @@ class SyftAPICall(SyftObject):
     kwargs: dict[str, Any]
     blocking: bool = True
 
-    def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
-        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
+    def sign(
+        self, credentials: SyftSigningKey, flat: bool = False
+    ) -> SignedSyftAPICall:
+        signed_message = credentials.signing_key.sign(
+            _serialize(self, to_bytes=True, flat=flat)
+        )
 
         return SignedSyftAPICall(
             credentials=credentials.verify_key,
@@ -205,8 +220,12 @@ class SyftAPIData(SyftBaseObject):
     # fields
     data: Any = None
 
-    def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
-        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
+    def sign(
+        self, credentials: SyftSigningKey, flat: bool = False
+    ) -> SignedSyftAPICall:
+        signed_message = credentials.signing_key.sign(
+            _serialize(self, to_bytes=True, flat=flat)
+        )
 
         return SignedSyftAPICall(
             credentials=credentials.verify_key,
@@ -215,6 +234,141 @@ class SyftAPIData(SyftBaseObject):
         )
 
 
+@serializable()
+class SyftAPIBatchCall(SyftObject):
+    # version
+    __canonical_name__ = "SyftAPIBatchCall"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    # fields
+    node_uid: UID
+    calls: list[SyftAPICall]
+    parallel: bool = False
+
+    def sign(
+        self, credentials: SyftSigningKey, flat: bool = False
+    ) -> SignedSyftAPICall:
+        signed_message = credentials.signing_key.sign(
+            _serialize(self, to_bytes=True, flat=flat)
+        )
+
+        return SignedSyftAPICall(
+            credentials=credentials.verify_key,
+            serialized_message=signed_message.message,
+            signature=signed_message.signature,
+        )
+
+
+class SyftAPIBatchResult:
+    """Result of a call queued in a batch, set once the batch has been sent."""
+
+    def __init__(self, api_call: SyftAPICall, cache_result: bool = True) -> None:
+        self.api_call = api_call
+        self.cache_result = cache_result
+        self.done = False
+        self._result: Any = None
+
+    def set_result(self, result: Any) -> None:
+        self._result = result
+        self.done = True
+
+    @property
+    def result(self) -> Any:
+        if not self.done:
+            raise SyftException(
+                f"The batch holding {self.api_call.path} has not been sent yet"
+            )
+        return self._result
+
+    def __repr__(self) -> str:
+        if not self.done:
+            return f"<{type(self).__name__}: {self.api_call.path} pending>"
+        return f"<{type(self).__name__}: {self._result!r}>"
+
+
+_active_batch: ContextVar[SyftAPIBatch | None] = ContextVar(
+    "_active_batch", default=None
+)
+
+
+class SyftAPIBatch:
+    """Queues the calls made through an api and sends them in one signed call.
+
+    Calls made inside the `with` block return a `SyftAPIBatchResult` that holds
+    the result once the block exits:
+
+        with client.batch() as batch:
+            me = client.api.services.user.get_current_user()
+            users = client.api.services.user.get_all()
+        me.result, users.result
+
+    With `parallel=True` the node may run the calls concurrently, which is only
+    safe for calls that do not depend on each other, like reads. Nodes on a
+    protocol without batch calls get the calls one by one.
+    """
+
+    def __init__(self, api: SyftAPI, parallel: bool = False) -> None:
+        self.api = api
+        self.parallel = parallel
+        self.results: list[SyftAPIBatchResult] = []
+        self._token: Any = None
+
+    def add(
+        self, api_call: SyftAPICall, cache_result: bool = True
+    ) -> SyftAPIBatchResult:
+        batch_result = SyftAPIBatchResult(api_call, cache_result=cache_result)
+        self.results.append(batch_result)
+        return batch_result
+
+    def send(self) -> list[Any] | SyftError:
+        pending = [
+            batch_result for batch_result in self.results if not batch_result.done
+        ]
+        if not pending:
+            return []
+
+        if supports_batch_api_call(self.api.communication_protocol):
+            batch_call = SyftAPIBatchCall(
+                node_uid=self.api.node_uid,
+                calls=[batch_result.api_call for batch_result in pending],
+                parallel=self.parallel,
+            )
+            results = self.api._send_call(batch_call)
+        else:
+            results = [
+                self.api._send_call(batch_result.api_call) for batch_result in pending
+            ]
+        if not isinstance(results, list) or len(results) != len(pending):
+            if not isinstance(results, SyftError):
+                results = SyftError(message=f"Invalid batch response: {results}")
+            for batch_result in pending:
+                batch_result.set_result(results)
+            return results
+
+        for batch_result, result in zip(pending, results):
+            result = self.api._unwrap_result(result, batch_result.cache_result)
+            # same as a remote function does for the result of a direct call
+            migrated, _ = migrate_args_and_kwargs(
+                [result], kwargs={}, to_latest_protocol=True
+            )
+            batch_result.set_result(migrated[0])
+        # refresh the api once for the whole batch
+        for batch_result in pending:
+            if result_needs_api_update(batch_result.result):
+                self.api.update_api(batch_result.result)
+                break
+        return [batch_result.result for batch_result in pending]
+
+    def __enter__(self) -> SyftAPIBatch:
+        self._token = _active_batch.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        _active_batch.reset(self._token)
+        if exc_type is None:
+            self.send()
+
+
 class RemoteFunction(SyftObject):
     __canonical_name__ = "RemoteFunction"
     __version__ = SYFT_OBJECT_VERSION_2
@@ -576,11 +730,58 @@ class APIModule:
                 "you may not have permission to access the module you are trying to access"
             )
 
+    def _get_all_is_paged(self) -> bool:
+        get_all_signature = getattr(getattr(self, "get_all", None), "signature", None)
+        return (
+            get_all_signature is not None
+            and "page_size" in get_all_signature.parameters
+        )
+
+    def _check_not_batched(self) -> None:
+        if _active_batch.get() is not None:
+            raise SyftException(
+                f"api{self.path} can't be indexed or iterated inside a batch, "
+                "call get_all() and use its result once the batch is sent"
+            )
+
     def __getitem__(self, key: str | int) -> Any:
+        self._check_not_batched()
         if hasattr(self, "get_all"):
+            if isinstance(key, int) and key >= 0 and self._get_all_is_paged():
+                # only fetch the one object from the node
+                page = self.get_all(page_size=1, page_index=key)
+                if isinstance(page, SyftError):
+                    return page
+                items = page_items(page)
+                if not items:
+                    raise IndexError(f"api{self.path} index out of range")
+                return items[0]
             return self.get_all()[key]
         raise NotImplementedError
 
+    def __iter__(self) -> Iterator[Any]:
+        if not hasattr(self, "get_all"):
+            raise NotImplementedError
+        self._check_not_batched()
+        if not self._get_all_is_paged():
+            yield from self.get_all()
+            return
+
+        # relative
+        from ..store.document_store import DEFAULT_PAGE_SIZE
+
+        # fetch pages on demand instead of the whole collection up front
+        page_index = 0
+        while True:
+            page = self.get_all(page_size=DEFAULT_PAGE_SIZE, page_index=page_index)
+            if isinstance(page, SyftError):
+                raise SyftException(page.message)
+            items = page_items(page)
+            yield from items
+            if len(items) < DEFAULT_PAGE_SIZE:
+                return
+            page_index += 1
+
     def _repr_html_(self) -> Any:
         if not hasattr(self, "get_all"):
             return NotImplementedError
@@ -591,6 +792,20 @@ class APIModule:
         return NotImplementedError
 
 
+def page_items(page: Any) -> list[Any]:
+    """The items of one page returned by a paged get_all, services either
+    return a list or their own page view."""
+    # relative
+    from ..service.dataset.dataset import DatasetPageView
+    from ..service.user.user import UserViewPage
+
+    if isinstance(page, UserViewPage):
+        return page.users
+    if isinstance(page, DatasetPageView):
+        return list(page.datasets)
+    return list(page)
+
+
 def debox_signed_syftapicall_response(
     signed_result: SignedSyftAPICall | Any,
 ) -> Any | SyftError:
@@ -850,15 +1065,35 @@ class SyftAPI(SyftObject):
     def user_role(self) -> ServiceRole:
         return self.__user_role
 
+    def batch(self, parallel: bool = False) -> SyftAPIBatch:
+        return SyftAPIBatch(api=self, parallel=parallel)
+
     def make_call(self, api_call: SyftAPICall, cache_result: bool = True) -> Result:
-        signed_call = api_call.sign(credentials=self.signing_key)
+        batch = _active_batch.get()
+        if batch is not None and batch.api is self:
+            return batch.add(api_call, cache_result=cache_result)
+
+        result = self._send_call(api_call)
+        result = self._unwrap_result(result, cache_result)
+        # we update the api when we create objects that change it
+        self.update_api(result)
+        return result
+
+    def _send_call(self, api_call: SyftAPICall | SyftAPIBatchCall) -> Any:
+        signed_call = api_call.sign(
+            credentials=self.signing_key,
+            flat=supports_flat_serde(self.communication_protocol),
+        )
         if self.connection is not None:
-            signed_result = self.connection.make_call(signed_call)
+            signed_result = self.connection.make_call(
+                signed_call, communication_protocol=self.communication_protocol
+            )
         else:
             return SyftError(message="API connection is None")
 
-        result = debox_signed_syftapicall_response(signed_result=signed_result)
+        return debox_signed_syftapicall_response(signed_result=signed_result)
 
+    def _unwrap_result(self, result: Any, cache_result: bool = True) -> Any:
         if isinstance(result, CachedSyftObject):
             if result.error_msg is not None:
                 if cache_result:
@@ -875,8 +1110,6 @@ class SyftAPI(SyftObject):
                 result = result.ok()
             else:
                 result = result.err()
-        # we update the api when we create objects that change it
-        self.update_api(result)
         return result
 
     def update_api(self, api_call_result: Any) -> None:
@@ -18,8 +18,6 @@ from pydantic import field_validator
 import requests
 from requests import Response
 from requests import Session
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry  # type: ignore[import-untyped]
 from typing_extensions import Self
 
 # relative
@@ -33,6 +31,7 @@ from ..node.credentials import UserLoginCredentials
 from ..protocol.data_protocol import DataProtocol
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..protocol.data_protocol import supports_flat_serde
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
@@ -58,9 +57,12 @@ from .api import APIModule
 from .api import APIRegistry
 from .api import SignedSyftAPICall
 from .api import SyftAPI
+from .api import SyftAPIBatch
 from .api import SyftAPICall
 from .api import debox_signed_syftapicall_response
 from .connection import NodeConnection
+from .connection import compress_payload
+from .connection import make_http_session
 from .protocol import SyftProtocol
 
 if TYPE_CHECKING:
@@ -136,6 +138,9 @@ class HTTPConnection(NodeConnection):
     proxy_target_uid: UID | None = None
     routes: type[Routes] = Routes
     session_cache: Session | None = None
+    # (url, verify key, protocol) -> (ETag, serialized API) of the last /api response
+    __api_cache__: dict[tuple[str, str, str], tuple[str, bytes]] = {}
+    __api_cache_max_size__: int = 64
 
     @field_validator("url", mode="before")
     @classmethod
@@ -163,20 +168,27 @@ class HTTPConnection(NodeConnection):
     @property
     def session(self) -> Session:
         if self.session_cache is None:
-            session = requests.Session()
-            retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            self.session_cache = session
+            self.session_cache = make_http_session()
         return self.session_cache
 
-    def _make_get(self, path: str, params: dict | None = None) -> bytes:
+    def _make_get(
+        self, path: str, params: dict | None = None, headers: dict | None = None
+    ) -> bytes:
+        return self._make_get_response(path, params=params, headers=headers).content
+
+    def _make_get_response(
+        self, path: str, params: dict | None = None, headers: dict | None = None
+    ) -> Response:
+        """Like _make_get, but returns the response. A 304 is returned too when
+        the request has an If-None-Match header."""
         url = self.url.with_path(path)
         response = self.session.get(
-            str(url), verify=verify_tls(), proxies={}, params=params
+            str(url), verify=verify_tls(), proxies={}, params=params, headers=headers
         )
-        if response.status_code != 200:
+        not_modified = response.status_code == 304 and "If-None-Match" in (
+            headers or {}
+        )
+        if response.status_code != 200 and not not_modified:
             raise requests.ConnectionError(
                 f"Failed to fetch {url}. Response returned with code {response.status_code}"
             )
@@ -184,7 +196,7 @@ class HTTPConnection(NodeConnection):
         # upgrade to tls if available
         self.url = upgrade_tls(self.url, response)
 
-        return response.content
+        return response
 
     def _make_post(
         self,
@@ -241,7 +253,7 @@ class HTTPConnection(NodeConnection):
                 credentials=credentials,
             )
         else:
-            content = self._make_get(self.routes.ROUTE_API.value, params=params)
+            content = self._get_api_content(params=params)
             obj = _deserialize(content, from_bytes=True)
         obj.connection = self
         obj.signing_key = credentials
@@ -250,6 +262,28 @@ class HTTPConnection(NodeConnection):
             obj.node_uid = self.proxy_target_uid
         return cast(SyftAPI, obj)
 
+    def _get_api_content(self, params: dict) -> bytes:
+        """Download the API, unless the node answers that it has not changed."""
+        url = self.url.with_path(self.routes.ROUTE_API.value)
+        key = (str(url), params["verify_key"], str(params["communication_protocol"]))
+        cached = self.__api_cache__.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else {}
+        response = self._make_get_response(
+            self.routes.ROUTE_API.value, params=params, headers=headers
+        )
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            if (
+                key not in self.__api_cache__
+                and len(self.__api_cache__) >= self.__api_cache_max_size__
+            ):
+                self.__api_cache__.clear()
+            self.__api_cache__[key] = (etag, response.content)
+        return response.content
+
     def login(
         self,
         email: str,
@@ -283,11 +317,24 @@ class HTTPConnection(NodeConnection):
             response = _deserialize(response, from_bytes=True)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
-        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
-        response = requests.post(  # nosec
-            url=str(self.api_url),
-            data=msg_bytes,
+    def make_call(
+        self,
+        signed_call: SignedSyftAPICall,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> Any | SyftError:
+        # the node answers in the same wire format it received
+        msg_bytes: bytes = _serialize(
+            obj=signed_call,
+            to_bytes=True,
+            flat=supports_flat_serde(communication_protocol),
+        )
+        data, headers = compress_payload(msg_bytes)
+        response = self.session.post(
+            str(self.api_url),
+            data=data,
+            headers=headers,
+            verify=verify_tls(),
+            proxies={},
         )
 
         if response.status_code != 200:
@@ -430,7 +477,11 @@ class PythonConnection(NodeConnection):
             response = method(context=service_context, new_user=new_user)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
+    def make_call(
+        self,
+        signed_call: SignedSyftAPICall,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> Any | SyftError:
         return self.node.handle_api_call(signed_call)
 
     def __repr__(self) -> str:
@@ -645,6 +696,10 @@ class SyftClient:
             self._fetch_api(self.credentials)
         return cast(SyftAPI, self._api)  # we are sure self._api is not None after fetch
 
+    def batch(self, parallel: bool = False) -> SyftAPIBatch:
+        """Queue the api calls made in a `with` block and send them as one call."""
+        return self.api.batch(parallel=parallel)
+
     def guest(self) -> Self:
         return self.__class__(
             connection=self.connection,
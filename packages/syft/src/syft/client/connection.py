@@ -1,9 +1,64 @@
 # stdlib
+import gzip
+import os
+import threading
 from typing import Any
 
+# third party
+import requests
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
 # relative
 from ..types.syft_object import SYFT_OBJECT_VERSION_2
 from ..types.syft_object import SyftObject
+from ..util.util import str_to_bool
+
+# connections kept open per host, calls beyond this wait for a free connection
+HTTP_POOL_SIZE = int(os.getenv("SYFT_HTTP_POOL_SIZE", "10"))
+# retries of failed connects and idempotent requests, with exponential backoff
+HTTP_MAX_RETRIES = int(os.getenv("SYFT_HTTP_MAX_RETRIES", "3"))
+HTTP_RETRY_BACKOFF_FACTOR = float(os.getenv("SYFT_HTTP_RETRY_BACKOFF_FACTOR", "0.5"))
+# gzip api call payloads, worth it on slow links to remote nodes
+HTTP_COMPRESSION = str_to_bool(os.getenv("SYFT_HTTP_COMPRESSION", "False"))
+HTTP_COMPRESSION_MIN_SIZE = 1024
+
+_http_session: Session | None = None
+_http_session_lock = threading.Lock()
+
+
+def make_http_session(
+    pool_size: int = HTTP_POOL_SIZE,
+    max_retries: int = HTTP_MAX_RETRIES,
+    backoff_factor: float = HTTP_RETRY_BACKOFF_FACTOR,
+) -> Session:
+    """Session that keeps its connections alive and reuses them between requests."""
+    session = requests.Session()
+    retry = Retry(total=max_retries, backoff_factor=backoff_factor)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session() -> Session:
+    """Session shared by the requests that are not made through a connection."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = make_http_session()
+    return _http_session
+
+
+def compress_payload(data: bytes) -> tuple[bytes, dict[str, str]]:
+    """Gzip a request body if compression is enabled, with the headers to send it."""
+    if not HTTP_COMPRESSION or len(data) < HTTP_COMPRESSION_MIN_SIZE:
+        return data, {}
+    return gzip.compress(data, compresslevel=1), {"Content-Encoding": "gzip"}
 
 
 class NodeConnection(SyftObject):
@@ -4,6 +4,7 @@ from __future__ import annotations
 # stdlib
 from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -29,6 +30,7 @@ from ..abstract_node import NodeSideType
 from ..abstract_node import NodeType
 from ..client.api import SignedSyftAPICall
 from ..client.api import SyftAPI
+from ..client.api import SyftAPIBatchCall
 from ..client.api import SyftAPICall
 from ..client.api import SyftAPIData
 from ..client.api import debox_signed_syftapicall_response
@@ -36,6 +38,8 @@ from ..client.client import SyftClient
 from ..exceptions.exception import PySyftException
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..protocol.data_protocol import supports_flat_serde
+from ..serde.serialize import _serialize as serialize
 from ..service.action.action_object import Action
 from ..service.action.action_object import ActionObject
 from ..service.action.action_service import ActionService
@@ -79,6 +83,7 @@ from ..service.queue.queue_service import QueueService
 from ..service.queue.queue_stash import ActionQueueItem
 from ..service.queue.queue_stash import QueueItem
 from ..service.queue.queue_stash import QueueStash
+from ..service.queue.queue_stash import Status
 from ..service.queue.zmq_queue import QueueConfig
 from ..service.queue.zmq_queue import ZMQClientConfig
 from ..service.queue.zmq_queue import ZMQQueueConfig
@@ -141,6 +146,9 @@ NODE_TYPE = "NODE_TYPE"
 NODE_NAME = "NODE_NAME"
 NODE_SIDE_TYPE = "NODE_SIDE_TYPE"
 
+# calls of a parallel batch that run at once
+API_BATCH_MAX_WORKERS = int(os.getenv("SYFT_API_BATCH_MAX_WORKERS", "8"))
+
 DEFAULT_ROOT_EMAIL = "DEFAULT_ROOT_EMAIL"
 DEFAULT_ROOT_USERNAME = "DEFAULT_ROOT_USERNAME"
 DEFAULT_ROOT_PASSWORD = "DEFAULT_ROOT_PASSWORD"  # nosec
@@ -279,6 +287,44 @@ class AuthNodeContextRegistry:
         return cls.__node_context_registry__.get(key)
 
 
+class NodeAPICache:
+    """Serialized SyftAPI with its ETag per node, user, role and protocol.
+
+    The API of a user is built from the registered services, the user code the
+    user can see and the custom api endpoints, so the whole cache of a node is
+    dropped whenever user code or endpoints change.
+    """
+
+    __api_cache__: dict[UID, dict[tuple, tuple[str, bytes]]] = {}
+    __versions__: dict[UID, int] = {}
+    __max_size__: int = 1024
+
+    @classmethod
+    def get(cls, node_uid: UID, key: tuple) -> tuple[str, bytes] | None:
+        return cls.__api_cache__.get(node_uid, {}).get(key)
+
+    @classmethod
+    def version(cls, node_uid: UID) -> int:
+        return cls.__versions__.get(node_uid, 0)
+
+    @classmethod
+    def set(
+        cls, node_uid: UID, key: tuple, value: tuple[str, bytes], version: int
+    ) -> None:
+        # the API changed while it was built, so it may be stale
+        if version != cls.version(node_uid):
+            return
+        node_cache = cls.__api_cache__.setdefault(node_uid, {})
+        if len(node_cache) >= cls.__max_size__:
+            node_cache.clear()
+        node_cache[key] = value
+
+    @classmethod
+    def invalidate(cls, node_uid: UID) -> None:
+        cls.__versions__[node_uid] = cls.version(node_uid) + 1
+        cls.__api_cache__.pop(node_uid, None)
+
+
 @instrument
 class Node(AbstractNode):
     signing_key: SyftSigningKey | None
@@ -307,6 +353,7 @@ class Node(AbstractNode):
         n_consumers: int = 0,
         create_producer: bool = False,
         thread_workers: bool = False,
+        warm_workers: bool = False,
         node_side_type: str | NodeSideType = NodeSideType.HIGH_SIDE,
         enable_warnings: bool = False,
         dev_mode: bool = False,
@@ -332,6 +379,11 @@ class Node(AbstractNode):
         self.node_side_type = NodeSideType(node_side_type)
         self.client_cache: dict = {}
         self.peer_client_cache: dict = {}
+        # settings and metadata are cached until the settings are written again
+        self._settings: NodeSettingsV2 | None = None
+        self._metadata: NodeMetadataV3 | None = None
+        self._metadata_bytes: bytes | None = None
+        self._settings_version = 0
 
         if isinstance(node_type, str):
             node_type = NodeType(node_type)
@@ -354,6 +406,7 @@ class Node(AbstractNode):
             n_consumers=n_consumers,
             create_producer=create_producer,
             thread_workers=thread_workers,
+            warm_workers=warm_workers,
             queue_port=queue_port,
             queue_config=queue_config,
         )
@@ -376,6 +429,7 @@ class Node(AbstractNode):
 
         # construct services only after init stores
         self._construct_services()
+        UserServiceConfigRegistry.build_all()
 
         create_admin_new(  # nosec B106
             name=root_username,
@@ -473,6 +527,7 @@ class Node(AbstractNode):
         thread_workers: bool,
         queue_port: int | None,
         queue_config: QueueConfig | None,
+        warm_workers: bool = False,
     ) -> QueueConfig:
         if queue_config:
             queue_config_ = queue_config
@@ -486,6 +541,7 @@ class Node(AbstractNode):
                     n_consumers=n_consumers,
                 ),
                 thread_workers=thread_workers,
+                warm_workers=warm_workers,
             )
         else:
             queue_config_ = ZMQQueueConfig()
@@ -574,6 +630,7 @@ class Node(AbstractNode):
         enable_warnings: bool = False,
         n_consumers: int = 0,
         thread_workers: bool = False,
+        warm_workers: bool = False,
         create_producer: bool = False,
         queue_port: int | None = None,
         dev_mode: bool = False,
@@ -601,6 +658,7 @@ class Node(AbstractNode):
             queue_port=queue_port,
             n_consumers=n_consumers,
             thread_workers=thread_workers,
+            warm_workers=warm_workers,
             create_producer=create_producer,
             dev_mode=dev_mode,
             migrate=migrate,
@@ -942,8 +1000,27 @@ class Node(AbstractNode):
         if rootdir.exists():
             shutil.rmtree(rootdir, ignore_errors=True)
 
+    def clear_settings_cache(self) -> None:
+        self._settings_version += 1
+        self._settings = None
+        self._metadata = None
+        self._metadata_bytes = None
+
+    def _cached_settings_value(self, attr: str, load: Callable[[], Any]) -> Any:
+        value = getattr(self, attr)
+        if value is None:
+            version = self._settings_version
+            value = load()
+            # the settings were written while loading, so the value may be stale
+            if version == self._settings_version:
+                setattr(self, attr, value)
+        return value
+
     @property
     def settings(self) -> NodeSettingsV2:
+        return self._cached_settings_value("_settings", self._load_settings)
+
+    def _load_settings(self) -> NodeSettingsV2:
         settings_stash = SettingsStash(store=self.document_store)
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
@@ -954,6 +1031,15 @@ class Node(AbstractNode):
 
     @property
     def metadata(self) -> NodeMetadataV3:
+        return self._cached_settings_value("_metadata", self._load_metadata)
+
+    @property
+    def metadata_bytes(self) -> bytes:
+        return self._cached_settings_value(
+            "_metadata_bytes", lambda: serialize(self.metadata, to_bytes=True)
+        )
+
+    def _load_metadata(self) -> NodeMetadataV3:
         name = ""
         organization = ""
         description = ""
@@ -1121,8 +1207,9 @@ class Node(AbstractNode):
         result = self.handle_api_call_with_unsigned_result(
             api_call, job_id=job_id, check_call_location=check_call_location
         )
-        # Sign the result
-        signed_result = SyftAPIData(data=result).sign(self.signing_key)
+        # Sign the result, answering in the wire format the call was made in
+        flat = isinstance(api_call, SignedSyftAPICall) and api_call.is_flat_serde
+        signed_result = SyftAPIData(data=result).sign(self.signing_key, flat=flat)
 
         return signed_result
 
@@ -1143,21 +1230,60 @@ class Node(AbstractNode):
         if api_call.message.node_uid != self.id and check_call_location:
             return self.forward_message(api_call=api_call)
 
-        if api_call.message.path == "queue":
+        if isinstance(api_call.message, SyftAPIBatchCall):
+            return self.handle_api_batch_call(
+                credentials=api_call.credentials,
+                batch_call=api_call.message,
+                job_id=job_id,
+            )
+
+        return self.handle_verified_api_call(
+            credentials=api_call.credentials, api_call=api_call.message, job_id=job_id
+        )
+
+    def handle_api_batch_call(
+        self,
+        credentials: SyftVerifyKey,
+        batch_call: SyftAPIBatchCall,
+        job_id: UID | None = None,
+    ) -> list[Result | QueueItem | SyftObject | SyftError]:
+        """Run the calls of a signed batch in order, with a result per call."""
+
+        def handle(
+            api_call: SyftAPICall,
+        ) -> Result | QueueItem | SyftObject | SyftError:
+            if api_call.node_uid != self.id:
+                return SyftError(
+                    message=f"Batched calls can't be forwarded to {api_call.node_uid}"
+                )
+            return self.handle_verified_api_call(
+                credentials=credentials, api_call=api_call, job_id=job_id
+            )
+
+        if batch_call.parallel and len(batch_call.calls) > 1:
+            max_workers = min(len(batch_call.calls), API_BATCH_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(handle, batch_call.calls))
+        return [handle(api_call) for api_call in batch_call.calls]
+
+    def handle_verified_api_call(
+        self,
+        credentials: SyftVerifyKey,
+        api_call: SyftAPICall,
+        job_id: UID | None = None,
+    ) -> Result | QueueItem | SyftObject | SyftError:
+        if api_call.path == "queue":
             return self.resolve_future(
-                credentials=api_call.credentials, uid=api_call.message.kwargs["uid"]
+                credentials=credentials, uid=api_call.kwargs["uid"]
             )
 
-        if api_call.message.path == "metadata":
+        if api_call.path == "metadata":
             return self.metadata
 
         result = None
-        is_blocking = api_call.message.blocking
+        is_blocking = api_call.blocking
 
         if is_blocking or self.is_subprocess:
-            credentials: SyftVerifyKey = api_call.credentials
-            api_call = api_call.message
-
             role = self.get_role_for_credentials(credentials=credentials)
             context = AuthedServiceContext(
                 node=self, credentials=credentials, role=role, job_id=job_id
@@ -1188,7 +1314,7 @@ class Node(AbstractNode):
                     message=f"Exception calling {api_call.path}. {traceback.format_exc()}"
                 )
         else:
-            return self.add_api_call_to_queue(api_call)
+            return self.add_api_call_to_queue(api_call, credentials=credentials)
         return result
 
     def add_action_to_queue(
@@ -1296,6 +1422,12 @@ class Node(AbstractNode):
         result = log_service.add(context, log_id, queue_item.job_id)
         if isinstance(result, SyftError):
             return result
+
+        # dispatch right away instead of waiting for the producer to scan the stash
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is not None and queue_item.status == Status.CREATED:
+            for producer in queue_manager.producers.values():
+                producer.notify(queue_item)
         return job
 
     def _get_existing_user_code_jobs(
@@ -1315,13 +1447,19 @@ class Node(AbstractNode):
         return user_code_service.is_execution_on_owned_args(api_call.kwargs, context)
 
     def add_api_call_to_queue(
-        self, api_call: SyftAPICall, parent_job_id: UID | None = None
+        self,
+        api_call: SyftAPICall | SignedSyftAPICall,
+        parent_job_id: UID | None = None,
+        credentials: SyftVerifyKey | None = None,
     ) -> Job | SyftError:
         unsigned_call = api_call
         if isinstance(api_call, SignedSyftAPICall):
             unsigned_call = api_call.message
+            credentials = api_call.credentials
+
+        if credentials is None:
+            return SyftError(message="Queued api calls need credentials")
 
-        credentials = api_call.credentials
         context = AuthedServiceContext(
             node=self,
             credentials=credentials,
@@ -1364,7 +1502,7 @@ class Node(AbstractNode):
                     )
 
             return self.add_action_to_queue(
-                action, api_call.credentials, parent_job_id=parent_job_id
+                action, credentials, parent_job_id=parent_job_id
             )
 
         else:
@@ -1378,7 +1516,7 @@ class Node(AbstractNode):
             queue_item = QueueItem(
                 id=UID(),
                 node_uid=self.id,
-                syft_client_verify_key=api_call.credentials,
+                syft_client_verify_key=credentials,
                 syft_node_location=self.id,
                 job_id=UID(),
                 worker_settings=worker_settings,
@@ -1390,7 +1528,7 @@ class Node(AbstractNode):
             )
             return self.add_queueitem_to_queue(
                 queue_item,
-                api_call.credentials,
+                credentials,
                 action=None,
                 parent_job_id=parent_job_id,
             )
@@ -1424,6 +1562,31 @@ class Node(AbstractNode):
             communication_protocol=communication_protocol,
         )
 
+    def get_api_bytes(
+        self,
+        for_user: SyftVerifyKey | None = None,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> tuple[str, bytes]:
+        """Serialized API of a user and its ETag, cached until the API changes."""
+        role = self.get_role_for_credentials(credentials=for_user)
+        key = (for_user, role, str(communication_protocol))
+        cached = NodeAPICache.get(self.id, key)
+        if cached is not None:
+            return cached
+
+        version = NodeAPICache.version(self.id)
+        api_bytes = serialize(
+            self.get_api(for_user, communication_protocol),
+            to_bytes=True,
+            flat=supports_flat_serde(communication_protocol),
+        )
+        etag = f'"{hashlib.sha256(api_bytes).hexdigest()}"'
+        NodeAPICache.set(self.id, key, (etag, api_bytes), version)
+        return etag, api_bytes
+
+    def clear_api_cache(self) -> None:
+        NodeAPICache.invalidate(self.id)
+
     def get_method_with_context(
         self, function: Callable, context: NodeServiceContext
     ) -> Callable:
@@ -1464,6 +1627,7 @@ class Node(AbstractNode):
                 result = settings_stash.set(
                     credentials=self.signing_key.verify_key, settings=new_settings
                 )
+                self.clear_settings_cache()
                 if result.is_ok():
                     return result.ok()
                 return None
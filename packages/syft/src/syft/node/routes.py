@@ -1,7 +1,8 @@
 # stdlib
-
-# stdlib
+import gzip
+import os
 from typing import Annotated
+import zlib
 
 # third party
 from fastapi import APIRouter
@@ -17,6 +18,7 @@ from pydantic import ValidationError
 from ..abstract_node import AbstractNode
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..serde.deserialize import _deserialize as deserialize
+from ..serde.recursive_flat import is_flat_serde
 from ..serde.serialize import _serialize as serialize
 from ..service.context import NodeServiceContext
 from ..service.context import UnauthedServiceContext
@@ -30,6 +32,31 @@ from .credentials import SyftVerifyKey
 from .credentials import UserLoginCredentials
 from .worker import Worker
 
+# largest size a gzip compressed api call may decompress to
+MAX_API_CALL_SIZE = int(os.getenv("SYFT_MAX_API_CALL_SIZE", "1073741824"))
+
+
+class APICallTooLarge(Exception):
+    pass
+
+
+def decompress_api_call(data: bytes, max_size: int) -> bytes:
+    """Gunzips a request body without decompressing more than `max_size` bytes.
+
+    Raises APICallTooLarge past `max_size` and zlib.error if data isn't a
+    complete gzip stream.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decompressed = decompressor.decompress(data, max_size)
+    if decompressor.unconsumed_tail:
+        raise APICallTooLarge(f"api call is larger than {max_size} bytes")
+    decompressed += decompressor.flush()
+    if len(decompressed) > max_size:
+        raise APICallTooLarge(f"api call is larger than {max_size} bytes")
+    if not decompressor.eof:
+        raise zlib.error("incomplete gzip stream")
+    return decompressed
+
 
 def make_routes(worker: Worker) -> APIRouter:
     if TRACE_MODE:
@@ -68,20 +95,24 @@ def make_routes(worker: Worker) -> APIRouter:
 
     @router.get("/metadata_capnp")
     def syft_metadata_capnp() -> Response:
-        result = worker.metadata
         return Response(
-            serialize(result, to_bytes=True),
+            worker.metadata_bytes,
             media_type="application/octet-stream",
         )
 
     def handle_syft_new_api(
-        user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
+        user_verify_key: SyftVerifyKey,
+        communication_protocol: PROTOCOL_TYPE,
+        if_none_match: str | None = None,
     ) -> Response:
+        etag, api_bytes = worker.get_api_bytes(user_verify_key, communication_protocol)
+        # the client already has this API
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
+            api_bytes,
             media_type="application/octet-stream",
+            headers={"ETag": etag},
         )
 
     # get the SyftAPI object
@@ -90,22 +121,43 @@ def make_routes(worker: Worker) -> APIRouter:
         request: Request, verify_key: str, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
+        if_none_match = request.headers.get("If-None-Match")
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api.__module__).start_as_current_span(
                 syft_new_api.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_syft_new_api(user_verify_key, communication_protocol)
+                return handle_syft_new_api(
+                    user_verify_key, communication_protocol, if_none_match
+                )
         else:
-            return handle_syft_new_api(user_verify_key, communication_protocol)
+            return handle_syft_new_api(
+                user_verify_key, communication_protocol, if_none_match
+            )
 
-    def handle_new_api_call(data: bytes) -> Response:
+    def handle_new_api_call(data: bytes, compressed: bool = False) -> Response:
+        if compressed:
+            # checked before the signature, so the size has to be bounded here
+            try:
+                data = decompress_api_call(data, MAX_API_CALL_SIZE)
+            except APICallTooLarge as e:
+                return Response(str(e), status_code=413)
+            except zlib.error as e:
+                return Response(f"invalid gzip body: {e}", status_code=400)
         obj_msg = deserialize(blob=data, from_bytes=True)
         result = worker.handle_api_call(api_call=obj_msg)
+        # only clients that negotiated the flat wire format send it
+        content = serialize(result, to_bytes=True, flat=is_flat_serde(data))
+        # clients that compress their calls also accept compressed results
+        headers = {}
+        if compressed:
+            content = gzip.compress(content, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
         return Response(
-            serialize(result, to_bytes=True),
+            content,
             media_type="application/octet-stream",
+            headers=headers,
         )
 
     # make a request to the SyftAPI
@@ -113,15 +165,16 @@ def make_routes(worker: Worker) -> APIRouter:
     def syft_new_api_call(
         request: Request, data: Annotated[bytes, Depends(get_body)]
     ) -> Response:
+        compressed = request.headers.get("Content-Encoding") == "gzip"
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api_call.__module__).start_as_current_span(
                 syft_new_api_call.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_new_api_call(data)
+                return handle_new_api_call(data, compressed)
         else:
-            return handle_new_api_call(data)
+            return handle_new_api_call(data, compressed)
 
     def handle_login(email: str, password: str, node: AbstractNode) -> Response:
         try:
@@ -32,6 +32,11 @@ from ..util.util import get_dev_mode
 PROTOCOL_STATE_FILENAME = "protocol_version.json"
 PROTOCOL_TYPE = str | int
 
+# first protocol release whose nodes understand the flat serde wire format
+FLAT_SERDE_MIN_PROTOCOL = 5
+# first protocol release whose nodes accept a SyftAPIBatchCall
+BATCH_API_CALL_MIN_PROTOCOL = 5
+
 
 def natural_key(key: PROTOCOL_TYPE) -> list[int | str | Any]:
     """Define key for natural ordering of strings."""
@@ -533,6 +538,25 @@ def check_or_stage_protocol() -> Result[SyftSuccess, SyftError]:
     return data_protocol.check_or_stage_protocol()
 
 
+def _protocol_at_least(protocol: PROTOCOL_TYPE | None, min_protocol: int) -> bool:
+    if protocol is None:
+        return False
+    if protocol == "dev":
+        return True
+    return int(protocol) >= min_protocol
+
+
+def supports_flat_serde(protocol: PROTOCOL_TYPE | None) -> bool:
+    """Whether both sides of a connection negotiated on `protocol` can use the
+    flat single message serde wire format."""
+    return _protocol_at_least(protocol, FLAT_SERDE_MIN_PROTOCOL)
+
+
+def supports_batch_api_call(protocol: PROTOCOL_TYPE | None) -> bool:
+    """Whether a node negotiated on `protocol` can handle a SyftAPIBatchCall."""
+    return _protocol_at_least(protocol, BATCH_API_CALL_MIN_PROTOCOL)
+
+
 def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
     """Debox the argument based on whether it is iterable or single entity."""
     constructor = None
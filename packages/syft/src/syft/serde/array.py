@@ -37,6 +37,12 @@ recursive_serde_register(
     np.ndarray, serialize=numpy_serialize, deserialize=numpy_deserialize
 )
 
+# memory mapped arrays, e.g. read from on disk blob storage, are sent as their
+# data and come back as regular arrays
+recursive_serde_register(
+    np.memmap, serialize=numpy_serialize, deserialize=numpy_deserialize
+)
+
 recursive_serde_register(
     np._globals._NoValueType,
 )
@@ -9,8 +9,12 @@ import pyarrow as pa
 from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
 from .deserialize import _deserialize
+from .recursive_flat import is_writing_flat
 from .serialize import _serialize
 
+# codecs the Arrow IPC format can compress record batches with
+IPC_COMPRESSION_CODECS = (ApacheArrowCompression.LZ4, ApacheArrowCompression.ZSTD)
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
     original_dtype = obj.dtype
@@ -33,7 +37,8 @@ def arrow_deserialize(
     numpy_bytes: bytes, decompressed_size: int, dtype: str
 ) -> np.ndarray:
     original_dtype = np.dtype(dtype)
-    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
+    compressed = flags.APACHE_ARROW_COMPRESSION is not ApacheArrowCompression.NONE
+    if not compressed:
         reader = pa.BufferReader(numpy_bytes)
         numpy_bytes = reader.read_buffer()
     else:
@@ -46,6 +51,10 @@ def arrow_deserialize(
     result = pa.ipc.read_tensor(numpy_bytes)
     np_array = result.to_numpy()
     np_array.setflags(write=True)
+    # a decompressed buffer is only referenced by this array, so it can be
+    # handed out as is, uncompressed ones still point into the caller's bytes
+    if compressed and np_array.dtype == original_dtype:
+        return np_array
     return np_array.astype(original_dtype)
 
 
@@ -72,7 +81,7 @@ def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
         final_string = chars.decode("utf-8")
         last_offset = offset
         output_list.append(final_string)
-    return np.array(output_list).reshape(shape)
+    return np.array(output_list, dtype=np.str_).reshape(shape)
 
 
 def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
@@ -109,9 +118,66 @@ def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
     return cast(bytes, _serialize(output_array, to_bytes=True))
 
 
+def arraytoarrowutf8(string_list: str | np.ndarray) -> bytes:
+    """Encodes string NumpyArray as an Arrow LargeStringArray.
+
+    The utf-8 data and the offsets are written as they are, in a single IPC
+    record batch whose schema metadata keeps the numpy dtype and shape. The
+    batch is compressed if APACHE_ARROW_COMPRESSION is a codec IPC supports.
+    Only used inside flat messages, which older peers can't read anyway.
+
+    Args:
+        string_list (np.ndarray): NumpyArray to be encoded
+
+    Returns:
+        bytes: serialized Arrow IPC stream
+    """
+    string_array = np.asarray(string_list)
+    metadata = {
+        "dtype": string_array.dtype.str,
+        "shape": ",".join(str(dim) for dim in string_array.shape),
+    }
+    # numpy unicode arrays only convert to 32 bit offsets, widen them afterwards
+    column = pa.array(string_array.reshape(-1), type=pa.string()).cast(
+        pa.large_string()
+    )
+    batch = pa.record_batch([column], names=["values"], metadata=metadata)
+    compression = flags.APACHE_ARROW_COMPRESSION
+    options = pa.ipc.IpcWriteOptions(
+        compression=(
+            compression.value if compression in IPC_COMPRESSION_CODECS else None
+        )
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema, options=options) as writer:
+        writer.write_batch(batch)
+
+    return cast(bytes, _serialize(sink.getvalue().to_pybytes(), to_bytes=True))
+
+
+def arrowutf8toarray(buf: bytes) -> np.ndarray:
+    """Decodes an Arrow LargeStringArray to string numpy array.
+
+    Args:
+        buf (bytes): Arrow IPC stream written by arraytoarrowutf8
+
+    Returns:
+        np.ndarray: decoded NumpyArray.
+    """
+    batch = pa.ipc.open_stream(buf).read_next_batch()
+    metadata = batch.schema.metadata
+    dtype = np.dtype(metadata[b"dtype"].decode())
+    shape_str = metadata[b"shape"].decode()
+    shape = tuple(int(dim) for dim in shape_str.split(",")) if shape_str else ()
+    values = batch.column(0).to_numpy(zero_copy_only=False)
+    return values.astype(dtype).reshape(shape)
+
+
 def numpy_serialize(obj: np.ndarray) -> bytes:
     if obj.dtype.type != np.str_:
         return arrow_serialize(obj)
+    elif is_writing_flat():
+        return arraytoarrowutf8(obj)
     else:
         return arraytonumpyutf8(obj)
 
@@ -120,6 +186,8 @@ def numpy_deserialize(buf: bytes) -> np.ndarray:
     deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
         return arrow_deserialize(*deser)
+    elif isinstance(deser, bytes):
+        return arrowutf8toarray(deser)
     elif isinstance(deser, np.ndarray):
         return numpyutf8toarray(deser)
     else:
@@ -13,9 +13,13 @@ def _deserialize(
     # relative
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
+    from .recursive_flat import is_flat_serde
+    from .recursive_flat import rs_flat_bytes2object
+    from .stream import is_stream_serde
+    from .stream import rs_stream_bytes2object
 
     if (
-        (from_bytes and not isinstance(blob, bytes))
+        (from_bytes and not isinstance(blob, bytes | bytearray | memoryview))
         or (
             from_proto
             and not from_bytes
@@ -26,6 +30,10 @@ def _deserialize(
         raise TypeError("Wrong deserialization format.")
 
     if from_bytes:
+        if is_flat_serde(blob):
+            return rs_flat_bytes2object(blob)
+        if is_stream_serde(blob):
+            return rs_stream_bytes2object(blob)
         return rs_bytes2object(blob)
 
     if from_proto:
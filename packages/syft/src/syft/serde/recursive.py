@@ -20,6 +20,9 @@ from .capnp import get_capnp_schema
 
 TYPE_BANK = {}
 
+# sentinel for attributes missing on an object being serialized
+_MISSING = object()
+
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 
@@ -173,75 +176,184 @@ def chunk_bytes(
         data_lst[idx] = data[START_INDEX:END_INDEX]
 
 
-def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
+def combine_bytes(capnp_list: list[bytes]) -> bytes | bytearray:
+    # the common case is a single chunk, which we can hand to the nested decoder
+    # directly instead of copying it into a new bytes object
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+
+    # preallocate the full buffer once and move the chunks into it, which avoids
+    # the quadratic copying of repeated `bytes +=` concatenation
+    chunks = list(capnp_list)
+    bytes_value = bytearray(sum(len(chunk) for chunk in chunks))
+    view = memoryview(bytes_value)
+    offset = 0
+    for chunk in chunks:
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    view.release()
     return bytes_value
 
 
-def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+class SerdePlan:
+    """Serde metadata compiled once per TYPE_BANK entry.
+
+    `rs_object2proto` and `rs_proto2object` would otherwise redo the attribute
+    set arithmetic, sorting, override lookups and class resolution for every
+    object they (de)serialize.
+    """
+
+    def __init__(self, fqn: str, serde_attributes: tuple) -> None:
+        (
+            nonrecursive,
+            serialize,
+            deserialize,
+            attribute_list,
+            exclude_attrs_list,
+            serde_overrides,
+            hash_exclude_attrs,
+            cls,
+            attribute_types,
+            version,
+        ) = serde_attributes
+
+        self.fqn = fqn
+        self.serde_attributes = serde_attributes
+        self.nonrecursive = nonrecursive
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.exclude_attrs = set(exclude_attrs_list)
+        self.serde_overrides = serde_overrides
+        self.hash_exclude_attrs = hash_exclude_attrs
+        self.cls = cls
+
+        # attribute_list is None when we serialize whatever is in __dict__
+        self.fields: list[tuple[str, tuple | None]] | None = None
+        if attribute_list is not None:
+            self.fields = self.compile_fields(attribute_list)
+
+        # syft.user classes can be reloaded by the CODE_RELOADER at any time so
+        # we only cache the resolved class for everything else
+        self.cache_class_type = "syft.user" not in fqn
+        self.class_type: type | None = None
+
+    def compile_fields(
+        self, attribute_list: Any, exclude: set[str] | None = None
+    ) -> list[tuple[str, tuple | None]]:
+        exclude = self.exclude_attrs if exclude is None else exclude
+        return [
+            (attr_name, self.serde_overrides.get(attr_name, None))
+            for attr_name in sorted(set(attribute_list) - exclude)
+        ]
+
+    def fields_for(self, obj: Any, for_hashing: bool) -> list[tuple[str, tuple | None]]:
+        if not for_hashing and self.fields is not None:
+            return self.fields
+
+        # relative
+        from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+        attribute_list = (
+            obj.__dict__.keys()
+            if self.serde_attributes[3] is None
+            else self.serde_attributes[3]
+        )
+        exclude = self.exclude_attrs
+        if for_hashing:
+            # __hash_exclude_attrs__ can be mutated after registration so the
+            # hashing field list is not cached
+            exclude = exclude.union(self.hash_exclude_attrs, DYNAMIC_SYFT_ATTRIBUTES)
+        return self.compile_fields(attribute_list, exclude=exclude)
+
+    def resolve_class(self) -> type | Any:
+        if self.class_type is not None:
+            return self.class_type
+
+        class_type = _resolve_class_type(self.fqn)
+        if class_type == type(None):
+            # yes this looks stupid but it works and the opposite breaks
+            class_type = self.cls
+
+        if self.cache_class_type:
+            self.class_type = class_type
+        return class_type
+
+
+SERDE_PLANS: dict[str, SerdePlan] = {}
+
+
+def get_serde_plan(fqn: str) -> SerdePlan:
+    serde_attributes = TYPE_BANK.get(fqn, None)
+    if serde_attributes is None:
+        raise Exception(f"{fqn} not in TYPE_BANK")
+
+    # compiled lazily on first use, and recompiled whenever the TYPE_BANK entry
+    # is replaced (re-registration, code reloading or patching in tests)
+    plan = SERDE_PLANS.get(fqn, None)
+    if plan is None or plan.serde_attributes is not serde_attributes:
+        plan = SerdePlan(fqn, serde_attributes)
+        SERDE_PLANS[fqn] = plan
+    return plan
+
+
+def _resolve_class_type(fqn: str) -> type | Any:
+    # clean this mess, Tudor
+    module_parts = fqn.split(".")
+    klass = module_parts.pop()
+    class_type: type | Any = type(None)
 
+    if klass != "NoneType":
+        try:
+            class_type = index_syft_by_module_name(fqn)  # type: ignore[assignment,unused-ignore]
+        except Exception:  # nosec
+            try:
+                class_type = getattr(sys.modules[".".join(module_parts)], klass)
+            except Exception:  # nosec
+                if "syft.user" in fqn:
+                    # relative
+                    from ..node.node import CODE_RELOADER
+
+                    for _, load_user_code in CODE_RELOADER.items():
+                        load_user_code()
+                try:
+                    class_type = getattr(sys.modules[".".join(module_parts)], klass)
+                except Exception:  # nosec
+                    pass
+
+    return class_type
+
+
+def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
     is_type = False
     if isinstance(self, type):
         is_type = True
 
     msg = recursive_scheme.new_message()
     fqn = get_fully_qualified_name(self)
-    if fqn not in TYPE_BANK:
-        # third party
-        raise Exception(f"{fqn} not in TYPE_BANK")
+    plan = get_serde_plan(fqn)
 
     msg.fullyQualifiedName = fqn
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    ) = TYPE_BANK[fqn]
 
-    if nonrecursive or is_type:
-        if serialize is None:
+    if plan.nonrecursive or is_type:
+        if plan.serialize is None:
             raise Exception(
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
-        chunk_bytes(serialize(self), "nonrecursiveBlob", msg)
+        chunk_bytes(plan.serialize(self), "nonrecursiveBlob", msg)
         return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
-
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
+    fields = plan.fields_for(self, for_hashing)
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+    msg.init("fieldsName", len(fields))
+    msg.init("fieldsData", len(fields))
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    for idx, (attr_name, transforms) in enumerate(fields):
+        field_obj = getattr(self, attr_name, _MISSING)
+        if field_obj is _MISSING:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
-
         if transforms is not None:
             field_obj = transforms[0](field_obj)
 
@@ -255,7 +367,7 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
     return msg
 
 
-def rs_bytes2object(blob: bytes) -> Any:
+def rs_bytes2object(blob: bytes | bytearray | memoryview) -> Any:
     MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
     with recursive_scheme.from_bytes(
@@ -268,73 +380,38 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
     # relative
     from .deserialize import _deserialize
 
-    # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
-    klass = module_parts.pop()
-    class_type: type | Any = type(None)
-
-    if klass != "NoneType":
-        try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore[assignment,unused-ignore]
-        except Exception:  # nosec
-            try:
-                class_type = getattr(sys.modules[".".join(module_parts)], klass)
-            except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
-                    # relative
-                    from ..node.node import CODE_RELOADER
-
-                    for _, load_user_code in CODE_RELOADER.items():
-                        load_user_code()
-                try:
-                    class_type = getattr(sys.modules[".".join(module_parts)], klass)
-                except Exception:  # nosec
-                    pass
-
-    if proto.fullyQualifiedName not in TYPE_BANK:
-        raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
-
-    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
-    # module name space in sub-processes or threads even though they are loaded on start
-    # its possible that the uvicorn awsgi server is preloading a bunch of threads
-    # however simply getting the class from the TYPE_BANK doesn't always work and
-    # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    ) = TYPE_BANK[proto.fullyQualifiedName]
-
-    if class_type == type(None):
-        # yes this looks stupid but it works and the opposite breaks
-        class_type = cls
+    fqn = proto.fullyQualifiedName
+    plan = get_serde_plan(fqn)
 
-    if nonrecursive:
-        if deserialize is None:
+    if plan.nonrecursive:
+        if plan.deserialize is None:
             raise Exception(
                 f"Cant serialize {type(proto)} nonrecursive without serialize."
             )
 
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
+        return plan.deserialize(combine_bytes(proto.nonrecursiveBlob))
 
     kwargs = {}
 
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
         if attr_name != "":
             attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
+            kwargs[attr_name] = _deserialize(attr_bytes, from_bytes=True)
+
+    return rs_kwargs2object(plan, kwargs)
+
+
+def rs_kwargs2object(plan: SerdePlan, kwargs: dict[str, Any]) -> Any:
+    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
+    # module name space in sub-processes or threads even though they are loaded on start
+    # its possible that the uvicorn awsgi server is preloading a bunch of threads
+    # however simply getting the class from the TYPE_BANK doesn't always work and
+    # causes some errors so it seems like we want to get the local one where possible
+    class_type = plan.resolve_class()
 
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
-            kwargs[attr_name] = attr_value
+    for attr_name, transforms in plan.serde_overrides.items():
+        if attr_name in kwargs:
+            kwargs[attr_name] = transforms[1](kwargs[attr_name])
 
     if hasattr(class_type, "serde_constructor"):
         return class_type.serde_constructor(kwargs)
@@ -345,7 +422,7 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         # if we skip the __new__ flow of BaseModel we get the error
         # AttributeError: object has no attribute '__fields_set__'
 
-        if "syft.user" in proto.fullyQualifiedName:
+        if "syft.user" in plan.fqn:
             # weird issues with pydantic and ForwardRef on user classes being inited
             # with custom state args / kwargs
             obj = class_type()
@@ -0,0 +1,139 @@
+# stdlib
+from collections import OrderedDict
+from contextvars import ContextVar
+import types
+from typing import Any
+
+# third party
+from capnp.lib.capnp import _DynamicStructBuilder
+
+# relative
+from ..util.util import get_fully_qualified_name
+from .capnp import get_capnp_schema
+from .recursive import _MISSING
+from .recursive import chunk_bytes
+from .recursive import combine_bytes
+from .recursive import get_serde_plan
+from .recursive import rs_kwargs2object
+
+flat_scheme = get_capnp_schema("recursive_serde_flat.capnp").FlatSerde
+
+# Flat messages are prefixed with a header so they can be told apart from the
+# nested RecursiveSerde format. A regular capnp message starts with its segment
+# count as a little endian uint32, which can never be 0xffffffff. The last byte
+# is the flat format version, bump it together with recursive_serde_flat.capnp.
+FLAT_SERDE_VERSION = 1
+FLAT_SERDE_HEADER = b"\xff\xff\xff\xffFLT" + bytes([FLAT_SERDE_VERSION])
+
+# containers encoded natively as nested values instead of an opaque blob
+FLAT_SEQUENCE_TYPES = (list, tuple, set, frozenset)
+FLAT_MAPPING_TYPES = (dict, OrderedDict)
+
+MAX_TRAVERSAL_LIMIT = 2**64 - 1
+MAX_NESTING_LIMIT = 2**31 - 1
+
+# set while a flat message is written, so leaf serializers can use encodings
+# only readers of the flat format understand
+_writing_flat: ContextVar[bool] = ContextVar("_writing_flat", default=False)
+
+
+def is_writing_flat() -> bool:
+    return _writing_flat.get()
+
+
+def is_flat_serde(blob: bytes | bytearray | memoryview) -> bool:
+    return blob[: len(FLAT_SERDE_HEADER)] == FLAT_SERDE_HEADER
+
+
+def rs_object2flat(obj: Any, node: _DynamicStructBuilder) -> None:
+    fqn = get_fully_qualified_name(obj)
+    plan = get_serde_plan(fqn)
+    node.fullyQualifiedName = fqn
+
+    obj_type = type(obj)
+    if obj_type in FLAT_SEQUENCE_TYPES:
+        values = node.init("values", len(obj))
+        for idx, value in enumerate(obj):
+            rs_object2flat(value, values[idx])
+        return
+
+    if obj_type in FLAT_MAPPING_TYPES:
+        kv_pairs = node.init("kvPairs", len(obj))
+        for idx, (key, value) in enumerate(obj.items()):
+            rs_object2flat(key, kv_pairs[idx].init("key"))
+            rs_object2flat(value, kv_pairs[idx].init("value"))
+        return
+
+    if plan.nonrecursive or isinstance(obj, type):
+        if plan.serialize is None:
+            raise Exception(
+                f"Cant serialize {type(obj)} nonrecursive without serialize."
+            )
+        chunk_bytes(plan.serialize(obj), "nonrecursiveBlob", node)
+        return
+
+    field_values = []
+    for attr_name, transforms in plan.fields_for(obj, for_hashing=False):
+        field_obj = getattr(obj, attr_name, _MISSING)
+        if field_obj is _MISSING:
+            raise ValueError(
+                f"{attr_name} on {type(obj)} does not exist, serialization aborted!"
+            )
+
+        if transforms is not None:
+            field_obj = transforms[0](field_obj)
+
+        if isinstance(field_obj, types.FunctionType):
+            continue
+        field_values.append((attr_name, field_obj))
+
+    fields = node.init("fields", len(field_values))
+    for idx, (attr_name, field_obj) in enumerate(field_values):
+        fields[idx].name = attr_name
+        rs_object2flat(field_obj, fields[idx].init("value"))
+
+
+def rs_object2flat_bytes(obj: Any) -> bytes:
+    msg = flat_scheme.new_message()
+    token = _writing_flat.set(True)
+    try:
+        rs_object2flat(obj, msg)
+    finally:
+        _writing_flat.reset(token)
+    return FLAT_SERDE_HEADER + msg.to_bytes()
+
+
+def rs_flat2object(node: _DynamicStructBuilder) -> Any:
+    plan = get_serde_plan(node.fullyQualifiedName)
+    which = node.which()
+
+    if which == "values":
+        values = [rs_flat2object(value) for value in node.values]
+        return plan.cls(values)
+
+    if which == "kvPairs":
+        pairs = [
+            (rs_flat2object(kv_pair.key), rs_flat2object(kv_pair.value))
+            for kv_pair in node.kvPairs
+        ]
+        return plan.cls(pairs)
+
+    if which == "nonrecursiveBlob":
+        if plan.deserialize is None:
+            raise Exception(
+                f"Cant deserialize {node.fullyQualifiedName} nonrecursive without deserialize."
+            )
+        return plan.deserialize(combine_bytes(node.nonrecursiveBlob))
+
+    kwargs = {field.name: rs_flat2object(field.value) for field in node.fields}
+    return rs_kwargs2object(plan, kwargs)
+
+
+def rs_flat_bytes2object(blob: bytes | bytearray | memoryview) -> Any:
+    view = memoryview(blob)[len(FLAT_SERDE_HEADER) :]
+    with flat_scheme.from_bytes(
+        view,
+        traversal_limit_in_words=MAX_TRAVERSAL_LIMIT,
+        nesting_limit=MAX_NESTING_LIMIT,
+    ) as msg:
+        return rs_flat2object(msg)
@@ -203,7 +203,7 @@ recursive_serde_register(
     deserialize=lambda x: float.fromhex(x.decode()),
 )
 
-recursive_serde_register(bytes, serialize=lambda x: x, deserialize=lambda x: x)
+recursive_serde_register(bytes, serialize=lambda x: x, deserialize=bytes)
 
 recursive_serde_register(
     str, serialize=lambda x: x.encode(), deserialize=lambda x: x.decode()
@@ -7,9 +7,14 @@ def _serialize(
     to_proto: bool = True,
     to_bytes: bool = False,
     for_hashing: bool = False,
+    flat: bool = False,
 ) -> Any:
     # relative
     from .recursive import rs_object2proto
+    from .recursive_flat import rs_object2flat_bytes
+
+    if to_bytes and flat and not for_hashing:
+        return rs_object2flat_bytes(obj)
 
     proto = rs_object2proto(obj, for_hashing=for_hashing)
 
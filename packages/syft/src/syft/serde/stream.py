@@ -0,0 +1,343 @@
+# stdlib
+from collections.abc import Iterator
+from io import BytesIO
+from io import RawIOBase
+from pathlib import Path
+from typing import Any
+from typing import BinaryIO
+
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# relative
+from .deserialize import _deserialize
+from .serialize import _serialize
+
+# Streams are prefixed with a header so they can be told apart from the other
+# wire formats, see FLAT_SERDE_HEADER. The last byte is the stream version.
+STREAM_SERDE_VERSION = 1
+STREAM_SERDE_HEADER = b"\xff\xff\xff\xffSTM" + bytes([STREAM_SERDE_VERSION])
+
+# upper bound on the size of a single write / read against the file object
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024 * 1024
+
+FRAME_LENGTH_SIZE = 8
+
+STREAM_KIND_NUMPY = "numpy"
+STREAM_KIND_ARROW = "arrow"
+STREAM_KIND_DATAFRAME = "dataframe"
+STREAM_KIND_SERDE = "serde"
+
+
+def is_stream_serde(blob: bytes | bytearray | memoryview) -> bool:
+    return blob[: len(STREAM_SERDE_HEADER)] == STREAM_SERDE_HEADER
+
+
+def _frame(payload: bytes) -> Iterator[bytes]:
+    yield len(payload).to_bytes(FRAME_LENGTH_SIZE, "big")
+    yield payload
+
+
+def _read_exactly(fileobj: BinaryIO, size: int) -> bytes:
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise EOFError(f"Stream ended after {len(data)} of {size} bytes.")
+    return data
+
+
+def _read_frame(fileobj: BinaryIO) -> bytes:
+    size = int.from_bytes(_read_exactly(fileobj, FRAME_LENGTH_SIZE), "big")
+    return _read_exactly(fileobj, size)
+
+
+def _buffer_chunks(buffer: memoryview, chunk_size: int) -> Iterator[memoryview]:
+    for start in range(0, len(buffer), chunk_size):
+        yield buffer[start : start + chunk_size]
+
+
+def _read_buffer(fileobj: BinaryIO, buffer: memoryview, chunk_size: int) -> None:
+    readinto = getattr(fileobj, "readinto", None)
+    offset = 0
+    while offset < len(buffer):
+        view = buffer[offset : offset + chunk_size]
+        if readinto is not None:
+            read = readinto(view)
+        else:
+            data = fileobj.read(len(view))
+            read = len(data)
+            view[:read] = data
+        if not read:
+            raise EOFError(f"Stream ended after {offset} of {len(buffer)} bytes.")
+        offset += read
+
+
+def _is_raw_numpy(obj: Any) -> bool:
+    # object and structured dtypes can't be rebuilt from dtype.str and raw bytes
+    return type(obj) in (np.ndarray, np.memmap) and obj.dtype.kind not in "OV"
+
+
+def is_streamable(obj: Any) -> bool:
+    """Whether serialize_to_stream writes obj from its buffers, rather than
+    falling back to a single serialized frame."""
+    return _is_raw_numpy(obj) or isinstance(obj, pa.Table | pd.DataFrame)
+
+
+def _numpy_chunks(obj: np.ndarray, chunk_size: int) -> Iterator[bytes | memoryview]:
+    fortran_order = obj.flags.f_contiguous and not obj.flags.c_contiguous
+    # a transposed fortran array is C contiguous, so both are written as is,
+    # only strided views have to be copied first
+    array = obj.T if fortran_order else np.ascontiguousarray(obj)
+    metadata = (obj.dtype.str, obj.shape, fortran_order)
+    yield from _frame(_serialize(metadata, to_bytes=True))
+    buffer = memoryview(array.reshape(-1).view(np.uint8))
+    yield from _buffer_chunks(buffer, chunk_size)
+
+
+def _numpy_from_stream(fileobj: BinaryIO, chunk_size: int) -> np.ndarray:
+    dtype, shape, fortran_order = _deserialize(_read_frame(fileobj), from_bytes=True)
+    array = np.empty(shape[::-1] if fortran_order else shape, dtype=dtype)
+    _read_buffer(fileobj, memoryview(array.reshape(-1).view(np.uint8)), chunk_size)
+    return array.T if fortran_order else array
+
+
+class _ChunkSink:
+    """Collects what an Arrow IPC writer writes, to hand it out batch by batch."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self.chunks = self.chunks, []
+        yield from chunks
+
+
+def _record_batch_chunks(
+    schema: pa.Schema, batches: Iterator[pa.RecordBatch]
+) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema)
+    for batch in batches:
+        writer.write_batch(batch)
+        yield from sink.drain()
+    writer.close()
+    yield from sink.drain()
+
+
+def _rows_per_batch(num_rows: int, nbytes: int, chunk_size: int) -> int:
+    # size the record batches so that each IPC message stays around chunk_size
+    return max(1, chunk_size * num_rows // max(nbytes, 1))
+
+
+def _arrow_chunks(table: pa.Table, chunk_size: int) -> Iterator[bytes]:
+    rows = _rows_per_batch(table.num_rows, table.nbytes, chunk_size)
+    return _record_batch_chunks(table.schema, iter(table.to_batches(rows)))
+
+
+def _dataframe_chunks(df: pd.DataFrame, chunk_size: int) -> Iterator[bytes]:
+    # convert the frame a slice at a time, so only one batch is ever copied
+    schema = pa.Schema.from_pandas(df)
+    nbytes = int(df.memory_usage(index=False).sum())
+    rows = _rows_per_batch(len(df), nbytes, chunk_size)
+    batches = (
+        pa.RecordBatch.from_pandas(df.iloc[start : start + rows], schema=schema)
+        for start in range(0, len(df), rows)
+    )
+    return _record_batch_chunks(schema, batches)
+
+
+def _arrow_from_stream(fileobj: BinaryIO | pa.NativeFile) -> pa.Table:
+    # native files (e.g. memory maps) are read zero copy
+    if not isinstance(fileobj, pa.NativeFile):
+        fileobj = pa.PythonFile(fileobj, mode="r")
+    with pa.ipc.open_stream(fileobj) as reader:
+        return reader.read_all()
+
+
+def iter_stream(
+    obj: Any, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+) -> Iterator[bytes | memoryview]:
+    """Yield the bytes serialize_to_stream writes for obj, in pieces of at
+    most chunk_size bytes. numpy pieces are views of the array buffer."""
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    yield STREAM_SERDE_HEADER
+
+    if _is_raw_numpy(obj):
+        yield from _frame(STREAM_KIND_NUMPY.encode())
+        yield from _numpy_chunks(obj, chunk_size)
+    elif isinstance(obj, pa.Table):
+        yield from _frame(STREAM_KIND_ARROW.encode())
+        yield from _arrow_chunks(obj, chunk_size)
+    elif isinstance(obj, pd.DataFrame):
+        yield from _frame(STREAM_KIND_DATAFRAME.encode())
+        yield from _dataframe_chunks(obj, chunk_size)
+    else:
+        yield from _frame(STREAM_KIND_SERDE.encode())
+        payload = _serialize(obj, to_bytes=True)
+        yield len(payload).to_bytes(FRAME_LENGTH_SIZE, "big")
+        yield from _buffer_chunks(memoryview(payload), chunk_size)
+
+
+def serialize_to_stream(
+    obj: Any,
+    fileobj: BinaryIO,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> None:
+    """Serialize obj into a writable binary file object.
+
+    numpy arrays are written straight from their buffer and pyarrow Tables /
+    pandas DataFrames one record batch at a time, in pieces of at most
+    chunk_size bytes, so the payload is never duplicated in memory. Everything
+    else is serialized as usual and written as a single frame.
+    """
+    for chunk in iter_stream(obj, chunk_size=chunk_size):
+        fileobj.write(chunk)
+
+
+def stream_size(obj: Any, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> int:
+    """Number of bytes serialize_to_stream writes for obj, without keeping
+    them. Free for numpy arrays, one encoding pass for everything else."""
+    return sum(len(chunk) for chunk in iter_stream(obj, chunk_size=chunk_size))
+
+
+class StreamReader(RawIOBase):
+    """Readable file object producing the stream of obj as it is read.
+
+    Lets consumers that pull from a file, like blob deposits, upload an object
+    without it ever being serialized into memory as a whole.
+    """
+
+    def __init__(self, obj: Any, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE):
+        super().__init__()
+        self._chunks = iter_stream(obj, chunk_size=chunk_size)
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        # fill the whole buffer, short reads are only returned at the end
+        while filled < len(view):
+            if not len(self._chunk):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._chunk = memoryview(chunk).cast("B")
+                continue
+            size = min(len(view) - filled, len(self._chunk))
+            view[filled : filled + size] = self._chunk[:size]
+            self._chunk = self._chunk[size:]
+            filled += size
+        return filled
+
+
+def deserialize_from_stream(
+    fileobj: BinaryIO,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Any:
+    """Read an object written by serialize_to_stream from a readable binary
+    file object, filling numpy buffers in place chunk by chunk."""
+    header = _read_exactly(fileobj, len(STREAM_SERDE_HEADER))
+    if not is_stream_serde(header):
+        raise ValueError("Not a syft serde stream.")
+
+    kind = _read_frame(fileobj).decode()
+    if kind == STREAM_KIND_NUMPY:
+        return _numpy_from_stream(fileobj, chunk_size)
+    if kind == STREAM_KIND_ARROW:
+        return _arrow_from_stream(fileobj)
+    if kind == STREAM_KIND_DATAFRAME:
+        return _arrow_from_stream(fileobj).to_pandas()
+    if kind == STREAM_KIND_SERDE:
+        size = int.from_bytes(_read_exactly(fileobj, FRAME_LENGTH_SIZE), "big")
+        payload = bytearray(size)
+        _read_buffer(fileobj, memoryview(payload), chunk_size)
+        return _deserialize(payload, from_bytes=True)
+    raise ValueError(f"Unknown serde stream kind: {kind}")
+
+
+def _read_stream_kind(fileobj: BinaryIO) -> str | None:
+    header = fileobj.read(len(STREAM_SERDE_HEADER))
+    if not is_stream_serde(header):
+        return None
+    return _read_frame(fileobj).decode()
+
+
+def _numpy_from_memory_map(path: Path, fileobj: BinaryIO) -> np.ndarray:
+    dtype, shape, fortran_order = _deserialize(_read_frame(fileobj), from_bytes=True)
+    if 0 in shape:
+        # an empty file region can't be mapped
+        return np.empty(shape, dtype=dtype)
+    # copy on write: pages stay shared with the file until they are modified,
+    # writes never reach the file
+    array = np.memmap(
+        path,
+        dtype=dtype,
+        mode="c",
+        offset=fileobj.tell(),
+        shape=shape[::-1] if fortran_order else shape,
+    )
+    return array.T if fortran_order else array
+
+
+def deserialize_from_file(path: str | Path, memory_map: bool = False) -> Any:
+    """Deserialize the contents of a file on disk.
+
+    With memory_map the file is mapped instead of read: numpy arrays written by
+    serialize_to_stream are returned as copy on write np.memmap views, pyarrow
+    Tables and DataFrames reference the pa.memory_map pages and are read-only,
+    so the payload is only loaded as it is accessed. Files in any other format
+    are deserialized from the mapping without reading them into a bytes object.
+    """
+    path = Path(path)
+    if not memory_map:
+        with open(path, "rb") as fileobj:
+            if _read_stream_kind(fileobj) is not None:
+                fileobj.seek(0)
+                return deserialize_from_stream(fileobj)
+        return _deserialize(path.read_bytes(), from_bytes=True)
+
+    with open(path, "rb") as fileobj:
+        kind = _read_stream_kind(fileobj)
+        if kind == STREAM_KIND_NUMPY:
+            return _numpy_from_memory_map(path, fileobj)
+        offset = fileobj.tell()
+
+    source = pa.memory_map(str(path))
+    if kind is None:
+        return _deserialize(memoryview(source.read_buffer()), from_bytes=True)
+
+    source.seek(offset)
+    if kind == STREAM_KIND_ARROW:
+        return _arrow_from_stream(source)
+    if kind == STREAM_KIND_DATAFRAME:
+        # split blocks keeps numeric columns as views of the mapping
+        return _arrow_from_stream(source).to_pandas(split_blocks=True)
+    if kind == STREAM_KIND_SERDE:
+        size = int.from_bytes(source.read(FRAME_LENGTH_SIZE), "big")
+        payload = source.read_buffer(size)
+        # capnp needs word aligned messages, the frame headers may shift them
+        if payload.address % 8:
+            return _deserialize(payload.to_pybytes(), from_bytes=True)
+        return _deserialize(memoryview(payload), from_bytes=True)
+    raise ValueError(f"Unknown serde stream kind: {kind}")
+
+
+def rs_stream_bytes2object(blob: bytes | bytearray | memoryview) -> Any:
+    return deserialize_from_stream(BytesIO(blob))
@@ -0,0 +1,240 @@
+# stdlib
+from collections import OrderedDict
+import os
+from pathlib import Path
+import sys
+import threading
+from typing import Any
+
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# relative
+from ...node.credentials import SyftVerifyKey
+from ...serde.deserialize import _deserialize as deserialize
+from ...serde.serialize import _serialize as serialize
+from ...serde.stream import deserialize_from_file
+from ...serde.stream import serialize_to_stream
+from ...types.uid import UID
+from ...util.logger import debug
+from .action_data_empty import ActionDataEmpty
+
+# byte budget of the memory tier, 0 disables the cache
+ACTION_DATA_CACHE_SIZE = int(os.getenv("SYFT_ACTION_DATA_CACHE_SIZE", "268435456"))
+# directory of the disk tier, data evicted from memory is kept there if set
+ACTION_DATA_CACHE_DIR = os.getenv("SYFT_ACTION_DATA_CACHE_DIR")
+ACTION_DATA_CACHE_DISK_SIZE = int(
+    os.getenv("SYFT_ACTION_DATA_CACHE_DISK_SIZE", "4294967296")
+)
+
+
+def data_size(data: Any, default: int | None = None) -> int:
+    """Bytes held in memory by data, `default` if they can't be counted."""
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, bytes | bytearray):
+        return len(data)
+    if isinstance(data, pd.DataFrame | pd.Series):
+        return int(data.memory_usage(deep=True).sum())
+    if isinstance(data, pa.Table | pa.Array | pa.ChunkedArray):
+        return data.nbytes
+    if default is not None:
+        return default
+    return sys.getsizeof(data)
+
+
+# values readers can't modify, shared as they are
+IMMUTABLE_TYPES = (
+    bytes,
+    str,
+    int,
+    float,
+    complex,
+    bool,
+    type(None),
+)
+
+
+def reader_copy(data: Any) -> Any:
+    """data as handed to a reader, which can't modify the cached value.
+    Mutable data is copied, data without a cheaper copy goes through serde
+    like it did from blob storage."""
+    if isinstance(data, IMMUTABLE_TYPES):
+        return data
+    if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+        # actions may modify arrays in place, read only ones, e.g. memory
+        # mapped, are only viewed
+        return data.copy() if data.flags.writeable else data.view()
+    if isinstance(data, pd.DataFrame | pd.Series):
+        return data.copy()
+    if isinstance(data, pa.Table | pa.Array | pa.ChunkedArray):
+        # arrow data is immutable
+        return data
+    return deserialize(serialize(data, to_bytes=True), from_bytes=True)
+
+
+CacheKey = tuple[UID, SyftVerifyKey | None]
+
+
+class ActionDataCache:
+    """LRU cache of the data of blob backed ActionObjects, by blob storage
+    entry id, evicting by byte budget.
+
+    Entries are cached per reader, so data read with one user's credentials
+    is never served to another user in the same process. Readers get the
+    cached values through `reader_copy`, so one ActionObject can't modify the
+    data of another. With a disk directory, data evicted from memory is
+    written there and read back on the next hit, until the disk budget
+    evicts it too.
+    """
+
+    def __init__(
+        self,
+        max_size: int = ACTION_DATA_CACHE_SIZE,
+        disk_dir: str | Path | None = ACTION_DATA_CACHE_DIR,
+        max_disk_size: int = ACTION_DATA_CACHE_DISK_SIZE,
+    ) -> None:
+        self.max_size = max_size
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.max_disk_size = max_disk_size
+        self._memory: OrderedDict[CacheKey, tuple[Any, int]] = OrderedDict()
+        self._disk: OrderedDict[CacheKey, int] = OrderedDict()
+        self._size = 0
+        self._disk_size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _disk_path(self, key: CacheKey) -> Path:
+        uid, credentials = key
+        return self.disk_dir / f"{uid.no_dash}_{credentials}"  # type: ignore[operator]
+
+    def get(self, uid: UID, credentials: SyftVerifyKey | None) -> Any:
+        """The cached data of the entry, ActionDataEmpty if it isn't cached."""
+        key = (uid, credentials)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                data = self._memory[key][0]
+                try:
+                    data = reader_copy(data)
+                except Exception as e:
+                    # data that can't be copied can't be shared safely
+                    debug(f"Failed to copy cached action data {uid}: {e}")
+                    self._discard(key)
+                    self.misses += 1
+                    return ActionDataEmpty()
+                self.hits += 1
+                return data
+            if key not in self._disk:
+                self.misses += 1
+                return ActionDataEmpty()
+            size = self._disk.pop(key)
+            self._disk_size -= size
+
+        path = self._disk_path(key)
+        try:
+            data = deserialize_from_file(path)
+        except Exception as e:
+            debug(f"Failed to read cached action data {uid}: {e}")
+            with self._lock:
+                self.misses += 1
+            return ActionDataEmpty()
+        finally:
+            path.unlink(missing_ok=True)
+
+        with self._lock:
+            self.disk_hits += 1
+        # promoted back to memory, the least recently used data spills over
+        self.put(uid, credentials, data, size)
+        return reader_copy(data)
+
+    def put(
+        self,
+        uid: UID,
+        credentials: SyftVerifyKey | None,
+        data: Any,
+        size: int | None = None,
+    ) -> None:
+        """Cache data, `size` is used if the bytes it holds can't be counted."""
+        if not self.enabled:
+            return
+        key = (uid, credentials)
+        size = data_size(data, size)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_size:
+                self._spill(key, data, size)
+                return
+            self._memory[key] = (data, size)
+            self._size += size
+            while self._size > self.max_size:
+                evicted_key, (evicted, evicted_size) = self._memory.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+                self._spill(evicted_key, evicted, evicted_size)
+
+    def _spill(self, key: CacheKey, data: Any, size: int) -> None:
+        if self.disk_dir is None or size > self.max_disk_size:
+            return
+        while self._disk and self._disk_size + size > self.max_disk_size:
+            evicted_key, evicted_size = self._disk.popitem(last=False)
+            self._disk_size -= evicted_size
+            self._disk_path(evicted_key).unlink(missing_ok=True)
+        path = self._disk_path(key)
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                serialize_to_stream(data, f)
+        except Exception as e:
+            debug(f"Failed to cache action data {key[0]} on disk: {e}")
+            path.unlink(missing_ok=True)
+            return
+        self._disk[key] = size
+        self._disk_size += size
+
+    def _discard(self, key: CacheKey) -> None:
+        if key in self._memory:
+            self._size -= self._memory.pop(key)[1]
+        if key in self._disk:
+            self._disk_size -= self._disk.pop(key)
+            self._disk_path(key).unlink(missing_ok=True)
+
+    def invalidate(self, uid: UID) -> None:
+        """Drop the data of the entry cached for any reader, once it is
+        deleted or replaced."""
+        with self._lock:
+            for key in list(self._memory) + list(self._disk):
+                if key[0] == uid:
+                    self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._memory) + list(self._disk):
+                self._discard(key)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self._size,
+                "disk_size": self._disk_size,
+                "entries": len(self._memory),
+                "disk_entries": len(self._disk),
+            }
+
+
+# shared by all the ActionObjects of the process
+ACTION_DATA_CACHE = ActionDataCache()
@@ -6,10 +6,8 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from enum import Enum
 import inspect
-from io import BytesIO
 from pathlib import Path
 import threading
-import time
 import traceback
 import types
 from typing import Any
@@ -32,8 +30,9 @@ from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
 from ...node.credentials import SyftVerifyKey
+from ...protocol.data_protocol import supports_flat_serde
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize as serialize
+from ...serde.stream import is_streamable
 from ...service.response import SyftError
 from ...store.linked_obj import LinkedObject
 from ...types.base import SyftBaseModel
@@ -50,6 +49,8 @@ from ...util.util import prompt_warning_message
 from ..context import AuthedServiceContext
 from ..response import SyftException
 from ..service import from_api_or_context
+from .action_data_cache import ACTION_DATA_CACHE
+from .action_data_cache import reader_copy
 from .action_data_empty import ActionDataEmpty
 from .action_data_empty import ActionDataLink
 from .action_data_empty import ObjectNotReady
@@ -718,10 +719,22 @@ class ActionObject(SyncableSyftObject):
     def reload_cache(self) -> SyftError | None:
         # If ActionDataEmpty then try to fetch it from store.
         if isinstance(self.syft_action_data_cache, ActionDataEmpty):
+            if self.syft_blob_storage_entry_id is not None:
+                # read before by an ActionObject of this process
+                cached = ACTION_DATA_CACHE.get(
+                    self.syft_blob_storage_entry_id, self.syft_client_verify_key
+                )
+                if not isinstance(cached, ActionDataEmpty):
+                    self.syft_action_data_cache = cached
+                    self.syft_action_data_type = type(cached)
+                    return None
+
             blob_storage_read_method = from_api_or_context(
                 func_or_path="blob_storage.read",
                 syft_node_location=self.syft_node_location,
                 syft_client_verify_key=self.syft_client_verify_key,
+                # on the node, on disk blobs can be memory mapped
+                node_method="BlobStorageService.read_on_node",
             )
 
             if blob_storage_read_method is not None:
@@ -736,12 +749,27 @@ class ActionObject(SyncableSyftObject):
                     return blob_retrieval_object
                 # relative
                 from ...store.blob_storage import BlobRetrieval
+                from ...types.blob_storage import BlobFile
 
                 if isinstance(blob_retrieval_object, SyftError):
                     return blob_retrieval_object
                 elif isinstance(blob_retrieval_object, BlobRetrieval):
                     # TODO: This change is temporary to for gateway to be compatible with the new blob storage
-                    self.syft_action_data_cache = blob_retrieval_object.read()
+                    # read() returns any deserialized object, not only SyftObjects
+                    data: Any = blob_retrieval_object.read()
+                    # BlobFiles are handles to the data, which they read themselves
+                    if ACTION_DATA_CACHE.enabled and not isinstance(
+                        data, SyftError | BlobFile
+                    ):
+                        ACTION_DATA_CACHE.put(
+                            self.syft_blob_storage_entry_id,
+                            self.syft_client_verify_key,
+                            data,
+                            size=blob_retrieval_object.file_size,
+                        )
+                        # the cached data is shared with the next readers
+                        data = reader_copy(data)
+                    self.syft_action_data_cache = data
                     self.syft_action_data_type = type(self.syft_action_data)
                     return None
                 else:
@@ -760,7 +788,9 @@ class ActionObject(SyncableSyftObject):
     def _save_to_blob_storage_(self, data: Any) -> SyftError | None:
         # relative
         from ...types.blob_storage import BlobFile
+        from ...types.blob_storage import BlobStorageEntry
         from ...types.blob_storage import CreateBlobStorageEntry
+        from ...types.blob_storage import SpooledBlob
 
         if not isinstance(data, ActionDataEmpty):
             if isinstance(data, BlobFile) and not data.uploaded:
@@ -769,10 +799,26 @@ class ActionObject(SyncableSyftObject):
                 )
                 data.upload_to_blobstorage_from_api(api)
             else:
-                storage_entry = CreateBlobStorageEntry.from_obj(data)
+                # only peers on a protocol with the newer wire formats can read
+                # streams, node side writes keep the format every client reads
+                api = APIRegistry.api_for(
+                    self.syft_node_location, self.syft_client_verify_key
+                )
+                stream = (
+                    api is not None
+                    and supports_flat_serde(api.communication_protocol)
+                    and is_streamable(data)
+                )
+                # serialized once, the size and checksum come from the same pass
+                spooled = SpooledBlob.from_obj(data, stream=stream)
+                storage_entry = CreateBlobStorageEntry.from_spooled(
+                    spooled, type_=type(data)
+                )
                 if self.syft_blob_storage_entry_id is not None:
                     # TODO: check if it already exists
                     storage_entry.id = self.syft_blob_storage_entry_id
+                    # the data read before from the entry is replaced
+                    ACTION_DATA_CACHE.invalidate(self.syft_blob_storage_entry_id)
                 allocate_method = from_api_or_context(
                     func_or_path="blob_storage.allocate",
                     syft_node_location=self.syft_node_location,
@@ -782,17 +828,23 @@ class ActionObject(SyncableSyftObject):
                     blob_deposit_object = allocate_method(storage_entry)
 
                     if isinstance(blob_deposit_object, SyftError):
+                        spooled.close()
                         return blob_deposit_object
 
-                    result = blob_deposit_object.write(
-                        BytesIO(serialize(data, to_bytes=True))
-                    )
-                    if isinstance(result, SyftError):
-                        return result
-                    self.syft_blob_storage_entry_id = (
-                        blob_deposit_object.blob_storage_entry_id
-                    )
+                    if isinstance(blob_deposit_object, BlobStorageEntry):
+                        # the same data is stored already, the entry is shared
+                        spooled.close()
+                        self.syft_blob_storage_entry_id = blob_deposit_object.id
+                    else:
+                        with spooled:
+                            result = blob_deposit_object.write(spooled.file)
+                        if isinstance(result, SyftError):
+                            return result
+                        self.syft_blob_storage_entry_id = (
+                            blob_deposit_object.blob_storage_entry_id
+                        )
                 else:
+                    spooled.close()
                     print("cannot save to blob storage")
 
             self.syft_action_data_type = type(data)
@@ -1357,6 +1409,7 @@ class ActionObject(SyncableSyftObject):
     def wait(self, timeout: int | None = None) -> ActionObject:
         # relative
         from ...client.api import APIRegistry
+        from ..job.job_stash import wait_until_resolved
 
         api = APIRegistry.api_for(
             node_uid=self.syft_node_location,
@@ -1367,13 +1420,23 @@ class ActionObject(SyncableSyftObject):
         else:
             obj_id = self.id
 
-        counter = 0
-        while api and not api.services.action.is_resolved(obj_id):
-            time.sleep(1)
-            if timeout is not None:
-                counter += 1
-                if counter > timeout:
-                    return SyftError(message="Reached Timeout!")
+        if api is None:
+            return self
+
+        def wait_for_object(wait_timeout: float) -> bool | SyftError:
+            return api.services.action.wait_for(obj_id, timeout=wait_timeout)
+
+        # nodes from before action.wait_for are polled
+        has_wait_for = getattr(api.services.action, "wait_for", None) is not None
+        resolved = wait_until_resolved(
+            wait_for=wait_for_object if has_wait_for else None,
+            is_resolved=lambda: api.services.action.is_resolved(obj_id),
+            timeout=timeout,
+        )
+        if isinstance(resolved, SyftError):
+            return resolved
+        if not resolved:
+            return SyftError(message="Reached Timeout!")
 
         return self
 
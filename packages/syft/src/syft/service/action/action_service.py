@@ -19,6 +19,9 @@ from ..blob_storage.service import BlobStorageService
 from ..code.user_code import UserCode
 from ..code.user_code import execute_byte_code
 from ..context import AuthedServiceContext
+from ..job.job_stash import JOB_RESULT_NOTIFIER
+from ..job.job_stash import JOB_WAIT_MAX_TIMEOUT_SEC
+from ..job.job_stash import JOB_WAIT_TIMEOUT_SEC
 from ..policy.policy import OutputPolicy
 from ..policy.policy import retrieve_from_db
 from ..response import SyftError
@@ -29,6 +32,7 @@ from ..service import TYPE_TO_SERVICE
 from ..service import UserLibConfigRegistry
 from ..service import service_method
 from ..user.user_roles import ADMIN_ROLE_LEVEL
+from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
 from ..user.user_roles import ServiceRole
 from .action_object import Action
@@ -166,6 +170,27 @@ class ActionService(AbstractService):
         # If it's not in the store or permission error, return the error
         return result
 
+    @service_method(
+        path="action.wait_for", name="wait_for", roles=DATA_SCIENTIST_ROLE_LEVEL
+    )
+    def wait_for(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        timeout: float = JOB_WAIT_TIMEOUT_SEC,
+    ) -> Result[Ok[bool], Err[str]]:
+        """Like is_resolved, but waits up to `timeout` seconds for the object to
+        be resolved by a job."""
+
+        def resolved() -> bool:
+            result = self.is_resolved(context, uid)
+            return result.is_err() or result.ok()
+
+        JOB_RESULT_NOTIFIER.wait_until(
+            resolved, timeout=min(timeout, JOB_WAIT_MAX_TIMEOUT_SEC)
+        )
+        return self.is_resolved(context, uid)
+
     @service_method(
         path="action.resolve_links", name="resolve_links", roles=GUEST_ROLE_LEVEL
     )
@@ -647,7 +672,7 @@ class ActionService(AbstractService):
                 )
             )
         else:
-            return execute_object(self, context, resolved_self, action)  # type:ignore[unreachable]
+            return execute_object(self, context, resolved_self, action)  # type: ignore[unreachable]
 
     @service_method(path="action.execute", name="execute", roles=GUEST_ROLE_LEVEL)
     def execute(
@@ -924,15 +949,15 @@ def execute_object(
                     private_obj=result_action_object_private,
                     mock_obj=result_action_object_mock,
                 )
-            elif twin_mode == twin_mode.PRIVATE:  # type:ignore
+            elif twin_mode == twin_mode.PRIVATE:  # type: ignore
                 # twin private path
-                private_args = filter_twin_args(args, twin_mode=twin_mode)  # type:ignore[unreachable]
+                private_args = filter_twin_args(args, twin_mode=twin_mode)  # type: ignore[unreachable]
                 private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 result = target_method(*private_args, **private_kwargs)
                 result_action_object = wrap_result(action.result_id, result)
-            elif twin_mode == twin_mode.MOCK:  # type:ignore
+            elif twin_mode == twin_mode.MOCK:  # type: ignore
                 # twin mock path
-                mock_args = filter_twin_args(args, twin_mode=twin_mode)  # type:ignore[unreachable]
+                mock_args = filter_twin_args(args, twin_mode=twin_mode)  # type: ignore[unreachable]
                 mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 target_method = getattr(unboxed_resolved_self, action.op, None)
                 result = target_method(*mock_args, **mock_kwargs)
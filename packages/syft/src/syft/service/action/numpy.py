@@ -108,6 +108,7 @@ class NumpyBoolObject(ActionObject, np.lib.mixins.NDArrayOperatorsMixin):
 
 np_array = np.array([1, 2, 3])
 action_types[type(np_array)] = NumpyArrayObject
+action_types[np.memmap] = NumpyArrayObject
 
 
 SUPPORTED_BOOL_TYPES = [np.bool_]
@@ -73,6 +73,7 @@ class APIService(AbstractService):
         result = self.stash.upsert(context.credentials, endpoint=new_endpoint)
         if result.is_err():
             return SyftError(message=result.err())
+        context.node.clear_api_cache()
 
         result = result.ok()
         action_obj = ActionObject.from_obj(
@@ -152,6 +153,7 @@ class APIService(AbstractService):
         result = self.stash.upsert(context.credentials, endpoint=endpoint)
         if result.is_err():
             return SyftError(message=result.err())
+        context.node.clear_api_cache()
 
         return SyftSuccess(message="Endpoint successfully updated.")
 
@@ -178,6 +180,7 @@ class APIService(AbstractService):
 
         if result.is_err():
             return SyftError(message=result.err())
+        context.node.clear_api_cache()
 
         return SyftSuccess(message="Endpoint successfully deleted.")
 
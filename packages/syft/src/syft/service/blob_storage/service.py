@@ -6,6 +6,7 @@ import requests
 
 # relative
 from ...serde.serializable import serializable
+from ...service.action.action_data_cache import ACTION_DATA_CACHE
 from ...service.action.action_object import ActionObject
 from ...store.blob_storage import BlobRetrieval
 from ...store.blob_storage.on_disk import OnDiskBlobDeposit
@@ -18,6 +19,7 @@ from ...types.blob_storage import BlobStorageEntry
 from ...types.blob_storage import BlobStorageMetadata
 from ...types.blob_storage import CreateBlobStorageEntry
 from ...types.blob_storage import SeaweedSecureFilePathLocation
+from ...types.blob_storage import file_checksum
 from ...types.uid import UID
 from ..context import AuthedServiceContext
 from ..response import SyftError
@@ -25,6 +27,7 @@ from ..response import SyftSuccess
 from ..service import AbstractService
 from ..service import TYPE_TO_SERVICE
 from ..service import service_method
+from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
 from .remote_profile import AzureRemoteProfile
 from .remote_profile import RemoteProfileStash
@@ -53,6 +56,26 @@ class BlobStorageService(AbstractService):
             return result.ok()
         return SyftError(message=result.err())
 
+    @service_method(path="blob_storage.get_storage_savings", name="get_storage_savings")
+    def get_storage_savings(
+        self, context: AuthedServiceContext
+    ) -> dict[str, int] | SyftError:
+        """Bytes stored in blob storage and bytes not stored thanks to
+        content addressed deduplication."""
+        result = self.stash.get_all(context.credentials)
+        if result.is_err():
+            return SyftError(message=result.err())
+
+        entries = result.ok()
+        return {
+            "entries": len(entries),
+            "references": sum(entry.ref_count for entry in entries),
+            "stored_bytes": sum(entry.file_size for entry in entries),
+            "saved_bytes": sum(
+                (entry.ref_count - 1) * entry.file_size for entry in entries
+            ),
+        }
+
     @service_method(path="blob_storage.mount_azure", name="mount_azure")
     def mount_azure(
         self,
@@ -191,6 +214,18 @@ class BlobStorageService(AbstractService):
     )
     def read(
         self, context: AuthedServiceContext, uid: UID
+    ) -> BlobRetrieval | SyftError:
+        return self._read(context, uid)
+
+    def read_on_node(
+        self, context: AuthedServiceContext, uid: UID
+    ) -> BlobRetrieval | SyftError:
+        """Read for code running on the node, the retrieval may memory map an
+        on disk file and can't be sent to clients."""
+        return self._read(context, uid, memory_map=True)
+
+    def _read(
+        self, context: AuthedServiceContext, uid: UID, memory_map: bool = False
     ) -> BlobRetrieval | SyftError:
         result = self.stash.get_by_uid(context.credentials, uid=uid)
         if result.is_ok():
@@ -202,7 +237,10 @@ class BlobStorageService(AbstractService):
 
             with context.node.blob_storage_client.connect() as conn:
                 res: BlobRetrieval = conn.read(
-                    obj.location, obj.type_, bucket_name=obj.bucket_name
+                    obj.location,
+                    obj.type_,
+                    bucket_name=obj.bucket_name,
+                    memory_map=memory_map,
                 )
                 res.syft_blob_storage_entry_id = uid
                 res.file_size = obj.file_size
@@ -216,7 +254,16 @@ class BlobStorageService(AbstractService):
     )
     def allocate(
         self, context: AuthedServiceContext, obj: CreateBlobStorageEntry
-    ) -> BlobDepositType | SyftError:
+    ) -> BlobDepositType | BlobStorageEntry | SyftError:
+        """Deposit to upload the data of `obj` to. If `obj` has a checksum and
+        the same data was uploaded before by the caller, an admin or a data
+        owner, that entry is returned instead and shared. The data is deleted
+        with the last reference."""
+        if obj.checksum is not None:
+            existing = self._get_uploaded_by_checksum(context, obj.checksum, obj)
+            if existing is not None:
+                return existing
+
         with context.node.blob_storage_client.connect() as conn:
             secure_location = conn.allocate(obj)
 
@@ -229,7 +276,9 @@ class BlobStorageService(AbstractService):
                 type_=obj.type_,
                 mimetype=obj.mimetype,
                 file_size=obj.file_size,
+                checksum=obj.checksum,
                 uploaded_by=context.credentials,
+                references={context.credentials: 1},
             )
             blob_deposit = conn.write(blob_storage_entry)
 
@@ -238,14 +287,60 @@ class BlobStorageService(AbstractService):
             return SyftError(message=f"{result.err()}")
         return blob_deposit
 
+    def _get_uploaded_by_checksum(
+        self,
+        context: AuthedServiceContext,
+        checksum: str,
+        obj: CreateBlobStorageEntry,
+    ) -> BlobStorageEntry | SyftError | None:
+        result = self.stash.get_by_checksum(context.credentials, checksum)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+
+        for entry in result.ok():
+            # the checksum of uploaded entries was verified by the node
+            if not entry.uploaded or entry.type_ is not obj.type_:
+                continue
+            if entry.id == obj.id:
+                # the same entry allocated again, not a new reference
+                return entry
+            if not self._is_shareable(context, entry):
+                continue
+            entry.references[context.credentials] = (
+                entry.references.get(context.credentials, 0) + 1
+            )
+            # reading the entry is enough to share it
+            result = self.stash.update(context.credentials, entry, has_permission=True)
+            if result.is_err():
+                return SyftError(message=f"{result.err()}")
+            return result.ok()
+        return None
+
+    def _is_shareable(
+        self, context: AuthedServiceContext, entry: BlobStorageEntry
+    ) -> bool:
+        # data uploaded by other users is only trusted from admins and data owners
+        if entry.uploaded_by == context.credentials:
+            return True
+        role = context.node.get_role_for_credentials(entry.uploaded_by)
+        return role in DATA_OWNER_ROLE_LEVEL
+
     @service_method(
         path="blob_storage.write_to_disk",
         name="write_to_disk",
         roles=GUEST_ROLE_LEVEL,
     )
     def write_to_disk(
-        self, context: AuthedServiceContext, uid: UID, data: bytes
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        data: bytes,
+        offset: int = 0,
+        complete: bool = True,
     ) -> SyftSuccess | SyftError:
+        """Write a chunk of the file at `offset`, the first chunk creates it.
+        Chunks go to a temporary file, which replaces the file once the
+        `complete` chunk is written and the checksum, if any, is verified."""
         result = self.stash.get_by_uid(
             credentials=context.credentials,
             uid=uid,
@@ -260,12 +355,123 @@ class BlobStorageService(AbstractService):
                 message=f"No blob storage entry exists for uid: {uid}, or you have no permissions to read it"
             )
 
+        # uploaded data is only replaced by a new entry, and only by its uploader
+        if obj.uploaded:
+            return SyftError(message=f"Blob storage entry {uid} is already uploaded")
+        if obj.uploaded_by != context.credentials:
+            return SyftError(
+                message=f"Blob storage entry {uid} can only be written by its uploader"
+            )
+
+        path = Path(obj.location.path)
+        upload_path = path.with_name(f"{path.name}.upload")
         try:
-            Path(obj.location.path).write_bytes(data)
-            return SyftSuccess(message="File successfully saved.")
+            with open(upload_path, "r+b" if offset else "wb") as f:
+                f.seek(offset)
+                f.write(data)
         except Exception as e:
             return SyftError(message=f"Failed to write object to disk: {e}")
 
+        if not complete:
+            return SyftSuccess(message="Chunk successfully saved.")
+        if obj.checksum is not None and file_checksum(upload_path) != obj.checksum:
+            upload_path.unlink()
+            return SyftError(
+                message=f"Checksum mismatch for blob storage entry: {uid}, the upload is corrupted"
+            )
+        try:
+            upload_path.replace(path)
+        except Exception as e:
+            return SyftError(message=f"Failed to write object to disk: {e}")
+
+        obj.uploaded = True
+        result = self.stash.update(credentials=context.credentials, obj=obj)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+        return SyftSuccess(message="File successfully saved.")
+
+    @service_method(
+        path="blob_storage.read_range",
+        name="read_range",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def read_range(
+        self, context: AuthedServiceContext, uid: UID, offset: int, length: int
+    ) -> bytes | SyftError:
+        result = self.stash.get_by_uid(context.credentials, uid=uid)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+
+        obj: BlobStorageEntry | None = result.ok()
+
+        if obj is None:
+            return SyftError(
+                message=f"No blob storage entry exists for uid: {uid}, or you have no permissions to read it"
+            )
+
+        try:
+            with context.node.blob_storage_client.connect() as conn:
+                return conn.read_range(obj.location, offset, length)
+        except Exception as e:
+            return SyftError(message=f"Failed to read from blob storage: {e}")
+
+    @service_method(
+        path="blob_storage.resume_upload",
+        name="resume_upload",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def resume_upload(
+        self, context: AuthedServiceContext, uid: UID
+    ) -> BlobDepositType | SyftError:
+        """Deposit to finish an interrupted upload, the parts that were
+        uploaded before are not uploaded again."""
+        result = self.stash.get_by_uid(context.credentials, uid=uid)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+
+        obj: BlobStorageEntry | None = result.ok()
+
+        if obj is None:
+            return SyftError(
+                message=f"No blob storage entry exists for uid: {uid}, or you have no permissions to read it"
+            )
+
+        with context.node.blob_storage_client.connect() as conn:
+            return conn.write(obj)
+
+    @service_method(
+        path="blob_storage.mark_part_complete",
+        name="mark_part_complete",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def mark_part_complete(
+        self, context: AuthedServiceContext, uid: UID, part_no: int, etag: str
+    ) -> SyftSuccess | SyftError:
+        result = self.stash.get_by_uid(context.credentials, uid=uid)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+
+        obj: BlobStorageEntry | None = result.ok()
+
+        if obj is None:
+            return SyftError(
+                message=f"No blob storage entry exists for uid: {uid}, or you have no permissions to read it"
+            )
+        # only SeaweedSecureFilePathLocation tracks the parts of an upload
+        uploaded_parts: dict[int, str] | None = getattr(
+            obj.location, "uploaded_parts", None
+        )
+        if uploaded_parts is None:
+            return SyftError(
+                message=f"Blob storage entry {uid} has no multipart upload"
+            )
+
+        uploaded_parts[part_no] = etag
+        result = self.stash.update(credentials=context.credentials, obj=obj)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+        return SyftSuccess(message=f"Part {part_no} of {uid} uploaded.")
+
     @service_method(
         path="blob_storage.mark_write_complete",
         name="mark_write_complete",
@@ -292,7 +498,24 @@ class BlobStorageService(AbstractService):
                 message=f"No blob storage entry exists for uid: {uid}, or you have no permissions to read it"
             )
 
+        with context.node.blob_storage_client.connect() as conn:
+            complete_result = conn.complete_multipart_upload(obj, etags)
+            if isinstance(complete_result, SyftError):
+                return complete_result
+            # the uploader's checksum is only trusted once the node computed it
+            if obj.checksum is not None:
+                try:
+                    checksum = conn.checksum(obj.location)
+                except Exception as e:
+                    return SyftError(message=f"Failed to verify the upload: {e}")
+                if checksum != obj.checksum:
+                    conn.delete(obj.location)
+                    return SyftError(
+                        message=f"Checksum mismatch for blob storage entry: {uid}, the upload is corrupted"
+                    )
+
         obj.no_lines = no_lines
+        obj.uploaded = True
         result = self.stash.update(
             credentials=context.credentials,
             obj=obj,
@@ -300,10 +523,7 @@ class BlobStorageService(AbstractService):
         if result.is_err():
             return SyftError(message=f"{result.err()}")
 
-        with context.node.blob_storage_client.connect() as conn:
-            result = conn.complete_multipart_upload(obj, etags)
-
-        return result
+        return complete_result
 
     @service_method(path="blob_storage.delete", name="delete")
     def delete(
@@ -318,6 +538,25 @@ class BlobStorageService(AbstractService):
                     message=f"No blob storage entry exists for uid: {uid}, or you have no permissions to read it"
                 )
 
+            if obj.references:
+                # shared by deduplicated allocations, only the caller's
+                # reference is dropped and the data stays with the others
+                if context.credentials not in obj.references:
+                    return SyftError(
+                        message=f"Blob storage entry {uid} is not referenced by you"
+                    )
+                obj.references[context.credentials] -= 1
+                if obj.references[context.credentials] == 0:
+                    del obj.references[context.credentials]
+
+            if obj.references:
+                update_result = self.stash.update(
+                    context.credentials, obj, has_permission=True
+                )
+                if update_result.is_err():
+                    return SyftError(message=f"{update_result.err()}")
+                return SyftSuccess(message="Blob storage entry dereferenced.")
+
             try:
                 with context.node.blob_storage_client.connect() as conn:
                     file_unlinked_result = conn.delete(obj.location)
@@ -326,6 +565,7 @@ class BlobStorageService(AbstractService):
 
             if isinstance(file_unlinked_result, SyftError):
                 return file_unlinked_result
+            ACTION_DATA_CACHE.invalidate(uid)
             blob_storage_entry_deleted = self.stash.delete(
                 context.credentials, UIDPartitionKey.with_obj(uid), has_permission=True
             )
@@ -1,10 +1,18 @@
+# third party
+from result import Result
+
 # relative
+from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...store.document_store import BaseUIDStoreStash
 from ...store.document_store import DocumentStore
+from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
+from ...store.document_store import QueryKeys
 from ...types.blob_storage import BlobStorageEntry
 
+ChecksumPartitionKey = PartitionKey(key="checksum", type_=str)
+
 
 @serializable()
 class BlobStorageStash(BaseUIDStoreStash):
@@ -15,3 +23,9 @@ class BlobStorageStash(BaseUIDStoreStash):
 
     def __init__(self, store: DocumentStore) -> None:
         super().__init__(store=store)
+
+    def get_by_checksum(
+        self, credentials: SyftVerifyKey, checksum: str
+    ) -> Result[list[BlobStorageEntry], str]:
+        qks = QueryKeys(qks=[ChecksumPartitionKey.with_obj(checksum)])
+        return self.query_all(credentials=credentials, qks=qks)
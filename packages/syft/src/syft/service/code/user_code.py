@@ -25,6 +25,7 @@ from typing import final
 
 # third party
 from IPython.display import display
+from loguru import logger
 from pydantic import field_validator
 from result import Err
 from typing_extensions import Self
@@ -61,6 +62,7 @@ from ..action.action_object import ActionObject
 from ..context import AuthedServiceContext
 from ..dataset.dataset import Asset
 from ..job.job_stash import Job
+from ..log.log_service import LogBuffer
 from ..output.output_service import ExecutionOutput
 from ..output.output_service import OutputService
 from ..policy.policy import CustomInputPolicy
@@ -1407,9 +1409,12 @@ def execute_byte_code(
             def __setattr__(self, __name: str, __value: Any) -> None:
                 raise Exception("Attempting to alter read-only value")
 
+        log_buffer = None
         if context.job is not None:
             job_id = context.job_id
             log_id = context.job.log_id
+            if context.node is not None:
+                log_buffer = LogBuffer(context=context, uid=log_id)
 
             def print(*args: Any, sep: str = " ", end: str = "\n") -> str | None:
                 def to_str(arg: Any) -> str:
@@ -1425,9 +1430,8 @@ def execute_byte_code(
 
                 new_args = [to_str(arg) for arg in args]
                 new_str = sep.join(new_args) + end
-                if context.node is not None:
-                    log_service = context.node.get_service("LogService")
-                    log_service.append(context=context, uid=log_id, new_str=new_str)
+                if log_buffer is not None:
+                    log_buffer.write(new_str)
                 time = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
                 return __builtin__.print(
                     f"{time} FUNCTION LOG ({job_id}):",
@@ -1489,6 +1493,15 @@ def execute_byte_code(
 
             result = Err(result_message)
 
+        if log_buffer is not None:
+            flushed = log_buffer.close()
+            if isinstance(flushed, SyftError):
+                logger.error(f"Failed to append the output of log {log_id}: {flushed}")
+            log_service = context.node.get_service("LogService")
+            compacted = log_service.compact(context=context, uid=log_id)
+            if isinstance(compacted, SyftError):
+                logger.error(f"Failed to compact log {log_id}: {compacted}")
+
         # reset print
         print = original_print
 
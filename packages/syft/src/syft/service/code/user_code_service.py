@@ -74,6 +74,8 @@ class UserCodeService(AbstractService):
             code = code.to(UserCode, context=context)  # type: ignore[unreachable]
 
         result = self.stash.set(context.credentials, code)
+        if result.is_ok():
+            context.node.clear_api_cache()
         return result
 
     @service_method(path="code.delete", name="delete", roles=ADMIN_ROLE_LEVEL)
@@ -84,6 +86,7 @@ class UserCodeService(AbstractService):
         result = self.stash.delete_by_uid(context.credentials, uid)
         if result.is_err():
             return SyftError(message=str(result.err()))
+        context.node.clear_api_cache()
         return SyftSuccess(message="User Code Deleted")
 
     @service_method(
@@ -166,6 +169,7 @@ class UserCodeService(AbstractService):
         result = self.stash.set(context.credentials, user_code)
         if result.is_err():
             return SyftError(message=str(result.err()))
+        context.node.clear_api_cache()
 
         # Create a code history
         code_history_service = context.node.get_service("codehistoryservice")
@@ -23,6 +23,9 @@ from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
+from .job_stash import JOB_RESULT_NOTIFIER
+from .job_stash import JOB_WAIT_MAX_TIMEOUT_SEC
+from .job_stash import JOB_WAIT_TIMEOUT_SEC
 from .job_stash import Job
 from .job_stash import JobStash
 from .job_stash import JobStatus
@@ -51,12 +54,45 @@ class JobService(AbstractService):
             res = res.ok()
             return res
 
+    @service_method(
+        path="job.wait_for",
+        name="wait_for",
+        roles=DATA_SCIENTIST_ROLE_LEVEL,
+    )
+    def wait_for(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        timeout: float = JOB_WAIT_TIMEOUT_SEC,
+    ) -> Job | SyftError:
+        """Returns the job once it is resolved, or unresolved after `timeout`
+        seconds."""
+
+        def job_resolved() -> bool:
+            res = self.stash.get_by_uid(context.credentials, uid=uid)
+            return res.is_err() or res.ok() is None or res.ok().resolved
+
+        JOB_RESULT_NOTIFIER.wait_until(
+            job_resolved, timeout=min(timeout, JOB_WAIT_MAX_TIMEOUT_SEC)
+        )
+        job = self.get(context, uid)
+        if job is None:
+            return SyftError(message=f"Job {uid} not found")
+        return job
+
     @service_method(
         path="job.get_all",
         name="get_all",
     )
-    def get_all(self, context: AuthedServiceContext) -> list[Job] | SyftError:
-        res = self.stash.get_all(context.credentials)
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        page_size: int | None = 0,
+        page_index: int | None = 0,
+    ) -> list[Job] | SyftError:
+        res = self.stash.get_all(
+            context.credentials, page_size=page_size, page_index=page_index
+        )
         if res.is_err():
             return SyftError(message=res.err())
         else:
@@ -1,7 +1,10 @@
 # stdlib
+from collections.abc import Callable
 from datetime import datetime
 from datetime import timedelta
 from enum import Enum
+import threading
+import time
 from typing import Any
 
 # third party
@@ -46,6 +49,108 @@ from ..response import SyftNotReady
 from ..response import SyftSuccess
 from ..user.user import UserView
 
+# job.wait_for blocks for at most JOB_WAIT_MAX_TIMEOUT_SEC, and checks the job
+# every JOB_WAIT_POLL_INTERVAL_SEC for workers in other processes. At most
+# JOB_WAIT_MAX_WAITERS requests block at once, others return right away
+JOB_WAIT_MAX_TIMEOUT_SEC = 5.0
+JOB_WAIT_POLL_INTERVAL_SEC = 0.25
+JOB_WAIT_MAX_WAITERS = 32
+# clients wait JOB_WAIT_TIMEOUT_SEC per call, nodes without wait_for are polled
+# with a backoff doubling from JOB_WAIT_MIN_BACKOFF_SEC to JOB_WAIT_MAX_BACKOFF_SEC
+JOB_WAIT_TIMEOUT_SEC = 5.0
+JOB_WAIT_MIN_BACKOFF_SEC = 0.05
+JOB_WAIT_MAX_BACKOFF_SEC = 1.0
+
+
+class JobResultNotifier:
+    """Wakes up the threads waiting for a job whenever JobStash.set_result
+    stores one. Workers in other processes don't notify, so waiters still
+    check the job every JOB_WAIT_POLL_INTERVAL_SEC."""
+
+    def __init__(self, max_waiters: int = JOB_WAIT_MAX_WAITERS) -> None:
+        self.max_waiters = max_waiters
+        self._condition = threading.Condition()
+        self._count = 0
+        self._waiters = 0
+
+    @property
+    def waiters(self) -> int:
+        return self._waiters
+
+    def notify(self) -> None:
+        with self._condition:
+            self._count += 1
+            self._condition.notify_all()
+
+    def wait_until(self, done: Callable[[], bool], timeout: float) -> bool:
+        with self._condition:
+            if self._waiters >= self.max_waiters:
+                # every request thread could end up waiting here, check only once
+                return done()
+            self._waiters += 1
+        try:
+            return self._wait_until(done, timeout)
+        finally:
+            with self._condition:
+                self._waiters -= 1
+
+    def _wait_until(self, done: Callable[[], bool], timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                count = self._count
+            if done():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            def notified(count: int = count) -> bool:
+                return self._count != count
+
+            with self._condition:
+                self._condition.wait_for(
+                    notified, min(remaining, JOB_WAIT_POLL_INTERVAL_SEC)
+                )
+
+
+JOB_RESULT_NOTIFIER = JobResultNotifier()
+
+
+def wait_until_resolved(
+    wait_for: Callable[[float], bool | SyftError] | None,
+    is_resolved: Callable[[], bool],
+    timeout: float | None = None,
+) -> bool | SyftError:
+    """Blocks until resolved, returns False once `timeout` seconds passed.
+
+    `wait_for(timeout)` is a node endpoint blocking until resolved. Without it,
+    `is_resolved` is polled with exponential backoff.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    backoff = JOB_WAIT_MIN_BACKOFF_SEC
+    while True:
+        remaining = (
+            JOB_WAIT_TIMEOUT_SEC if deadline is None else deadline - time.monotonic()
+        )
+        if wait_for is not None:
+            call_timeout = max(0.0, min(remaining, JOB_WAIT_TIMEOUT_SEC))
+            started = time.monotonic()
+            resolved = wait_for(call_timeout)
+            if isinstance(resolved, SyftError) or resolved:
+                return resolved
+            # busy nodes return before the timeout, don't call them again at once
+            if time.monotonic() - started < call_timeout:
+                time.sleep(max(0.0, min(backoff, call_timeout)))
+                backoff = min(2 * backoff, JOB_WAIT_MAX_BACKOFF_SEC)
+        elif is_resolved():
+            return True
+        else:
+            time.sleep(max(0.0, min(backoff, remaining)))
+            backoff = min(2 * backoff, JOB_WAIT_MAX_BACKOFF_SEC)
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+
 
 @serializable()
 class JobStatus(str, Enum):
@@ -352,8 +457,14 @@ class Job(SyncableSyftObject):
         return api.services.log.get(self.log_id)
 
     def logs(
-        self, stdout: bool = True, stderr: bool = True, _print: bool = True
+        self,
+        stdout: bool = True,
+        stderr: bool = True,
+        _print: bool = True,
+        offset: int = 0,
     ) -> str | None:
+        """Output of the job, skipping the first `offset` characters of each log
+        to only tail what was written since an earlier call."""
         api = APIRegistry.api_for(
             node_uid=self.syft_node_location,
             user_verify_key=self.syft_client_verify_key,
@@ -365,7 +476,7 @@ class Job(SyncableSyftObject):
 
         results = []
         if stdout:
-            stdout_log = api.services.log.get_stdout(self.log_id)
+            stdout_log = api.services.log.get_stdout(self.log_id, offset=offset)
             if isinstance(stdout_log, SyftError):
                 results.append(f"Log {self.log_id} not available")
                 has_permissions = False
@@ -374,7 +485,7 @@ class Job(SyncableSyftObject):
 
         if stderr:
             try:
-                std_err_log = api.services.log.get_error(self.log_id)
+                std_err_log = api.services.log.get_error(self.log_id, offset=offset)
                 if isinstance(std_err_log, SyftError):
                     results.append(f"Error log {self.log_id} not available")
                     has_permissions = False
@@ -462,9 +573,6 @@ class Job(SyncableSyftObject):
     def wait(
         self, job_only: bool = False, timeout: int | None = None
     ) -> Any | SyftNotReady:
-        # stdlib
-        from time import sleep
-
         api = APIRegistry.api_for(
             node_uid=self.syft_node_location,
             user_verify_key=self.syft_client_verify_key,
@@ -479,30 +587,39 @@ class Job(SyncableSyftObject):
             raise ValueError(
                 f"Can't access Syft API. You must login to {self.syft_node_location}"
             )
-        print_warning = True
-        counter = 0
-        while True:
+
+        def wait_for_job(wait_timeout: float) -> bool | SyftError:
+            job = api.services.job.wait_for(self.id, timeout=wait_timeout)
+            if isinstance(job, SyftError):
+                return job
+            return job.resolved
+
+        def job_resolved() -> bool:
             self.fetch()
-            if print_warning and self.result is not None:
-                result_obj = api.services.action.get(
-                    self.result.id, resolve_nested=False
+            return self.resolved
+
+        # nodes from before job.wait_for are polled
+        has_wait_for = getattr(api.services.job, "wait_for", None) is not None
+        resolved = wait_until_resolved(
+            wait_for=wait_for_job if has_wait_for else None,
+            is_resolved=job_resolved,
+            timeout=timeout,
+        )
+        if isinstance(resolved, SyftError):
+            return resolved
+        if not resolved:
+            return SyftError(message="Reached Timeout!")
+        self.fetch()
+
+        if job_only and self.result is not None:
+            result_obj = api.services.action.get(self.result.id, resolve_nested=False)
+            if isinstance(result_obj.syft_action_data, ActionDataLink):
+                print(
+                    "You're trying to wait on a job that has a link as a result."
+                    "This means that the job may be ready but the linked result may not."
+                    "Use job.wait().get() instead to wait for the linked result."
                 )
-                if isinstance(result_obj.syft_action_data, ActionDataLink) and job_only:
-                    print(
-                        "You're trying to wait on a job that has a link as a result."
-                        "This means that the job may be ready but the linked result may not."
-                        "Use job.wait().get() instead to wait for the linked result."
-                    )
-                    print_warning = False
-            sleep(1)
-            if self.resolved:
-                break  # type: ignore[unreachable]
-            # TODO: fix the mypy issue
-            if timeout is not None:
-                counter += 1
-                if counter > timeout:
-                    return SyftError(message="Reached Timeout!")
-        return self.resolve  # type: ignore[unreachable]
+        return self.resolve
 
     @property
     def resolve(self) -> Any | SyftNotReady:
@@ -647,7 +764,10 @@ class JobStash(BaseStash):
         valid = self.check_type(item, self.object_type)
         if valid.is_err():
             return SyftError(message=valid.err())
-        return super().update(credentials, item, add_permissions)
+        result = super().update(credentials, item, add_permissions)
+        if result.is_ok():
+            JOB_RESULT_NOTIFIER.notify()
+        return result
 
     def get_by_result_id(
         self,
@@ -5,10 +5,15 @@ from typing import ClassVar
 # relative
 from ...serde.serializable import serializable
 from ...service.context import AuthedServiceContext
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SYFT_OBJECT_VERSION_4
+from ...types.syft_object import SyftObject
 from ...types.syncable_object import SyncableSyftObject
 from ...types.uid import UID
 
+LOG_STDOUT = "stdout"
+LOG_STDERR = "stderr"
+
 
 @serializable()
 class SyftLog(SyncableSyftObject):
@@ -40,3 +45,25 @@ class SyftLog(SyncableSyftObject):
         self, context: AuthedServiceContext, **kwargs: dict
     ) -> list[UID]:  # type: ignore
         return [self.job_id]
+
+
+@serializable()
+class SyftLogChunk(SyftObject):
+    """A piece of output appended to a `SyftLog`, stored on its own so that
+    appending doesn't rewrite the whole log. `offset` is the position of `data`
+    in the stdout or stderr of the log."""
+
+    __canonical_name__ = "SyftLogChunk"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    __attr_searchable__ = ["log_id"]
+    __repr_attrs__ = ["log_id", "stream", "offset"]
+
+    log_id: UID
+    stream: str = LOG_STDOUT
+    offset: int = 0
+    data: str = ""
+
+    @property
+    def end(self) -> int:
+        return self.offset + len(self.data)
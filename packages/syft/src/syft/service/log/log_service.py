@@ -1,7 +1,13 @@
 # stdlib
+import threading
+import time
+from weakref import WeakSet
 
 # third party
+from loguru import logger
+from result import Err
 from result import Ok
+from result import Result
 
 # relative
 from ...serde.serializable import serializable
@@ -16,9 +22,138 @@ from ..service import TYPE_TO_SERVICE
 from ..service import service_method
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
+from .log import LOG_STDERR
+from .log import LOG_STDOUT
 from .log import SyftLog
+from .log import SyftLogChunk
+from .log_stash import LogChunkStash
 from .log_stash import LogStash
 
+# LogBuffer appends the output of a job to its log once this many characters
+# are pending, or once this many seconds have passed since the last append
+LOG_FLUSH_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL_SEC = 1.0
+# Duration (in seconds) between two checks of the LogFlusher for buffers due
+LOG_FLUSHER_TICK_SEC = 0.25
+
+
+class LogFlusher:
+    """Flushes registered LogBuffers from a single daemon thread, so output is
+    appended on time even when a job stops printing for a while."""
+
+    def __init__(self, tick: float = LOG_FLUSHER_TICK_SEC) -> None:
+        self.tick = tick
+        self._buffers: WeakSet[LogBuffer] = WeakSet()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def register(self, log_buffer: "LogBuffer") -> None:
+        with self._lock:
+            self._buffers.add(log_buffer)
+            # threads don't survive a fork, check it is still running
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def unregister(self, log_buffer: "LogBuffer") -> None:
+        with self._lock:
+            self._buffers.discard(log_buffer)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.tick)
+            with self._lock:
+                log_buffers = list(self._buffers)
+            for log_buffer in log_buffers:
+                try:
+                    log_buffer.flush_if_due()
+                except Exception as e:
+                    logger.error(f"Failed to flush log {log_buffer.uid}: {e}")
+
+
+LOG_FLUSHER = LogFlusher()
+
+
+class LogBuffer:
+    """Buffers output written to the stdout of a log and appends it in chunks.
+
+    Output is appended once `flush_size` characters are pending, or by the
+    LogFlusher once `flush_interval` seconds have passed since the last append.
+    `close` has to be called once no more output is written to append the rest.
+    The buffer keeps track of where the stdout ends, so appending doesn't look
+    up the chunks that are already stored.
+    """
+
+    def __init__(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        flush_size: int = LOG_FLUSH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SEC,
+        flusher: LogFlusher | None = LOG_FLUSHER,
+    ) -> None:
+        self.context = context
+        self.uid = uid
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.flusher = flusher
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._flushed_at = time.monotonic()
+        self._offset: int | None = None
+        if self.flusher is not None:
+            self.flusher.register(self)
+
+    def write(self, new_str: str) -> None:
+        with self._lock:
+            self._pending.append(new_str)
+            self._pending_size += len(new_str)
+            if self._pending_size >= self.flush_size:
+                self._flush()
+
+    def flush(self) -> SyftSuccess | SyftError:
+        with self._lock:
+            return self._flush()
+
+    def flush_if_due(self) -> None:
+        with self._lock:
+            if time.monotonic() - self._flushed_at >= self.flush_interval:
+                self._flush()
+
+    def close(self) -> SyftSuccess | SyftError:
+        if self.flusher is not None:
+            self.flusher.unregister(self)
+        return self.flush()
+
+    def _flush(self) -> SyftSuccess | SyftError:
+        self._flushed_at = time.monotonic()
+        if not self._pending:
+            return SyftSuccess(message="Nothing to flush")
+        new_str = "".join(self._pending)
+        # kept until appended, a failed append is retried with the next flush
+        self._pending = [new_str]
+
+        log_service = self.context.node.get_service("LogService")
+        if self._offset is None:
+            offset = log_service.stream_end(self.context, self.uid, LOG_STDOUT)
+            if offset.is_err():
+                return SyftError(message=str(offset.err()))
+            self._offset = offset.ok()
+
+        result = log_service.append_at(
+            context=self.context,
+            uid=self.uid,
+            stream=LOG_STDOUT,
+            data=new_str,
+            offset=self._offset,
+        )
+        if isinstance(result, SyftSuccess):
+            self._offset += len(new_str)
+            self._pending = []
+            self._pending_size = 0
+        return result
+
 
 @instrument
 @serializable()
@@ -29,6 +164,7 @@ class LogService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = LogStash(store=store)
+        self.chunk_stash = LogChunkStash(store=store)
 
     @service_method(path="log.add", name="add", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def add(
@@ -48,41 +184,74 @@ class LogService(AbstractService):
         new_str: str = "",
         new_err: str = "",
     ) -> SyftSuccess | SyftError:
-        result = self.stash.get_by_uid(context.credentials, uid)
+        # the output is stored as a new chunk, instead of rewriting the log
+        result = self._get_log(context, uid)
         if result.is_err():
             return SyftError(message=str(result.err()))
-        new_log = result.ok()
-        if new_str:
-            new_log.append(new_str)
+        log = result.ok()
 
-        if new_err:
-            new_log.append_error(new_err)
+        for stream, data in ((LOG_STDOUT, new_str), (LOG_STDERR, new_err)):
+            if not data:
+                continue
+            result = self._append_chunk(context, log, stream, data)
+            if result.is_err():
+                return SyftError(message=str(result.err()))
+
+        return SyftSuccess(message="Log Append successful!")
 
-        result = self.stash.update(context.credentials, new_log)
+    def append_at(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        stream: str,
+        data: str,
+        offset: int,
+    ) -> SyftSuccess | SyftError:
+        """Appends `data` to a stream whose end the caller already knows, like a
+        LogBuffer which is the only writer of its log."""
+        result = self._get_log(context, uid)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+
+        chunk = SyftLogChunk(log_id=uid, stream=stream, offset=offset, data=data)
+        result = self.chunk_stash.set(context.node.verify_key, chunk)
         if result.is_err():
             return SyftError(message=str(result.err()))
         return SyftSuccess(message="Log Append successful!")
 
+    def stream_end(
+        self, context: AuthedServiceContext, uid: UID, stream: str
+    ) -> Result[int, str]:
+        result = self._get_log(context, uid)
+        if result.is_err():
+            return result
+        return self._stream_end(context, result.ok(), stream)
+
     @service_method(path="log.get", name="get", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get(self, context: AuthedServiceContext, uid: UID) -> SyftSuccess | SyftError:
-        result = self.stash.get_by_uid(context.credentials, uid)
+        result = self._get_log(context, uid)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
 
+        # stores can hand out the stored object, which must not include chunks
+        log = result.ok().model_copy()
+        result = self._merge_chunks(context, log)
         if result.is_err():
             return SyftError(message=str(result.err()))
 
-        return result
+        return Ok(log)
 
     @service_method(
         path="log.get_stdout", name="get_stdout", roles=DATA_SCIENTIST_ROLE_LEVEL
     )
     def get_stdout(
-        self, context: AuthedServiceContext, uid: UID
+        self, context: AuthedServiceContext, uid: UID, offset: int = 0
     ) -> SyftSuccess | SyftError:
-        result = self.stash.get_by_uid(context.credentials, uid)
+        result = self._read(context, uid, LOG_STDOUT, offset)
         if result.is_err():
             return SyftError(message=str(result.err()))
 
-        return Ok(result.ok().stdout)
+        return result
 
     @service_method(path="log.restart", name="restart", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def restart(
@@ -90,30 +259,70 @@ class LogService(AbstractService):
         context: AuthedServiceContext,
         uid: UID,
     ) -> SyftSuccess | SyftError:
-        result = self.stash.get_by_uid(context.credentials, uid)
+        result = self._get_log(context, uid)
         if result.is_err():
             return SyftError(message=str(result.err()))
 
         log = result.ok()
         log.restart()
         result = self.stash.update(context.credentials, log)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+
+        result = self._delete_chunks(context, uid)
         if result.is_err():
             return SyftError(message=str(result.err()))
         return SyftSuccess(message="Log Restart successful!")
 
+    @service_method(path="log.compact", name="compact", roles=DATA_SCIENTIST_ROLE_LEVEL)
+    def compact(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+    ) -> SyftSuccess | SyftError:
+        """Moves the appended chunks into the log, once nothing is appended anymore."""
+        result = self._get_log(context, uid)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+
+        log = result.ok()
+        result = self._merge_chunks(context, log)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        merged = result.ok()
+        if not merged:
+            return SyftSuccess(message="Log is compacted")
+
+        result = self.stash.update(context.credentials, log)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+
+        # chunks appended since they were merged are kept
+        result = self._delete_chunks(context, uid, chunks=merged)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return SyftSuccess(message="Log Compact successful!")
+
     @service_method(path="log.get_error", name="get_error", roles=ADMIN_ROLE_LEVEL)
     def get_error(
-        self, context: AuthedServiceContext, uid: UID
+        self, context: AuthedServiceContext, uid: UID, offset: int = 0
     ) -> SyftSuccess | SyftError:
-        result = self.stash.get_by_uid(context.credentials, uid)
+        result = self._read(context, uid, LOG_STDERR, offset)
         if result.is_err():
             return SyftError(message=str(result.err()))
 
-        return Ok(result.ok().stderr)
+        return result
 
     @service_method(path="log.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL)
-    def get_all(self, context: AuthedServiceContext) -> SyftSuccess | SyftError:
-        result = self.stash.get_all(context.credentials)
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        page_size: int | None = 0,
+        page_index: int | None = 0,
+    ) -> SyftSuccess | SyftError:
+        result = self.stash.get_all(
+            context.credentials, page_size=page_size, page_index=page_index
+        )
         if result.is_err():
             return SyftError(message=str(result.err()))
         return result.ok()
@@ -123,11 +332,14 @@ class LogService(AbstractService):
         self, context: AuthedServiceContext, uid: UID
     ) -> SyftSuccess | SyftError:
         result = self.stash.delete_by_uid(context.credentials, uid)
-        if result.is_ok():
-            return result.ok()
-        else:
+        if result.is_err():
             return SyftError(message=result.err())
 
+        chunks_result = self._delete_chunks(context, uid)
+        if chunks_result.is_err():
+            return SyftError(message=chunks_result.err())
+        return result.ok()
+
     @service_method(
         path="log.has_storage_permission",
         name="has_storage_permission",
@@ -140,5 +352,84 @@ class LogService(AbstractService):
 
         return result
 
+    # chunks are only reachable through their log, so they are read and
+    # written with the node key once the log itself could be read
+    def _get_log(self, context: AuthedServiceContext, uid: UID) -> Result[SyftLog, str]:
+        result = self.stash.get_by_uid(context.credentials, uid)
+        if result.is_err():
+            return result
+        if result.ok() is None:
+            return Err(f"Log {uid} not found")
+        return result
+
+    def _stream_end(
+        self, context: AuthedServiceContext, log: SyftLog, stream: str
+    ) -> Result[int, str]:
+        result = self.chunk_stash.get_by_log_id(context.node.verify_key, log.id, stream)
+        if result.is_err():
+            return result
+        chunks = result.ok()
+        return Ok(chunks[-1].end if chunks else len(getattr(log, stream)))
+
+    def _append_chunk(
+        self, context: AuthedServiceContext, log: SyftLog, stream: str, data: str
+    ) -> Result[SyftLogChunk, str]:
+        result = self._stream_end(context, log, stream)
+        if result.is_err():
+            return result
+        chunk = SyftLogChunk(
+            log_id=log.id, stream=stream, offset=result.ok(), data=data
+        )
+        return self.chunk_stash.set(context.node.verify_key, chunk)
+
+    def _read(
+        self, context: AuthedServiceContext, uid: UID, stream: str, offset: int
+    ) -> Result[str, str]:
+        result = self._get_log(context, uid)
+        if result.is_err():
+            return result
+        log = result.ok()
+
+        result = self.chunk_stash.get_by_log_id(context.node.verify_key, uid, stream)
+        if result.is_err():
+            return result
+
+        parts = [getattr(log, stream)[offset:]]
+        for chunk in result.ok():
+            if chunk.end > offset:
+                parts.append(chunk.data[max(offset - chunk.offset, 0) :])
+        return Ok("".join(parts))
+
+    def _merge_chunks(
+        self, context: AuthedServiceContext, log: SyftLog
+    ) -> Result[list[SyftLogChunk], str]:
+        result = self.chunk_stash.get_by_log_id(context.node.verify_key, log.id)
+        if result.is_err():
+            return result
+        for chunk in result.ok():
+            if chunk.stream == LOG_STDERR:
+                log.append_error(chunk.data)
+            else:
+                log.append(chunk.data)
+        return result
+
+    def _delete_chunks(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        chunks: list[SyftLogChunk] | None = None,
+    ) -> Result[SyftSuccess, str]:
+        """Deletes `chunks` of the log, all of its chunks if not given."""
+        if chunks is None:
+            result = self.chunk_stash.get_by_log_id(context.node.verify_key, uid)
+            if result.is_err():
+                return result
+            chunks = result.ok()
+        for chunk in chunks:
+            result = self.chunk_stash.delete_by_uid(context.node.verify_key, chunk.id)
+            if result.is_err():
+                return result
+        return Ok(SyftSuccess(message=f"Chunks of log {uid} deleted"))
+
 
 TYPE_TO_SERVICE[SyftLog] = LogService
@@ -1,10 +1,21 @@
+# third party
+from result import Ok
+from result import Result
+
 # relative
+from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...store.document_store import BaseUIDStoreStash
 from ...store.document_store import DocumentStore
+from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
+from ...store.document_store import QueryKeys
+from ...types.uid import UID
 from ...util.telemetry import instrument
 from .log import SyftLog
+from .log import SyftLogChunk
+
+LogIdPartitionKey = PartitionKey(key="log_id", type_=UID)
 
 
 @instrument
@@ -17,3 +28,28 @@ class LogStash(BaseUIDStoreStash):
 
     def __init__(self, store: DocumentStore) -> None:
         super().__init__(store=store)
+
+
+@instrument
+@serializable()
+class LogChunkStash(BaseUIDStoreStash):
+    object_type = SyftLogChunk
+    settings: PartitionSettings = PartitionSettings(
+        name=SyftLogChunk.__canonical_name__, object_type=SyftLogChunk
+    )
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+
+    def get_by_log_id(
+        self, credentials: SyftVerifyKey, log_id: UID, stream: str | None = None
+    ) -> Result[list[SyftLogChunk], str]:
+        """Chunks of a log ordered by offset, only of `stream` if it is given."""
+        qks = QueryKeys(qks=[LogIdPartitionKey.with_obj(log_id)])
+        result = self.query_all(credentials=credentials, qks=qks)
+        if result.is_err():
+            return result
+        chunks = [
+            chunk for chunk in result.ok() if stream is None or chunk.stream == stream
+        ]
+        return Ok(sorted(chunks, key=lambda chunk: chunk.offset))
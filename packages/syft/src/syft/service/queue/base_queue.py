@@ -57,6 +57,9 @@ class QueueProducer:
     ) -> None:
         raise NotImplementedError
 
+    def notify(self, item: Any) -> None:
+        raise NotImplementedError
+
     def close(self) -> None:
         raise NotImplementedError
 
@@ -1,10 +1,15 @@
 # stdlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import os
 import threading
 import time
 from typing import Any
 from typing import cast
 
 # third party
+from loguru import logger
 import psutil
 from result import Err
 from result import Ok
@@ -15,8 +20,10 @@ from ...node.credentials import SyftVerifyKey
 from ...node.worker_settings import WorkerSettings
 from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
+from ...serde.serialize import _serialize as serialize
 from ...service.context import AuthedServiceContext
 from ...store.document_store import BaseStash
+from ...store.sqlite_document_store import reset_connection_pool
 from ...types.datetime import DateTime
 from ...types.uid import UID
 from ..job.job_stash import Job
@@ -33,6 +40,35 @@ from .base_queue import QueueProducer
 from .queue_stash import QueueItem
 from .queue_stash import Status
 
+# Number of recent job setup times kept in JOB_SETUP_TIMES
+JOB_SETUP_TIMES_MAXLEN = 1000
+
+# Seconds from a consumer receiving a job until the job's service method is called,
+# only recorded for jobs run in a thread or in a warm worker process
+JOB_SETUP_TIMES: deque[float] = deque(maxlen=JOB_SETUP_TIMES_MAXLEN)
+
+# Long-lived worker nodes of this process, keyed by worker settings
+WARM_WORKER_NODES: dict[bytes, Any] = {}
+WARM_WORKER_NODES_LOCK = threading.Lock()
+
+# Single process pools of the warm consumers, keyed by syft worker id
+WARM_WORKER_PROCESS_POOLS: dict[UID | None, ProcessPoolExecutor] = {}
+WARM_WORKER_PROCESS_POOLS_LOCK = threading.Lock()
+
+
+def job_setup_stats() -> dict[str, float]:
+    """Summary of JOB_SETUP_TIMES, in seconds."""
+    setup_times = sorted(JOB_SETUP_TIMES)
+    if not setup_times:
+        return {"count": 0}
+    return {
+        "count": len(setup_times),
+        "mean": sum(setup_times) / len(setup_times),
+        "p50": setup_times[len(setup_times) // 2],
+        "p95": setup_times[int(len(setup_times) * 0.95)],
+        "max": setup_times[-1],
+    }
+
 
 class MonitorThread(threading.Thread):
     def __init__(
@@ -93,6 +129,12 @@ class QueueManager(BaseQueueManager):
         address: str | None = None,
         syft_worker_id: UID | None = None,
     ) -> QueueConsumer:
+        if getattr(self.config, "warm_workers", False) and not getattr(
+            self.config, "thread_workers", False
+        ):
+            # forked now, so the first job doesn't wait for the process
+            get_warm_process_pool(syft_worker_id)
+
         consumer = self._client.add_consumer(
             message_handler=message_handler,
             queue_name=message_handler.queue_name,
@@ -136,13 +178,7 @@ class QueueManager(BaseQueueManager):
         return self._client.consumers
 
 
-def handle_message_multiprocessing(
-    worker_settings: WorkerSettings,
-    queue_item: QueueItem,
-    credentials: SyftVerifyKey,
-) -> None:
-    # this is a temp hack to prevent some multithreading issues
-    time.sleep(0.5)
+def create_worker_node(worker_settings: WorkerSettings) -> Any:
     queue_config = worker_settings.queue_config
     if queue_config is None:
         raise ValueError(f"{worker_settings} has no queue configurations!")
@@ -164,6 +200,43 @@ def handle_message_multiprocessing(
         migrate=False,
     )
 
+    # otherwise it reads it from env, resulting in the wrong credentials
+    worker.id = worker_settings.id
+    worker.signing_key = worker_settings.signing_key
+    return worker
+
+
+def get_warm_worker_node(worker_settings: WorkerSettings) -> Any:
+    """Return the worker node of this process for the settings, creating it once."""
+    key = serialize(
+        (
+            worker_settings.id,
+            worker_settings.document_store_config,
+            worker_settings.action_store_config,
+            worker_settings.blob_store_config,
+        ),
+        to_bytes=True,
+    )
+    with WARM_WORKER_NODES_LOCK:
+        worker = WARM_WORKER_NODES.get(key)
+        if worker is None:
+            worker = create_worker_node(worker_settings)
+            WARM_WORKER_NODES[key] = worker
+    return worker
+
+
+def handle_message_multiprocessing(
+    worker_settings: WorkerSettings,
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+    worker: Any | None = None,
+    received_at: float | None = None,
+) -> float | None:
+    if worker is None:
+        # this is a temp hack to prevent some multithreading issues
+        time.sleep(0.5)
+        worker = create_worker_node(worker_settings)
+
     job_item = worker.job_stash.get_by_uid(credentials, queue_item.job_id).ok()
 
     # Set monitor thread for this job.
@@ -195,6 +268,11 @@ def handle_message_multiprocessing(
             user_verify_key=credentials,
         )
 
+        setup_time = None
+        if received_at is not None:
+            setup_time = time.monotonic() - received_at
+            logger.debug("Job {} setup took {:.3f}s", queue_item.job_id, setup_time)
+
         result: Any = call_method(context, *queue_item.args, **queue_item.kwargs)
 
         if isinstance(result, Ok):
@@ -235,6 +313,69 @@ def handle_message_multiprocessing(
     # Finish monitor thread
     monitor_thread.stop()
 
+    return setup_time
+
+
+def init_warm_process() -> None:
+    global WARM_WORKER_NODES_LOCK
+
+    # forked from the consumer, whose nodes hold connections of the parent process
+    WARM_WORKER_NODES.clear()
+    WARM_WORKER_NODES_LOCK = threading.Lock()
+    reset_connection_pool()
+
+
+def handle_message_warm_process(message: bytes, received_at: float) -> float | None:
+    """Run a job in a warm worker process, reusing the process' worker node."""
+    worker_settings, queue_item, credentials = deserialize(message, from_bytes=True)
+    worker = get_warm_worker_node(worker_settings)
+
+    # the process outlives the job, so the monitor thread needs its pid
+    job_item = worker.job_stash.get_by_uid(credentials, queue_item.job_id).ok()
+    job_item.job_pid = os.getpid()
+    worker.job_stash.set_result(credentials, job_item)
+
+    return handle_message_multiprocessing(
+        worker_settings,
+        queue_item,
+        credentials,
+        worker=worker,
+        received_at=received_at,
+    )
+
+
+def get_warm_process_pool(syft_worker_id: UID | None) -> ProcessPoolExecutor:
+    """Return the warm process pool of the consumer, forking its process once."""
+    with WARM_WORKER_PROCESS_POOLS_LOCK:
+        pool = WARM_WORKER_PROCESS_POOLS.get(syft_worker_id)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=1, initializer=init_warm_process)
+            # the executor only starts its process on the first submit
+            pool.submit(os.getpid)
+            WARM_WORKER_PROCESS_POOLS[syft_worker_id] = pool
+    return pool
+
+
+def run_in_warm_process(
+    syft_worker_id: UID | None,
+    worker_settings: WorkerSettings,
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+    received_at: float,
+) -> float | None:
+    pool = get_warm_process_pool(syft_worker_id)
+    message = serialize((worker_settings, queue_item, credentials), to_bytes=True)
+    try:
+        return pool.submit(handle_message_warm_process, message, received_at).result()
+    except BrokenProcessPool:
+        # the job was interrupted and its process terminated, start a new one
+        # for the next job
+        with WARM_WORKER_PROCESS_POOLS_LOCK:
+            WARM_WORKER_PROCESS_POOLS.pop(syft_worker_id, None)
+        pool.shutdown(wait=False)
+        get_warm_process_pool(syft_worker_id)
+        raise
+
 
 def evaluate_can_run_job(
     job_id: UID, job_stash: JobStash, credentials: SyftVerifyKey
@@ -268,31 +409,16 @@ class APICallMessageHandler(AbstractMessageHandler):
 
     @staticmethod
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
-        # relative
-        from ...node.node import Node
-
+        received_at = time.monotonic()
         queue_item = deserialize(message, from_bytes=True)
         worker_settings = queue_item.worker_settings
 
         queue_config = worker_settings.queue_config
-        queue_config.client_config.create_producer = False
-        queue_config.client_config.n_consumers = 0
-
-        worker = Node(
-            id=worker_settings.id,
-            name=worker_settings.name,
-            signing_key=worker_settings.signing_key,
-            document_store_config=worker_settings.document_store_config,
-            action_store_config=worker_settings.action_store_config,
-            blob_storage_config=worker_settings.blob_store_config,
-            queue_config=queue_config,
-            is_subprocess=True,
-            migrate=False,
-        )
-
-        # otherwise it reads it from env, resulting in the wrong credentials
-        worker.id = worker_settings.id
-        worker.signing_key = worker_settings.signing_key
+        warm_workers = getattr(queue_config, "warm_workers", False)
+        if warm_workers:
+            worker = get_warm_worker_node(worker_settings)
+        else:
+            worker = create_worker_node(worker_settings)
 
         credentials = queue_item.syft_client_verify_key
 
@@ -327,7 +453,26 @@ class APICallMessageHandler(AbstractMessageHandler):
         if isinstance(job_result, SyftError):
             raise Exception(f"{job_result.err()}")
 
-        if queue_config.thread_workers:
+        if warm_workers:
+            if queue_config.thread_workers:
+                setup_time = handle_message_multiprocessing(
+                    worker_settings,
+                    queue_item,
+                    credentials,
+                    worker=worker,
+                    received_at=received_at,
+                )
+            else:
+                setup_time = run_in_warm_process(
+                    syft_worker_id,
+                    worker_settings,
+                    queue_item,
+                    credentials,
+                    received_at,
+                )
+            if setup_time is not None:
+                JOB_SETUP_TIMES.append(setup_time)
+        elif queue_config.thread_workers:
             # stdlib
             from threading import Thread
 
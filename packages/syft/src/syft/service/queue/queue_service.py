@@ -37,3 +37,12 @@ class QueueService(AbstractService):
             return SyftError(message=res.err())
         else:
             return res.ok()
+
+    @service_method(path="queue.get_job_setup_stats", name="get_job_setup_stats")
+    def get_job_setup_stats(self, context: AuthedServiceContext) -> dict[str, float]:
+        """Time from the consumers of this node receiving a job to running it,
+        for jobs run by warm or thread workers."""
+        # relative
+        from .queue import job_setup_stats
+
+        return job_setup_stats()
@@ -1,11 +1,11 @@
 # stdlib
 from binascii import hexlify
 from collections import defaultdict
+from collections import deque
 import itertools
 import socketserver
 import threading
 import time
-from time import sleep
 from typing import Any
 
 # third party
@@ -39,6 +39,7 @@ from .base_queue import QueueConfig
 from .base_queue import QueueConsumer
 from .base_queue import QueueProducer
 from .queue_stash import ActionQueueItem
+from .queue_stash import QueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
 
@@ -57,6 +58,13 @@ WORKER_TIMEOUT_SEC = 60
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
+# Duration (in seconds) between two scans of the queue stash for items the producer
+# was not notified about, e.g. items added by another node sharing the stash
+QUEUE_SWEEP_INTERVAL_SEC = 5
+
+# Duration (in seconds) after which items waiting on unresolved inputs are retried
+QUEUE_RETRY_INTERVAL_SEC = 1
+
 # Lock for working on ZMQ socket
 ZMQ_SOCKET_LOCK = threading.Lock()
 
@@ -147,12 +155,19 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = threading.Event()
+        self._new_items_event = threading.Event()
+        self._new_items: deque[QueueItem] = deque()
         self.post_init()
 
     @property
     def address(self) -> str:
         return get_queue_address(self.port)
 
+    def notify(self, item: QueueItem) -> None:
+        """Hand a newly added queue item to the producer thread for dispatch."""
+        self._new_items.append(item)
+        self._new_items_event.set()
+
     def post_init(self) -> None:
         """Initialize producer state."""
 
@@ -172,6 +187,7 @@ class ZMQProducer(QueueProducer):
 
     def close(self) -> None:
         self._stop.set()
+        self._new_items_event.set()
 
         try:
             self.poll_workers.unregister(self.socket)
@@ -269,73 +285,109 @@ class ZMQProducer(QueueProducer):
         )
 
     def read_items(self) -> None:
+        # items that could not be queued yet, retried until they can be
+        waiting: dict[UID, QueueItem] = {}
+        sweep_t = Timeout(QUEUE_SWEEP_INTERVAL_SEC)
+        sweep = True
+
         while True:
             if self._stop.is_set():
                 break
-            sleep(1)
-
-            # Items to be queued
-            items_to_queue = self.queue_stash.get_by_status(
-                self.queue_stash.partition.root_verify_key,
-                status=Status.CREATED,
-            ).ok()
-
-            items_to_queue = [] if items_to_queue is None else items_to_queue
-
-            # Queue Items that are in the processing state
-            items_processing = self.queue_stash.get_by_status(
-                self.queue_stash.partition.root_verify_key,
-                status=Status.PROCESSING,
-            ).ok()
-
-            items_processing = [] if items_processing is None else items_processing
-
-            for item in itertools.chain(items_to_queue, items_processing):
-                if item.status == Status.CREATED:
-                    if isinstance(item, ActionQueueItem):
-                        action = item.kwargs["action"]
-                        if self.contains_unresolved_action_objects(
-                            action.args
-                        ) or self.contains_unresolved_action_objects(action.kwargs):
-                            continue
-                        for arg in action.args:
-                            self.preprocess_action_arg(arg)
-                        for _, arg in action.kwargs.items():
-                            self.preprocess_action_arg(arg)
-
-                    msg_bytes = serialize(item, to_bytes=True)
-                    worker_pool = item.worker_pool.resolve_with_context(
-                        self.auth_context
-                    )
-                    worker_pool = worker_pool.ok()
-                    service_name = worker_pool.name
-                    service: Service | None = self.services.get(service_name)
 
-                    # Skip adding message if corresponding service/pool
-                    # is not registered.
-                    if service is None:
-                        continue
+            items: dict[UID, QueueItem] = {}
+            if sweep:
+                # the stash is the source of truth, it also holds the waiting items
+                waiting.clear()
+                items.update((item.id, item) for item in self.get_stash_items())
+                sweep_t.reset()
+            else:
+                items.update(waiting)
+
+            while self._new_items:
+                item = self._new_items.popleft()
+                items[item.id] = item
+
+            for item in items.values():
+                waiting.pop(item.id, None)
+                if not self.queue_item(item):
+                    waiting[item.id] = item
+
+            timeout = max(sweep_t.next_ts - Timeout.now(), 0)
+            if waiting:
+                timeout = min(timeout, QUEUE_RETRY_INTERVAL_SEC)
+            self._new_items_event.wait(timeout)
+            self._new_items_event.clear()
+            sweep = sweep_t.has_expired()
 
-                    # append request message to the corresponding service
-                    # This list is processed in dispatch method.
-
-                    # TODO: Logic to evaluate the CAN RUN Condition
-                    service.requests.append(msg_bytes)
-                    item.status = Status.PROCESSING
-                    res = self.queue_stash.update(item.syft_client_verify_key, item)
-                    if res.is_err():
-                        logger.error(
-                            "Failed to update queue item={} error={}",
-                            item,
-                            res.err(),
-                        )
-                elif item.status == Status.PROCESSING:
-                    # Evaluate Retry condition here
-                    # If job running and timeout or job status is KILL
-                    # or heartbeat fails
-                    # or container id doesn't exists, kill process or container
-                    # else decrease retry count and mark status as CREATED.
-                    pass
+    def get_stash_items(self) -> list[QueueItem]:
+        # Items to be queued
+        items_to_queue = self.queue_stash.get_by_status(
+            self.queue_stash.partition.root_verify_key,
+            status=Status.CREATED,
+        ).ok()
+
+        items_to_queue = [] if items_to_queue is None else items_to_queue
+
+        # Queue Items that are in the processing state
+        items_processing = self.queue_stash.get_by_status(
+            self.queue_stash.partition.root_verify_key,
+            status=Status.PROCESSING,
+        ).ok()
+
+        items_processing = [] if items_processing is None else items_processing
+
+        return list(itertools.chain(items_to_queue, items_processing))
+
+    def queue_item(self, item: QueueItem) -> bool:
+        """Append a created item to the requests of its service.
+
+        Returns False if the item can not be queued yet, because its inputs are
+        not resolved or no worker of its pool has registered.
+        """
+        if item.status == Status.CREATED:
+            if isinstance(item, ActionQueueItem):
+                action = item.kwargs["action"]
+                if self.contains_unresolved_action_objects(
+                    action.args
+                ) or self.contains_unresolved_action_objects(action.kwargs):
+                    return False
+                for arg in action.args:
+                    self.preprocess_action_arg(arg)
+                for _, arg in action.kwargs.items():
+                    self.preprocess_action_arg(arg)
+
+            msg_bytes = serialize(item, to_bytes=True)
+            worker_pool = item.worker_pool.resolve_with_context(self.auth_context)
+            worker_pool = worker_pool.ok()
+            service_name = worker_pool.name
+            service: Service | None = self.services.get(service_name)
+
+            # Skip adding message if corresponding service/pool
+            # is not registered.
+            if service is None:
+                return False
+
+            # append request message to the corresponding service
+            # This list is processed in dispatch method.
+
+            # TODO: Logic to evaluate the CAN RUN Condition
+            service.requests.append(msg_bytes)
+            item.status = Status.PROCESSING
+            res = self.queue_stash.update(item.syft_client_verify_key, item)
+            if res.is_err():
+                logger.error(
+                    "Failed to update queue item={} error={}",
+                    item,
+                    res.err(),
+                )
+        elif item.status == Status.PROCESSING:
+            # Evaluate Retry condition here
+            # If job running and timeout or job status is KILL
+            # or heartbeat fails
+            # or container id doesn't exists, kill process or container
+            # else decrease retry count and mark status as CREATED.
+            pass
+        return True
 
     def run(self) -> None:
         self.thread = threading.Thread(target=self._run)
@@ -956,7 +1008,9 @@ class ZMQQueueConfig(QueueConfig):
         client_type: type[ZMQClient] | None = None,
         client_config: ZMQClientConfig | None = None,
         thread_workers: bool = False,
+        warm_workers: bool = False,
     ):
         self.client_type = client_type or ZMQClient
         self.client_config: ZMQClientConfig = client_config or ZMQClientConfig()
         self.thread_workers = thread_workers
+        self.warm_workers = warm_workers
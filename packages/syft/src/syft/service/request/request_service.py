@@ -107,8 +107,15 @@ class RequestService(AbstractService):
     @service_method(
         path="request.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL
     )
-    def get_all(self, context: AuthedServiceContext) -> list[Request] | SyftError:
-        result = self.stash.get_all(context.credentials)
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        page_size: int | None = 0,
+        page_index: int | None = 0,
+    ) -> list[Request] | SyftError:
+        result = self.stash.get_all(
+            context.credentials, page_size=page_size, page_index=page_index
+        )
         if result.is_err():
             return SyftError(message=str(result.err()))
         requests = result.ok()
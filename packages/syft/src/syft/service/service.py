@@ -1,10 +1,12 @@
 # stdlib
 from collections import defaultdict
 from collections.abc import Callable
+from collections.abc import Mapping
 from copy import deepcopy
 from functools import partial
 import inspect
 from inspect import Parameter
+from types import MappingProxyType
 from typing import Any
 from typing import TYPE_CHECKING
 from typing import Union
@@ -123,12 +125,14 @@ class LibConfig(BaseConfig):
 class ServiceConfigRegistry:
     __service_config_registry__: dict[str, ServiceConfig] = {}
     # __public_to_private_path_map__: Dict[str, str] = {}
+    __role_registries__: dict[ServiceRole, "UserServiceConfigRegistry"] = {}
 
     @classmethod
     def register(cls, config: ServiceConfig) -> None:
         if not cls.path_exists(config.public_path):
             cls.__service_config_registry__[config.public_path] = config
             # cls.__public_to_private_path_map__[config.public_path] = config.private_path
+            cls.__role_registries__.clear()
 
     @classmethod
     def get_registered_configs(cls) -> dict[str, ServiceConfig]:
@@ -181,20 +185,33 @@ class UserLibConfigRegistry:
 
 
 class UserServiceConfigRegistry:
-    def __init__(self, service_config_registry: dict[str, ServiceConfig]):
-        self.__service_config_registry__: dict[str, ServiceConfig] = (
+    def __init__(self, service_config_registry: Mapping[str, ServiceConfig]):
+        self.__service_config_registry__: Mapping[str, ServiceConfig] = (
             service_config_registry
         )
 
     @classmethod
-    def from_role(cls, user_service_role: ServiceRole) -> Self:
-        return cls(
-            {
-                k: service_config
-                for k, service_config in ServiceConfigRegistry.get_registered_configs().items()
-                if service_config.has_permission(user_service_role)
-            }
-        )
+    def from_role(cls, user_service_role: ServiceRole) -> "UserServiceConfigRegistry":
+        # the registries are shared between calls, so they are read only
+        role_registries = ServiceConfigRegistry.__role_registries__
+        registry = role_registries.get(user_service_role)
+        if registry is None:
+            registry = cls(
+                MappingProxyType(
+                    {
+                        k: service_config
+                        for k, service_config in ServiceConfigRegistry.get_registered_configs().items()
+                        if service_config.has_permission(user_service_role)
+                    }
+                )
+            )
+            role_registries[user_service_role] = registry
+        return registry
+
+    @classmethod
+    def build_all(cls) -> None:
+        for role in ServiceRole:
+            cls.from_role(role)
 
     def __contains__(self, path: str) -> bool:
         return path in self.__service_config_registry__
@@ -202,7 +219,7 @@ class UserServiceConfigRegistry:
     def private_path_for(self, public_path: str) -> str:
         return self.__service_config_registry__[public_path].private_path
 
-    def get_registered_configs(self) -> dict[str, ServiceConfig]:
+    def get_registered_configs(self) -> Mapping[str, ServiceConfig]:
         return self.__service_config_registry__
 
 
@@ -441,6 +458,9 @@ def from_api_or_context(
     func_or_path: str,
     syft_node_location: UID | None = None,
     syft_client_verify_key: SyftVerifyKey | None = None,
+    # called instead of func_or_path when running on the node, after the same
+    # permission check, e.g. "BlobStorageService.read_on_node"
+    node_method: str | None = None,
 ) -> Union["APIModule", SyftError, partial] | None:
     # relative
     from ..client.api import APIRegistry
@@ -480,10 +500,13 @@ def from_api_or_context(
                     message=f"API call not in registered services: {func_or_path}"
                 )
 
-        _private_api_path = user_config_registry.private_path_for(func_or_path)
-        service_method = node_context.node.get_service_method(
-            _private_api_path,
-        )
+        if node_method is not None:
+            service_method = node_context.node.get_service_method(node_method)
+        else:
+            _private_api_path = user_config_registry.private_path_for(func_or_path)
+            service_method = node_context.node.get_service_method(
+                _private_api_path,
+            )
         return partial(service_method, node_context)
     else:
         print("Could not get method from api or context")
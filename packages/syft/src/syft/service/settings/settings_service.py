@@ -56,6 +56,7 @@ class SettingsService(AbstractService):
         print("Here!")
         result = self.stash.set(context.credentials, settings)
         if result.is_ok():
+            context.node.clear_settings_cache()
             return result
         else:
             return SyftError(message=result.err())
@@ -73,6 +74,7 @@ class SettingsService(AbstractService):
                 )
                 update_result = self.stash.update(context.credentials, new_settings)
                 if update_result.is_ok():
+                    context.node.clear_settings_cache()
                     return result
                 else:
                     return SyftError(message=update_result.err())
@@ -217,6 +217,9 @@ class SyncService(AbstractService):
                 else:
                     return SyftError(message=f"Failed to sync {res.err()}")
 
+        # synced user code and endpoints are part of the API of the users
+        context.node.clear_api_cache()
+
         res = self.build_current_state(
             context,
             new_items=items,
@@ -1,4 +1,6 @@
 # stdlib
+import threading
+import time
 
 # relative
 from ...abstract_node import NodeType
@@ -43,9 +45,63 @@ from .user_roles import ServiceRole
 from .user_roles import ServiceRoleCapability
 from .user_stash import UserStash
 
+# roles are cached for a short time only, so that role changes made by other
+# processes sharing the store (e.g. queue workers) are eventually picked up
+USER_ROLE_CACHE_TTL_SEC = 10.0
+USER_ROLE_CACHE_MAX_SIZE = 10_000
+
+
+class UserRoleCache:
+    """Thread safe cache of the role per verify key, cleared on user writes."""
+
+    def __init__(
+        self,
+        ttl: float = USER_ROLE_CACHE_TTL_SEC,
+        max_size: int = USER_ROLE_CACHE_MAX_SIZE,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        # credentials -> (role, expiry time)
+        self._roles: dict[SyftVerifyKey | SyftSigningKey, tuple[ServiceRole, float]]
+        self._roles = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, credentials: SyftVerifyKey | SyftSigningKey) -> ServiceRole | None:
+        entry = self._roles.get(credentials)
+        if entry is None:
+            return None
+        role, expires_at = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return role
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def set(
+        self,
+        credentials: SyftVerifyKey | SyftSigningKey,
+        role: ServiceRole,
+        generation: int,
+    ) -> None:
+        with self._lock:
+            # a user was written while the role was looked up, it may be stale
+            if generation != self._generation:
+                return
+            if len(self._roles) >= self.max_size:
+                self._roles.clear()
+            self._roles[credentials] = (role, time.monotonic() + self.ttl)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._roles.clear()
+
 
 @instrument
-@serializable()
+@serializable(without=["_role_cache"])
 class UserService(AbstractService):
     store: DocumentStore
     stash: UserStash
@@ -53,6 +109,13 @@ class UserService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = UserStash(store=store)
+        self._role_cache: UserRoleCache | None = None
+
+    @property
+    def role_cache(self) -> UserRoleCache:
+        if not hasattr(self, "_role_cache") or self._role_cache is None:
+            self._role_cache = UserRoleCache()
+        return self._role_cache
 
     @service_method(path="user.create", name="create")
     def create(
@@ -78,6 +141,7 @@ class UserService(AbstractService):
                 ),
             ],
         )
+        self.role_cache.clear()
         if result.is_err():
             return SyftError(message=str(result.err()))
         user = result.ok()
@@ -124,6 +188,8 @@ class UserService(AbstractService):
                 ]
                 # Return the proper slice using chunk_index
                 if page_index is not None:
+                    if page_index >= len(results):
+                        return []
                     results = results[page_index]
                     results = UserViewPage(users=results, total=total)
 
@@ -135,6 +201,15 @@ class UserService(AbstractService):
     def get_role_for_credentials(
         self, credentials: SyftVerifyKey | SyftSigningKey
     ) -> ServiceRole | None | SyftError:
+        role = self.role_cache.get(credentials)
+        if role is not None:
+            return role
+        generation = self.role_cache.generation
+        role = self._lookup_role(credentials)
+        self.role_cache.set(credentials, role, generation)
+        return role
+
+    def _lookup_role(self, credentials: SyftVerifyKey | SyftSigningKey) -> ServiceRole:
         # they could be different
         if isinstance(credentials, SyftVerifyKey):
             result = self.stash.get_by_verify_key(
@@ -297,6 +372,7 @@ class UserService(AbstractService):
         result = self.stash.update(
             credentials=context.credentials, user=user, has_permission=True
         )
+        self.role_cache.clear()
 
         if result.is_err():
             error_msg = (
@@ -314,6 +390,7 @@ class UserService(AbstractService):
                 settings_stash.update(
                     credentials=context.credentials, settings=settings_data
                 )
+                context.node.clear_settings_cache()
 
         return user.to(UserView)
 
@@ -354,6 +431,7 @@ class UserService(AbstractService):
         result = self.stash.delete_by_uid(
             credentials=context.credentials, uid=uid, has_permission=True
         )
+        self.role_cache.clear()
         if result.is_err():
             return SyftError(message=str(result.err()))
 
@@ -448,6 +526,7 @@ class UserService(AbstractService):
                 ),
             ],
         )
+        self.role_cache.clear()
         if result.is_err():
             return SyftError(message=str(result.err()))
 
@@ -43,6 +43,7 @@ Read/retrieve SyftObject from blob storage
 # stdlib
 from collections.abc import Generator
 from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 # third party
@@ -51,8 +52,10 @@ import requests
 from typing_extensions import Self
 
 # relative
+from ...client.connection import get_http_session
 from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
+from ...serde.stream import deserialize_from_file
 from ...service.response import SyftError
 from ...service.response import SyftSuccess
 from ...types.base import SyftBaseModel
@@ -90,17 +93,26 @@ class SyftObjectRetrieval(BlobRetrieval):
     __version__ = SYFT_OBJECT_VERSION_4
 
     syft_object: bytes
+    # set by on disk connections that map the file instead of reading it,
+    # only valid on the node that owns the file
+    _file_path: Path | None = None
 
     def _read_data(
         self, stream: bool = False, _deserialize: bool = True, **kwargs: Any
     ) -> Any:
         # development setup, we can access the same filesystem
-        if not _deserialize:
+        if self._file_path is not None:
+            if not _deserialize:
+                res = self._file_path.read_bytes()
+            else:
+                res = deserialize_from_file(self._file_path, memory_map=True)
+        elif not _deserialize:
             res = self.syft_object
         else:
             res = deserialize(self.syft_object, from_bytes=True)
 
-        # TODO: implement proper streaming from local files
+        # inline blobs fit in a single chunk, larger on disk ones are read by
+        # range, see OnDiskBlobRetrieval
         if stream:
             return [res]
         else:
@@ -121,7 +133,7 @@ def syft_iter_content(
     for attempt in range(max_retries):
         try:
             headers = {"Range": f"bytes={current_byte}-"}
-            with requests.get(
+            with get_http_session().get(
                 str(blob_url), stream=True, headers=headers, timeout=(timeout, timeout)
             ) as response:
                 response.raise_for_status()
@@ -186,11 +198,11 @@ class BlobRetrievalByURL(BlobRetrieval):
                 if stream:
                     return syft_iter_content(blob_url, chunk_size)
                 else:
-                    response = requests.get(str(blob_url), stream=False)  # nosec
+                    response = get_http_session().get(str(blob_url), stream=False)
                     response.raise_for_status()
                     return response.content
             else:
-                response = requests.get(str(blob_url), stream=stream)  # nosec
+                response = get_http_session().get(str(blob_url), stream=stream)
                 response.raise_for_status()
                 return deserialize(response.content, from_bytes=True)
         except requests.RequestException as e:
@@ -223,6 +235,9 @@ class BlobStorageConnection:
     def read(self, fp: SecureFilePathLocation, type_: type | None) -> BlobRetrieval:
         raise NotImplementedError
 
+    def read_range(self, fp: SecureFilePathLocation, offset: int, length: int) -> bytes:
+        raise NotImplementedError
+
     def allocate(
         self, obj: CreateBlobStorageEntry
     ) -> SecureFilePathLocation | SyftError:
@@ -234,6 +249,10 @@ class BlobStorageConnection:
     def delete(self, fp: SecureFilePathLocation) -> bool:
         raise NotImplementedError
 
+    def checksum(self, fp: SecureFilePathLocation) -> str:
+        """sha256 hex digest of the stored data."""
+        raise NotImplementedError
+
 
 @serializable()
 class BlobStorageClient(SyftBaseModel):
@@ -1,5 +1,9 @@
 # stdlib
+from collections.abc import Callable
+from collections.abc import Iterator
+from io import BufferedReader
 from io import BytesIO
+from io import RawIOBase
 from pathlib import Path
 from typing import Any
 
@@ -14,13 +18,26 @@ from . import BlobStorageClientConfig
 from . import BlobStorageConfig
 from . import BlobStorageConnection
 from . import SyftObjectRetrieval
+from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
+from ...serde.stream import STREAM_SERDE_HEADER
+from ...serde.stream import deserialize_from_stream
+from ...serde.stream import is_stream_serde
 from ...service.response import SyftError
+from ...service.response import SyftException
 from ...service.response import SyftSuccess
+from ...types.blob_storage import BlobFile
+from ...types.blob_storage import BlobFileType
 from ...types.blob_storage import BlobStorageEntry
 from ...types.blob_storage import CreateBlobStorageEntry
+from ...types.blob_storage import DEFAULT_CHUNK_SIZE
 from ...types.blob_storage import SecureFilePathLocation
+from ...types.blob_storage import file_checksum
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SYFT_OBJECT_VERSION_2
+from ...types.syft_object import SyftObject
+from ...types.uid import UID
+from ...util.experimental_flags import flags
 
 
 @serializable()
@@ -39,7 +56,111 @@ class OnDiskBlobDeposit(BlobDeposit):
         )
         if write_to_disk_method is None:
             return SyftError(message="write_to_disk_method is None")
-        return write_to_disk_method(data=data.read(), uid=self.blob_storage_entry_id)
+
+        # sent in chunks written at their offset, neither side holds the file
+        offset = 0
+        chunk = data.read(DEFAULT_CHUNK_SIZE)
+        while True:
+            next_chunk = data.read(DEFAULT_CHUNK_SIZE)
+            complete = not next_chunk
+            result = write_to_disk_method(
+                data=chunk,
+                uid=self.blob_storage_entry_id,
+                offset=offset,
+                complete=complete,
+            )
+            if complete or isinstance(result, SyftError):
+                return result
+            offset += len(chunk)
+            chunk = next_chunk
+
+
+class _RangeReader(RawIOBase):
+    """Readable file object over a blob, reading it from the node by range."""
+
+    def __init__(self, read_range: Callable, uid: UID) -> None:
+        super().__init__()
+        self._read_range = read_range
+        self._uid = uid
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        data = self._read_range(uid=self._uid, offset=self._offset, length=len(view))
+        if isinstance(data, SyftError):
+            raise SyftException(data.message)
+        view[: len(data)] = data
+        self._offset += len(data)
+        return len(data)
+
+
+@serializable()
+class OnDiskBlobRetrieval(BlobRetrieval):
+    """Retrieval of a file too large to send in one message, the data is read
+    from the node in ranges as it is consumed."""
+
+    __canonical_name__ = "OnDiskBlobRetrieval"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    def _get_read_range(self) -> Callable:
+        # relative
+        from ...service.service import from_api_or_context
+
+        read_range = from_api_or_context(
+            func_or_path="blob_storage.read_range",
+            syft_node_location=self.syft_node_location,
+            syft_client_verify_key=self.syft_client_verify_key,
+        )
+        if read_range is None or isinstance(read_range, SyftError):
+            raise SyftException("Can't read the blob, there is no api or context.")
+        return read_range
+
+    def _iter_ranges(self, chunk_size: int) -> Iterator[bytes]:
+        reader = _RangeReader(self._get_read_range(), self.syft_blob_storage_entry_id)
+        while chunk := reader.read(chunk_size):
+            yield chunk
+
+    def _read_data(
+        self,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        _deserialize: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        if stream:
+            return self._iter_ranges(chunk_size)
+        if not _deserialize:
+            return b"".join(self._iter_ranges(chunk_size))
+
+        read_range = self._get_read_range()
+        header = read_range(
+            uid=self.syft_blob_storage_entry_id,
+            offset=0,
+            length=len(STREAM_SERDE_HEADER),
+        )
+        if isinstance(header, SyftError):
+            return header
+        if is_stream_serde(header):
+            # the buffers are filled range by range, without a copy of the file
+            reader = _RangeReader(read_range, self.syft_blob_storage_entry_id)
+            return deserialize_from_stream(
+                BufferedReader(reader, buffer_size=chunk_size), chunk_size=chunk_size
+            )
+        return deserialize(b"".join(self._iter_ranges(chunk_size)), from_bytes=True)
+
+    def read(self) -> SyftObject | SyftError:
+        if self.type_ is BlobFileType:
+            return BlobFile(
+                file_name=self.file_name,
+                syft_client_verify_key=self.syft_client_verify_key,
+                syft_node_location=self.syft_node_location,
+                syft_blob_storage_entry_id=self.syft_blob_storage_entry_id,
+                file_size=self.file_size,
+            )
+        return self._read_data()
 
 
 class OnDiskBlobStorageConnection(BlobStorageConnection):
@@ -55,9 +176,26 @@ class OnDiskBlobStorageConnection(BlobStorageConnection):
         pass
 
     def read(
-        self, fp: SecureFilePathLocation, type_: type | None, **kwargs: Any
+        self,
+        fp: SecureFilePathLocation,
+        type_: type | None,
+        memory_map: bool = False,
+        **kwargs: Any,
     ) -> BlobRetrieval:
         file_path = self._base_directory / fp.path
+        if memory_map and flags.MEMORY_MAP_BLOB_STORAGE:
+            # the file is mapped when the retrieval is read, which only works on
+            # this node, so only reads made on the node ask for it
+            retrieval = SyftObjectRetrieval(
+                syft_object=b"",
+                file_name=file_path.name,
+                type_=type_,
+            )
+            retrieval._file_path = file_path
+            return retrieval
+        if file_path.stat().st_size > DEFAULT_CHUNK_SIZE:
+            # too large to send in one message, it is read by range instead
+            return OnDiskBlobRetrieval(file_name=file_path.name, type_=type_)
         return SyftObjectRetrieval(
             syft_object=file_path.read_bytes(),
             file_name=file_path.name,
@@ -74,6 +212,11 @@ class OnDiskBlobStorageConnection(BlobStorageConnection):
         except Exception as e:
             return SyftError(message=f"Failed to allocate: {e}")
 
+    def read_range(self, fp: SecureFilePathLocation, offset: int, length: int) -> bytes:
+        with open(self._base_directory / fp.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
     def write(self, obj: BlobStorageEntry) -> BlobDeposit:
         return OnDiskBlobDeposit(blob_storage_entry_id=obj.id)
 
@@ -84,6 +227,9 @@ class OnDiskBlobStorageConnection(BlobStorageConnection):
         except FileNotFoundError as e:
             return SyftError(message=f"Failed to delete file: {e}")
 
+    def checksum(self, fp: SecureFilePathLocation) -> str:
+        return file_checksum(self._base_directory / fp.path)
+
 
 @serializable()
 class OnDiskBlobStorageClientConfig(BlobStorageClientConfig):
@@ -1,9 +1,13 @@
 # stdlib
-from collections.abc import Generator
+import base64
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+import hashlib
 from io import BytesIO
 import math
-from queue import Queue
-import threading
 from typing import Any
 
 # third party
@@ -22,6 +26,7 @@ from . import BlobStorageClient
 from . import BlobStorageClientConfig
 from . import BlobStorageConfig
 from . import BlobStorageConnection
+from ...client.connection import get_http_session
 from ...serde.serializable import serializable
 from ...service.blob_storage.remote_profile import AzureRemoteProfile
 from ...service.response import SyftError
@@ -29,24 +34,36 @@ from ...service.response import SyftSuccess
 from ...service.service import from_api_or_context
 from ...types.blob_storage import BlobStorageEntry
 from ...types.blob_storage import CreateBlobStorageEntry
+from ...types.blob_storage import DEFAULT_CHUNK_SIZE
 from ...types.blob_storage import SeaweedSecureFilePathLocation
 from ...types.blob_storage import SecureFilePathLocation
 from ...types.grid_url import GridURL
-from ...types.syft_object import SYFT_OBJECT_VERSION_3
+from ...types.syft_object import SYFT_OBJECT_VERSION_4
 from ...util.constants import DEFAULT_TIMEOUT
 
 WRITE_EXPIRATION_TIME = 900  # seconds
-DEFAULT_FILE_PART_SIZE = (1024**3) * 5  # 5GB
-DEFAULT_UPLOAD_CHUNK_SIZE = 819200
+DEFAULT_FILE_PART_SIZE = 64 * 1024**2  # 64MB
+# S3 caps the number of parts of a multipart upload
+MAX_FILE_PARTS = 10_000
+DEFAULT_UPLOAD_WORKERS = 4
+PART_UPLOAD_RETRIES = 3
+
+
+def file_part_size(file_size: int) -> int:
+    return max(DEFAULT_FILE_PART_SIZE, math.ceil(file_size / MAX_FILE_PARTS))
 
 
 @serializable()
 class SeaweedFSBlobDeposit(BlobDeposit):
     __canonical_name__ = "SeaweedFSBlobDeposit"
-    __version__ = SYFT_OBJECT_VERSION_3
+    __version__ = SYFT_OBJECT_VERSION_4
 
     urls: list[GridURL]
     size: int
+    part_size: int = DEFAULT_FILE_PART_SIZE
+    upload_workers: int = DEFAULT_UPLOAD_WORKERS
+    # ETags of the parts uploaded before the upload was resumed, by part number
+    uploaded_parts: dict[int, str] = {}
 
     def write(self, data: BytesIO) -> SyftSuccess | SyftError:
         # relative
@@ -56,89 +73,70 @@ class SeaweedFSBlobDeposit(BlobDeposit):
             node_uid=self.syft_node_location,
             user_verify_key=self.syft_client_verify_key,
         )
-
-        etags = []
+        mark_part_complete_method = from_api_or_context(
+            func_or_path="blob_storage.mark_part_complete",
+            syft_node_location=self.syft_node_location,
+            syft_client_verify_key=self.syft_client_verify_key,
+        )
+        if mark_part_complete_method is None:
+            return SyftError(message="mark_part_complete_method is None")
+        if isinstance(mark_part_complete_method, SyftError):
+            return mark_part_complete_method
+        mark_part_complete: Callable = mark_part_complete_method
+
+        etags = dict(self.uploaded_parts)
+        no_lines = 0
+
+        def mark_complete(futures: set[Future]) -> SyftError | None:
+            # the ETags are persisted on the node so a crashed upload can resume
+            for future in futures:
+                part_no, etag, part_size = future.result()
+                etags[part_no] = etag
+                pbar.update(part_size)
+                result = mark_part_complete(
+                    uid=self.blob_storage_entry_id, part_no=part_no, etag=etag
+                )
+                if isinstance(result, SyftError):
+                    return result
+            return None
 
         try:
-            no_lines = 0
-            # this loops over the parts, we have multiple parts to allow for
-            # concurrent uploads of a single file. (We are currently not using that)
-            # a part may for instance be 5GB
-            # parts are then splitted into chunks which are MBs (order of magnitude)
-            part_size = math.ceil(self.size / len(self.urls))
-            chunk_size = DEFAULT_UPLOAD_CHUNK_SIZE
-
-            # this is the total nr of chunks in all parts
-            total_iterations = math.ceil(part_size / chunk_size) * len(self.urls)
-
-            with tqdm(
-                total=total_iterations,
-                desc=f"Uploading progress",  # noqa
-            ) as pbar:
-                for part_no, url in enumerate(
-                    self.urls,
-                    start=1,
-                ):
+            # parts are read in order and uploaded concurrently, at most
+            # upload_workers of them are held in memory at a time
+            with (
+                ThreadPoolExecutor(max_workers=self.upload_workers) as executor,
+                tqdm(
+                    total=self.size,
+                    unit="B",
+                    unit_scale=True,
+                    desc="Uploading progress",
+                ) as pbar,
+            ):
+                pending: set[Future] = set()
+                for part_no, url in enumerate(self.urls, start=1):
+                    part = data.read(self.part_size)
+                    no_lines += part.count(b"\n")
+                    if part_no in etags:
+                        pbar.update(len(part))
+                        continue
+
+                    if len(pending) >= self.upload_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        error = mark_complete(done)
+                        if error is not None:
+                            return error
+
                     if api is not None and api.connection is not None:
                         blob_url = api.connection.to_blob_route(
                             url.url_path, host=url.host_or_ip
                         )
                     else:
                         blob_url = url
+                    pending.add(executor.submit(upload_part, part_no, blob_url, part))
 
-                    # read a chunk untill we have read part_size
-                    class PartGenerator:
-                        def __init__(self) -> None:
-                            self.no_lines = 0
-
-                        def async_generator(
-                            self, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
-                        ) -> Generator:
-                            item_queue: Queue = Queue()
-                            threading.Thread(
-                                target=self.add_chunks_to_queue,
-                                kwargs={"queue": item_queue, "chunk_size": chunk_size},
-                                daemon=True,
-                            ).start()
-                            item = item_queue.get()
-                            while item != 0:
-                                yield item
-                                pbar.update(1)
-                                item = item_queue.get()
-
-                        def add_chunks_to_queue(
-                            self,
-                            queue: Queue,
-                            chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
-                        ) -> None:
-                            """Creates a data geneator for the part"""
-                            n = 0
-
-                            while n * chunk_size <= part_size:
-                                try:
-                                    chunk = data.read(chunk_size)
-                                    self.no_lines += chunk.count(b"\n")
-                                    n += 1
-                                    queue.put(chunk)
-                                except BlockingIOError:
-                                    # if end of file, stop
-                                    queue.put(0)
-                            # if end of part, stop
-                            queue.put(0)
-
-                    gen = PartGenerator()
-
-                    response = requests.put(
-                        url=str(blob_url),
-                        data=gen.async_generator(chunk_size),
-                        timeout=DEFAULT_TIMEOUT,
-                        stream=True,
-                    )
-
-                    response.raise_for_status()
-                    no_lines += gen.no_lines
-                    etag = response.headers["ETag"]
-                    etags.append({"ETag": etag, "PartNumber": part_no})
+                error = mark_complete(wait(pending).done)
+                if error is not None:
+                    return error
 
         except requests.RequestException as e:
             print(e)
@@ -152,10 +150,45 @@ class SeaweedFSBlobDeposit(BlobDeposit):
         if mark_write_complete_method is None:
             return SyftError(message="mark_write_complete_method is None")
         return mark_write_complete_method(
-            etags=etags, uid=self.blob_storage_entry_id, no_lines=no_lines
+            etags=[
+                {"ETag": etag, "PartNumber": part_no}
+                for part_no, etag in sorted(etags.items())
+            ],
+            uid=self.blob_storage_entry_id,
+            no_lines=no_lines,
         )
 
 
+def upload_part(
+    part_no: int, blob_url: str | GridURL, part: bytes
+) -> tuple[int, str, int]:
+    """PUT a part to its presigned url, retried until the server has the same
+    bytes: it checks the Content-MD5 header and returns their md5 as ETag."""
+    md5 = hashlib.md5(part, usedforsecurity=False)
+    headers = {"Content-MD5": base64.b64encode(md5.digest()).decode()}
+    for attempt in range(1, PART_UPLOAD_RETRIES + 1):
+        try:
+            response = get_http_session().put(
+                url=str(blob_url),
+                data=part,
+                headers=headers,
+                timeout=DEFAULT_TIMEOUT,
+            )
+            response.raise_for_status()
+            etag = response.headers["ETag"]
+            if etag.strip('"') == md5.hexdigest():
+                return part_no, etag, len(part)
+            error = f"ETag {etag} doesn't match the checksum of the part"
+        except requests.RequestException as e:
+            if attempt == PART_UPLOAD_RETRIES:
+                raise
+            error = str(e)
+        print(
+            f"Attempt {attempt}/{PART_UPLOAD_RETRIES} to upload part {part_no} failed: {error}. Retrying..."
+        )
+    raise requests.RequestException(f"Failed to upload part {part_no}: {error}")
+
+
 @serializable()
 class SeaweedFSClientConfig(BlobStorageClientConfig):
     host: str
@@ -166,6 +199,8 @@ class SeaweedFSClientConfig(BlobStorageClientConfig):
     region: str
     default_bucket_name: str = "defaultbucket"
     remote_profiles: dict[str, AzureRemoteProfile] = {}
+    # number of parts a client uploads at the same time
+    upload_workers: int = DEFAULT_UPLOAD_WORKERS
 
     @property
     def endpoint_url(self) -> str:
@@ -225,6 +260,7 @@ class SeaweedFSConnection(BlobStorageConnection):
         fp: SecureFilePathLocation,
         type_: type | None,
         bucket_name: str | None = None,
+        **kwargs: Any,
     ) -> BlobRetrieval:
         if bucket_name is None:
             bucket_name = self.default_bucket_name
@@ -249,7 +285,8 @@ class SeaweedFSConnection(BlobStorageConnection):
             )
 
     def write(self, obj: BlobStorageEntry) -> BlobDeposit:
-        total_parts = math.ceil(obj.file_size / DEFAULT_FILE_PART_SIZE)
+        part_size = file_part_size(obj.file_size)
+        total_parts = math.ceil(obj.file_size / part_size)
 
         urls = [
             GridURL.from_url(
@@ -267,7 +304,12 @@ class SeaweedFSConnection(BlobStorageConnection):
             for i in range(total_parts)
         ]
         return SeaweedFSBlobDeposit(
-            blob_storage_entry_id=obj.id, urls=urls, size=obj.file_size
+            blob_storage_entry_id=obj.id,
+            urls=urls,
+            size=obj.file_size,
+            part_size=part_size,
+            upload_workers=self.config.upload_workers,
+            uploaded_parts=obj.location.uploaded_parts,
         )
 
     def complete_multipart_upload(
@@ -296,6 +338,16 @@ class SeaweedFSConnection(BlobStorageConnection):
         except BotoClientError as e:
             return SyftError(message=str(e))
 
+    def checksum(self, fp: SecureFilePathLocation) -> str:
+        # the object is streamed, so it is hashed without being held in memory
+        body = self.client.get_object(Bucket=self.default_bucket_name, Key=fp.path)[
+            "Body"
+        ]
+        checksum = hashlib.sha256()
+        for chunk in body.iter_chunks(DEFAULT_CHUNK_SIZE):
+            checksum.update(chunk)
+        return checksum.hexdigest()
+
 
 @serializable()
 class SeaweedFSConfig(BlobStorageConfig):
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import islice
 import types
 import typing
 from typing import Any
@@ -33,6 +36,18 @@ from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
 
+# number of objects BaseStash.iter_all fetches from the partition at a time
+DEFAULT_PAGE_SIZE = 100
+
+
+def paginate(objs: Iterable, page_size: int | None, page_index: int | None) -> list:
+    """Page page_index of page_size objects, or all of them if page_size is not
+    set. objs is only consumed as far as the page reaches."""
+    if not page_size:
+        return list(objs)
+    start = (page_index or 0) * page_size
+    return list(islice(objs, start, start + page_size))
+
 
 @serializable()
 class BasePartitionSettings(SyftBaseModel):
@@ -450,8 +465,17 @@ class StorePartition:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        page_size: int | None = None,
+        page_index: int | None = 0,
     ) -> Result[list[BaseStash.object_type], str]:
-        return self._thread_safe_cbk(self._all, credentials, order_by, has_permission)
+        return self._thread_safe_cbk(
+            self._all,
+            credentials,
+            order_by,
+            has_permission,
+            page_size=page_size,
+            page_index=page_index,
+        )
 
     def migrate_data(
         self,
@@ -506,6 +530,8 @@ class StorePartition:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        page_size: int | None = None,
+        page_index: int | None = 0,
     ) -> Result[list[BaseStash.object_type], str]:
         raise NotImplementedError
 
@@ -601,8 +627,41 @@ class BaseStash:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool = False,
+        page_size: int | None = None,
+        page_index: int | None = 0,
     ) -> Result[list[BaseStash.object_type], str]:
-        return self.partition.all(credentials, order_by, has_permission)
+        return self.partition.all(
+            credentials,
+            order_by,
+            has_permission,
+            page_size=page_size,
+            page_index=page_index,
+        )
+
+    def iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        order_by: PartitionKey | None = None,
+        has_permission: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[BaseStash.object_type]:
+        """Lazily yields every object, fetching page_size of them at a time."""
+        page_index = 0
+        while True:
+            result = self.get_all(
+                credentials,
+                order_by,
+                has_permission,
+                page_size=page_size,
+                page_index=page_index,
+            )
+            if result.is_err():
+                raise Exception(result.err())
+            page = result.ok()
+            yield from page
+            if len(page) < page_size:
+                return
+            page_index += 1
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
         self.partition.add_permissions(permissions)
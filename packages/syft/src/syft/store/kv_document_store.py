@@ -3,7 +3,11 @@ from __future__ import annotations
 
 # stdlib
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 # third party
@@ -31,6 +35,7 @@ from .document_store import PartitionKey
 from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StorePartition
+from .document_store import paginate
 
 
 @serializable()
@@ -85,6 +90,16 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    def transaction(self) -> AbstractContextManager:
+        """Groups the writes made inside of it, stores without transactions
+        write straight away."""
+        return nullcontext()
+
+    def iter_items(self, offset: int = 0) -> Iterator[tuple[Any, Any]]:
+        """Lazily yields (key, value) pairs in insertion order, starting at
+        offset."""
+        return islice(self.items(), offset, None)
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -143,6 +158,11 @@ class KeyValueStorePartition(StorePartition):
     def __len__(self) -> int:
         return len(self.data)
 
+    def transaction(self) -> AbstractContextManager:
+        # data, keys and permissions are stored together, so the transaction
+        # of the data store covers all of them
+        return self.data.transaction()
+
     def _get(
         self,
         uid: UID,
@@ -175,64 +195,69 @@ class KeyValueStorePartition(StorePartition):
         ignore_duplicates: bool = False,
     ) -> Result[SyftObject, str]:
         try:
-            # if obj.id is None:
-            # obj.id = UID()
-            store_query_key: QueryKey = self.settings.store_key.with_obj(obj)
-            uid = store_query_key.value
-            write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
-            can_write = self.has_permission(write_permission)
-            unique_query_keys: QueryKeys = self.settings.unique_keys.with_obj(obj)
-            store_key_exists = store_query_key.value in self.data
-            searchable_query_keys = self.settings.searchable_keys.with_obj(obj)
-
-            ck_check = self._check_partition_keys_unique(
-                unique_query_keys=unique_query_keys
-            )
-
-            if not store_key_exists and ck_check == UniqueKeyCheck.EMPTY:
-                # attempt to claim it for writing
-                ownership_result = self.take_ownership(uid=uid, credentials=credentials)
-                can_write = ownership_result.is_ok()
-            elif not ignore_duplicates:
-                keys = ", ".join(f"`{key.key}`" for key in unique_query_keys.all)
-                return Err(
-                    f"Duplication Key Error for {obj}.\n"
-                    f"The fields that should be unique are {keys}."
+            with self.transaction():
+                # if obj.id is None:
+                # obj.id = UID()
+                store_query_key: QueryKey = self.settings.store_key.with_obj(obj)
+                uid = store_query_key.value
+                write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
+                can_write = self.has_permission(write_permission)
+                unique_query_keys: QueryKeys = self.settings.unique_keys.with_obj(obj)
+                store_key_exists = store_query_key.value in self.data
+                searchable_query_keys = self.settings.searchable_keys.with_obj(obj)
+
+                ck_check = self._check_partition_keys_unique(
+                    unique_query_keys=unique_query_keys
                 )
-            else:
-                # we are not throwing an error, because we are ignoring duplicates
-                # we are also not writing though
-                return Ok(obj)
-
-            if can_write:
-                self._set_data_and_keys(
-                    store_query_key=store_query_key,
-                    unique_query_keys=unique_query_keys,
-                    searchable_query_keys=searchable_query_keys,
-                    obj=obj,
-                )
-                self.data[uid] = obj
-
-                # Add default permissions
-                if uid not in self.permissions:
-                    self.permissions[uid] = set()
-                self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
-                if add_permissions is not None:
-                    self.add_permissions(add_permissions)
-
-                if uid not in self.storage_permissions:
-                    self.storage_permissions[uid] = set()
-                if add_storage_permission:
-                    self.add_storage_permission(
-                        StoragePermission(
-                            uid=uid,
-                            node_uid=self.node_uid,
-                        )
+
+                if not store_key_exists and ck_check == UniqueKeyCheck.EMPTY:
+                    # attempt to claim it for writing
+                    ownership_result = self.take_ownership(
+                        uid=uid, credentials=credentials
+                    )
+                    can_write = ownership_result.is_ok()
+                elif not ignore_duplicates:
+                    keys = ", ".join(f"`{key.key}`" for key in unique_query_keys.all)
+                    return Err(
+                        f"Duplication Key Error for {obj}.\n"
+                        f"The fields that should be unique are {keys}."
+                    )
+                else:
+                    # we are not throwing an error, because we are ignoring duplicates
+                    # we are also not writing though
+                    return Ok(obj)
+
+                if can_write:
+                    self._set_data_and_keys(
+                        store_query_key=store_query_key,
+                        unique_query_keys=unique_query_keys,
+                        searchable_query_keys=searchable_query_keys,
+                        obj=obj,
                     )
+                    self.data[uid] = obj
 
-                return Ok(obj)
-            else:
-                return Err(f"Permission: {write_permission} denied")
+                    # Add default permissions
+                    if uid not in self.permissions:
+                        self.permissions[uid] = set()
+                    self.add_permission(
+                        ActionObjectREAD(uid=uid, credentials=credentials)
+                    )
+                    if add_permissions is not None:
+                        self.add_permissions(add_permissions)
+
+                    if uid not in self.storage_permissions:
+                        self.storage_permissions[uid] = set()
+                    if add_storage_permission:
+                        self.add_storage_permission(
+                            StoragePermission(
+                                uid=uid,
+                                node_uid=self.node_uid,
+                            )
+                        )
+
+                    return Ok(obj)
+                else:
+                    return Err(f"Permission: {write_permission} denied")
         except Exception as e:
             return Err(f"Failed to write obj {obj}. {e}")
 
@@ -329,13 +354,35 @@ class KeyValueStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        page_size: int | None = None,
+        page_index: int | None = 0,
     ) -> Result[list[BaseStash.object_type], str]:
-        # this checks permissions
-        res = [self._get(uid, credentials, has_permission) for uid in self.data.keys()]
-        result = [x.ok() for x in res if x.is_ok()]
         if order_by is not None:
+            # sorting needs every object
+            # this checks permissions
+            res = [
+                self._get(uid, credentials, has_permission) for uid in self.data.keys()
+            ]
+            result = [x.ok() for x in res if x.is_ok()]
             result = sorted(result, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(result)
+            return Ok(paginate(result, page_size, page_index))
+
+        # TODO: fix for other admins
+        if has_permission or (
+            credentials and self.root_verify_key.verify == credentials.verify
+        ):
+            # every object is readable, so the backing store can skip to the page
+            offset = (page_index or 0) * page_size if page_size else 0
+            items = self.data.iter_items(offset=offset)
+            return Ok(paginate((obj for _, obj in items), page_size, 0))
+
+        # objects are only loaded once they are known to be readable
+        readable = (
+            self.data[uid]
+            for uid in self.data.keys()
+            if self.has_permission(ActionObjectREAD(uid=uid, credentials=credentials))
+        )
+        return Ok(paginate(readable, page_size, page_index))
 
     def _remove_keys(
         self,
@@ -408,56 +455,59 @@ class KeyValueStorePartition(StorePartition):
         overwrite: bool = False,
     ) -> Result[SyftObject, str]:
         try:
-            if qk.value not in self.data:
-                return Err(f"No object exists for query key: {qk}")
-
-            if has_permission or self.has_permission(
-                ActionObjectWRITE(uid=qk.value, credentials=credentials)
-            ):
-                _original_obj = self.data[qk.value]
-                _original_unique_keys = self.settings.unique_keys.with_obj(
-                    _original_obj
-                )
-                _original_searchable_keys = self.settings.searchable_keys.with_obj(
-                    _original_obj
-                )
+            with self.transaction():
+                if qk.value not in self.data:
+                    return Err(f"No object exists for query key: {qk}")
 
-                store_query_key = self.settings.store_key.with_obj(_original_obj)
+                if has_permission or self.has_permission(
+                    ActionObjectWRITE(uid=qk.value, credentials=credentials)
+                ):
+                    _original_obj = self.data[qk.value]
+                    _original_unique_keys = self.settings.unique_keys.with_obj(
+                        _original_obj
+                    )
+                    _original_searchable_keys = self.settings.searchable_keys.with_obj(
+                        _original_obj
+                    )
 
-                # remove old keys
-                self._remove_keys(
-                    store_key=store_query_key,
-                    unique_query_keys=_original_unique_keys,
-                    searchable_query_keys=_original_searchable_keys,
-                )
+                    store_query_key = self.settings.store_key.with_obj(_original_obj)
 
-                # update the object with new data
-                if overwrite:
-                    # Overwrite existing object and their values
-                    _original_obj = obj
-                else:
-                    for key, value in obj.to_dict(exclude_empty=True).items():
-                        if key == "id":
-                            # protected field
-                            continue
-                        setattr(_original_obj, key, value)
-
-                # update data and keys
-                self._set_data_and_keys(
-                    store_query_key=store_query_key,
-                    unique_query_keys=self.settings.unique_keys.with_obj(_original_obj),
-                    searchable_query_keys=self.settings.searchable_keys.with_obj(
-                        _original_obj
-                    ),
-                    # has been updated
-                    obj=_original_obj,
-                )
+                    # remove old keys
+                    self._remove_keys(
+                        store_key=store_query_key,
+                        unique_query_keys=_original_unique_keys,
+                        searchable_query_keys=_original_searchable_keys,
+                    )
 
-                # 🟡 TODO 28: Add locking in this transaction
+                    # update the object with new data
+                    if overwrite:
+                        # Overwrite existing object and their values
+                        _original_obj = obj
+                    else:
+                        for key, value in obj.to_dict(exclude_empty=True).items():
+                            if key == "id":
+                                # protected field
+                                continue
+                            setattr(_original_obj, key, value)
+
+                    # update data and keys
+                    self._set_data_and_keys(
+                        store_query_key=store_query_key,
+                        unique_query_keys=self.settings.unique_keys.with_obj(
+                            _original_obj
+                        ),
+                        searchable_query_keys=self.settings.searchable_keys.with_obj(
+                            _original_obj
+                        ),
+                        # has been updated
+                        obj=_original_obj,
+                    )
 
-                return Ok(_original_obj)
-            else:
-                return Err(f"Failed to update obj {obj}, you have no permission")
+                    # 🟡 TODO 28: Add locking in this transaction
+
+                    return Ok(_original_obj)
+                else:
+                    return Err(f"Failed to update obj {obj}, you have no permission")
 
         except Exception as e:
             return Err(f"Failed to update obj {obj} with error: {e}")
@@ -486,19 +536,20 @@ class KeyValueStorePartition(StorePartition):
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
         try:
-            if has_permission or self.has_permission(
-                ActionObjectWRITE(uid=qk.value, credentials=credentials)
-            ):
-                _obj = self.data.pop(qk.value)
-                self.permissions.pop(qk.value)
-                self.storage_permissions.pop(qk.value)
-                self._delete_unique_keys_for(_obj)
-                self._delete_search_keys_for(_obj)
-                return Ok(SyftSuccess(message="Deleted"))
-            else:
-                return Err(
-                    f"Failed to delete with query key {qk}, you have no permission"
-                )
+            with self.transaction():
+                if has_permission or self.has_permission(
+                    ActionObjectWRITE(uid=qk.value, credentials=credentials)
+                ):
+                    _obj = self.data.pop(qk.value)
+                    self.permissions.pop(qk.value)
+                    self.storage_permissions.pop(qk.value)
+                    self._delete_unique_keys_for(_obj)
+                    self._delete_search_keys_for(_obj)
+                    return Ok(SyftSuccess(message="Deleted"))
+                else:
+                    return Err(
+                        f"Failed to delete with query key {qk}, you have no permission"
+                    )
         except Exception as e:
             return Err(f"Failed to delete with query key {qk} with error: {e}")
 
@@ -513,8 +564,16 @@ class KeyValueStorePartition(StorePartition):
     def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
         for _search_ck in self.searchable_cks:
             qk = _search_ck.with_obj(obj)
+            pk_value = qk.value
+            if qk.type_list:
+                pk_value = " ".join([str(item) for item in pk_value])
             search_keys = self.searchable_keys[qk.key]
-            search_keys.pop(qk.value, None)
+            # other objects can have the same value, only this one is dropped
+            uids = search_keys.get(pk_value, [])
+            if obj.id in uids:
+                uids.remove(obj.id)
+            if not uids:
+                search_keys.pop(pk_value, None)
             self.searchable_keys[qk.key] = search_keys
         return Ok(SyftSuccess(message="Deleted"))
 
@@ -1,10 +1,15 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Container
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 
 # third party
 from pydantic import Field
 from pymongo import ASCENDING
+from pymongo import UpdateOne
 from pymongo.collection import Collection as MongoCollection
 from result import Err
 from result import Ok
@@ -40,12 +45,16 @@ from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
+from .document_store import paginate
 from .kv_document_store import KeyValueBackingStore
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .mongo_client import MongoClient
 from .mongo_client import MongoStoreClientConfig
 
+# number of results whose permissions are fetched with a single query
+MONGO_PERMISSION_BATCH_SIZE = 1000
+
 
 @serializable()
 class MongoDict(SyftBaseObject):
@@ -305,10 +314,11 @@ class MongoStorePartition(StorePartition):
                 credentials=credentials,
                 permission=ActionPermission.READ,
             )
-            self.add_permission(read_permission)
-
-            if add_permissions is not None:
-                self.add_permissions(add_permissions)
+            permissions_status = self.add_permissions(
+                [read_permission, *(add_permissions or [])]
+            )
+            if permissions_status.is_err():
+                return permissions_status
 
             if add_storage_permission:
                 self.add_storage_permission(
@@ -397,12 +407,19 @@ class MongoStorePartition(StorePartition):
         values: list = self._all(credentials=None, has_permission=True).ok()
         return {v.id: v for v in values}
 
+    def _to_syft_object(self, storage_obj: dict) -> SyftObject:
+        obj = self.storage_type(storage_obj)
+        transform_context = TransformContext(output={}, obj=obj)
+        return obj.to(self.settings.object_type, transform_context)
+
     def _get_all_from_store(
         self,
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        page_size: int | None = None,
+        page_index: int | None = 0,
     ) -> Result[list[SyftObject], str]:
         collection_status = self.collection
         if collection_status.is_err():
@@ -414,20 +431,33 @@ class MongoStorePartition(StorePartition):
         else:
             _default_key = "_id"
             storage_objs = collection.find(filter=qks.as_dict_mongo).sort(_default_key)
-        syft_objs = []
-        for storage_obj in storage_objs:
-            obj = self.storage_type(storage_obj)
-            transform_context = TransformContext(output={}, obj=obj)
-            syft_objs.append(obj.to(self.settings.object_type, transform_context))
-
-        # TODO: maybe do this in loop before this
-        res = []
-        for s in syft_objs:
-            if has_permission or self.has_permission(
-                ActionObjectREAD(uid=s.id, credentials=credentials)
-            ):
-                res.append(s)
-        return Ok(res)
+
+        if has_permission and page_size:
+            # every document is readable, so mongo can skip to the page
+            storage_objs = storage_objs.skip((page_index or 0) * page_size).limit(
+                page_size
+            )
+            page_index = 0
+
+        # the cursor is consumed lazily, only as far as the page reaches
+        res: Iterator[SyftObject] = (
+            self._to_syft_object(storage_obj) for storage_obj in storage_objs
+        )
+        if not has_permission:
+            res = self._filter_readable(credentials, res)
+        return Ok(paginate(res, page_size, page_index))
+
+    def _filter_readable(
+        self, credentials: SyftVerifyKey, syft_objs: Iterable[SyftObject]
+    ) -> Iterator[SyftObject]:
+        syft_objs = iter(syft_objs)
+        while batch := list(islice(syft_objs, MONGO_PERMISSION_BATCH_SIZE)):
+            permissions = [
+                ActionObjectREAD(uid=obj.id, credentials=credentials) for obj in batch
+            ]
+            for obj, readable in zip(batch, self._has_permissions(permissions)):
+                if readable:
+                    yield obj
 
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
@@ -464,6 +494,15 @@ class MongoStorePartition(StorePartition):
                 f"Object with qk: {qk} was deleted, but failed to delete its corresponding permission"
             )
 
+    def _find_permissions(
+        self, collection_permissions: MongoCollection, uids: Iterable[UID]
+    ) -> dict[UID, Any]:
+        """Fetch the permission strings of several objects in a single query"""
+        return {
+            permissions["_id"]: permissions["permissions"]
+            for permissions in collection_permissions.find({"_id": {"$in": list(uids)}})
+        }
+
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         """Check if the permission is inside the permission collection"""
         collection_permissions_status = self.permissions
@@ -478,6 +517,30 @@ class MongoStorePartition(StorePartition):
         if permissions is None:
             return False
 
+        return self._check_permission(permission, permissions["permissions"])
+
+    def has_permissions(self, permissions: list[ActionObjectPermission]) -> bool:
+        return all(self._has_permissions(permissions))
+
+    def _has_permissions(self, permissions: list[ActionObjectPermission]) -> list[bool]:
+        """Check several permissions, reading the permission collection once"""
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return [False] * len(permissions)
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        permission_strings = self._find_permissions(
+            collection_permissions, {permission.uid for permission in permissions}
+        )
+        return [
+            permission.uid in permission_strings
+            and self._check_permission(permission, permission_strings[permission.uid])
+            for permission in permissions
+        ]
+
+    def _check_permission(
+        self, permission: ActionObjectPermission, permission_strings: Container[str]
+    ) -> bool:
         # TODO: fix for other admins
         if (
             permission.credentials
@@ -485,7 +548,7 @@ class MongoStorePartition(StorePartition):
         ):
             return True
 
-        if permission.permission_string in permissions["permissions"]:
+        if permission.permission_string in permission_strings:
             return True
 
         # check ALL_READ permission
@@ -494,7 +557,7 @@ class MongoStorePartition(StorePartition):
             and ActionObjectPermission(
                 permission.uid, ActionPermission.ALL_READ
             ).permission_string
-            in permissions["permissions"]
+            in permission_strings
         ):
             return True
 
@@ -528,9 +591,39 @@ class MongoStorePartition(StorePartition):
                 {"_id": permission.uid}, {"$set": {"permissions": permission_strings}}
             )
 
-    def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
+    def add_permissions(
+        self, permissions: list[ActionObjectPermission]
+    ) -> Result[None, Err]:
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        new_permissions: dict[UID, set[str]] = {}
         for permission in permissions:
-            self.add_permission(permission)
+            new_permissions.setdefault(permission.uid, set()).add(
+                permission.permission_string
+            )
+        if not new_permissions:
+            return Ok(None)
+
+        # permission strings are stored as a serialized set, so they are merged
+        # here and written back with one upsert per object in a single request
+        permission_strings = self._find_permissions(
+            collection_permissions, new_permissions.keys()
+        )
+        collection_permissions.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": uid},
+                    {"$set": {"permissions": permission_strings.get(uid, set()) | new}},
+                    upsert=True,
+                )
+                for uid, new in new_permissions.items()
+            ],
+            ordered=False,
+        )
+        return Ok(None)
 
     def remove_permission(
         self, permission: ActionObjectPermission
@@ -651,7 +744,7 @@ class MongoStorePartition(StorePartition):
 
         # first person using this UID can claim ownership
         if permissions is None and data is None:
-            self.add_permissions(
+            permissions_status = self.add_permissions(
                 [
                     ActionObjectOWNER(uid=uid, credentials=credentials),
                     ActionObjectWRITE(uid=uid, credentials=credentials),
@@ -659,6 +752,8 @@ class MongoStorePartition(StorePartition):
                     ActionObjectEXECUTE(uid=uid, credentials=credentials),
                 ]
             )
+            if permissions_status.is_err():
+                return permissions_status
             return Ok(SyftSuccess(message=f"Ownership of ID: {uid} taken."))
 
         return Err(f"UID: {uid} already owned.")
@@ -668,6 +763,8 @@ class MongoStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        page_size: int | None = None,
+        page_index: int | None = 0,
     ) -> Result[list[SyftObject], str]:
         qks = QueryKeys(qks=())
         return self._get_all_from_store(
@@ -675,6 +772,8 @@ class MongoStorePartition(StorePartition):
             qks=qks,
             order_by=order_by,
             has_permission=has_permission,
+            page_size=page_size,
+            page_index=page_index,
         )
 
     def __len__(self) -> int:
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 # stdlib
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
 import sqlite3
@@ -21,32 +23,61 @@ from typing_extensions import Self
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..service.response import SyftSuccess
+from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.util import thread_ident
 from .document_store import DocumentStore
 from .document_store import PartitionSettings
+from .document_store import QueryKey
+from .document_store import QueryKeys
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
 from .kv_document_store import KeyValueBackingStore
 from .kv_document_store import KeyValueStorePartition
+from .kv_document_store import UniqueKeyCheck
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
 
 # here we can create a single connection per cache_key
 # since pytest is concurrent processes, we need to isolate each connection
-# by its filename and optionally the thread that its running in
-# we keep track of each SQLiteBackingStore init in REF_COUNTS
-# when it hits 0 we can close the connection and release the file descriptor
+# by its filename and the thread that its running in, so that WAL readers
+# in different threads never wait on each other
+# we keep track of each SQLiteBackingStore init per filename in REF_COUNTS
+# when it hits 0 we can close the connections and release the file descriptors
 SQLITE_CONNECTION_POOL_DB: dict[str, sqlite3.Connection] = {}
 SQLITE_CONNECTION_POOL_CUR: dict[str, sqlite3.Cursor] = {}
 REF_COUNTS: dict[str, int] = defaultdict(int)
+# number of rows SQLiteBackingStore.iter_items reads per query
+SQLITE_PAGE_SIZE = 100
+# nesting depth of SQLiteBackingStore.transaction per connection, statements
+# are only committed once the outermost transaction exits
+TRANSACTION_DEPTHS: dict[str, int] = defaultdict(int)
 
 
 def cache_key(db_name: str) -> str:
     return f"{db_name}_{thread_ident()}"
 
 
+def close_connections(db_name: str) -> None:
+    for key in list(SQLITE_CONNECTION_POOL_DB):
+        if key.rsplit("_", 1)[0] != db_name:
+            continue
+        SQLITE_CONNECTION_POOL_CUR.pop(key, None)
+        TRANSACTION_DEPTHS.pop(key, None)
+        SQLITE_CONNECTION_POOL_DB.pop(key).close()
+
+
+def reset_connection_pool() -> None:
+    """Forget the connections of the parent process after a fork, they must not
+    be used or closed by the child."""
+    SQLITE_CONNECTION_POOL_DB.clear()
+    SQLITE_CONNECTION_POOL_CUR.clear()
+    TRANSACTION_DEPTHS.clear()
+    REF_COUNTS.clear()
+
+
 def _repr_debug_(value: Any) -> str:
     if hasattr(value, "_repr_debug_"):
         return str(value._repr_debug_())
@@ -103,7 +134,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
         self.lock = SyftLock(NoLockingConfig())
         self.create_table()
-        REF_COUNTS[cache_key(self.db_filename)] += 1
+        REF_COUNTS[self.db_filename] += 1
 
     @property
     def table_name(self) -> str:
@@ -160,13 +191,13 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return SQLITE_CONNECTION_POOL_CUR[cache_key(self.db_filename)]
 
     def _close(self) -> None:
-        self._commit()
-        REF_COUNTS[cache_key(self.db_filename)] -= 1
-        if REF_COUNTS[cache_key(self.db_filename)] <= 0:
+        if not TRANSACTION_DEPTHS[cache_key(self.db_filename)]:
+            self._commit()
+        REF_COUNTS[self.db_filename] -= 1
+        if REF_COUNTS[self.db_filename] <= 0:
             # once you close it seems like other object references can't re-use the
             # same connection
-            self.db.close()
-            del SQLITE_CONNECTION_POOL_DB[cache_key(self.db_filename)]
+            close_connections(self.db_filename)
         else:
             # don't close yet because another SQLiteBackingStore is probably still open
             pass
@@ -174,6 +205,23 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def _commit(self) -> None:
         self.db.commit()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # all backing stores of a file share the connection of the current thread,
+        # so a transaction spans every table written to inside of it
+        key = cache_key(self.db_filename)
+        TRANSACTION_DEPTHS[key] += 1
+        try:
+            yield
+        except BaseException:
+            TRANSACTION_DEPTHS[key] -= 1
+            if TRANSACTION_DEPTHS[key] == 0:
+                self.db.rollback()
+            raise
+        TRANSACTION_DEPTHS[key] -= 1
+        if TRANSACTION_DEPTHS[key] == 0:
+            self._commit()
+
     def _execute(
         self, sql: str, *args: list[Any] | None
     ) -> Result[Ok[sqlite3.Cursor], Err[str]]:
@@ -190,7 +238,12 @@ class SQLiteBackingStore(KeyValueBackingStore):
             # rather than halting the program like disk I/O error etc
             # self.db.rollback()  # Roll back all changes if an exception occurs.
             # err = Err(str(e))
-            self.db.commit()  # Commit if everything went ok
+
+            # selects don't open a transaction, writes inside of self.transaction()
+            # are committed once it exits
+            key = cache_key(self.db_filename)
+            if self.db.in_transaction and not TRANSACTION_DEPTHS[key]:
+                self.db.commit()  # Commit if everything went ok
 
             # if err is not None:
             #     return err
@@ -246,7 +299,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return bool(row)
 
     def _get_all(self) -> Any:
-        select_sql = f"select * from {self.table_name} order by sqltime"  # nosec
+        select_sql = f"select * from {self.table_name} order by sqltime, rowid"  # nosec
         keys = []
         data = []
 
@@ -264,8 +317,24 @@ class SQLiteBackingStore(KeyValueBackingStore):
             data.append(_deserialize(row[2], from_bytes=True))
         return dict(zip(keys, data))
 
+    def iter_items(self, offset: int = 0) -> Iterator[tuple[UID, Any]]:
+        # fetched in pages of SQLITE_PAGE_SIZE rows so only one page is in memory
+        select_sql = (
+            f"select * from {self.table_name} order by sqltime, rowid limit ? offset ?"  # nosec
+        )
+        while True:
+            res = self._execute(select_sql, [SQLITE_PAGE_SIZE, offset])
+            if res.is_err():
+                raise ValueError(res.err())
+            rows = res.ok().fetchall()
+            for row in rows:
+                yield UID(row[0]), _deserialize(row[2], from_bytes=True)
+            if len(rows) < SQLITE_PAGE_SIZE:
+                return
+            offset += len(rows)
+
     def _get_all_keys(self) -> Any:
-        select_sql = f"select uid from {self.table_name} order by sqltime"  # nosec
+        select_sql = f"select uid from {self.table_name} order by sqltime, rowid"  # nosec
         keys = []
 
         res = self._execute(select_sql)
@@ -356,10 +425,94 @@ class SQLiteBackingStore(KeyValueBackingStore):
             pass
 
 
+INDEX_UNIQUE = "unique"
+INDEX_SEARCHABLE = "searchable"
+
+
+def index_value(value: Any) -> str:
+    return str(value)
+
+
+class SQLiteIndexStore(SQLiteBackingStore):
+    """Unique and searchable keys of a partition, one row per key and object.
+
+    Rows are looked up through an sql index on (kind, key, value), so queries
+    don't have to load the whole index of a key.
+    """
+
+    def create_table(self) -> None:
+        try:
+            with self.lock:
+                self.cur.execute(
+                    f"create table if not exists {self.table_name} ("  # nosec
+                    + "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                    + "uid VARCHAR(32) NOT NULL)"
+                )
+                self.cur.execute(
+                    f"create index if not exists {self.table_name}_lookup "  # nosec
+                    + f"on {self.table_name} (kind, key, value)"
+                )
+                self.cur.execute(
+                    f"create index if not exists {self.table_name}_uid "  # nosec
+                    + f"on {self.table_name} (uid)"
+                )
+                self.db.commit()
+        except Exception as e:
+            raise_exception(self.table_name, e)
+
+    def add(self, kind: str, key: str, value: Any, uid: UID) -> None:
+        insert_sql = (
+            f"insert into {self.table_name} (kind, key, value, uid) VALUES (?, ?, ?, ?)"  # nosec
+        )
+        res = self._execute(insert_sql, [kind, key, index_value(value), str(uid)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def remove_value(self, kind: str, key: str, value: Any) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} where kind = ? and key = ? and value = ?"  # nosec
+        )
+        res = self._execute(delete_sql, [kind, key, index_value(value)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def remove_uid(self, kind: str, key: str, uid: UID) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} where kind = ? and key = ? and uid = ?"  # nosec
+        )
+        res = self._execute(delete_sql, [kind, key, str(uid)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def find(self, kind: str, key: str, values: list[Any]) -> set[UID]:
+        placeholders = ", ".join("?" * len(values))
+        select_sql = (
+            f"select distinct uid from {self.table_name} "  # nosec
+            + f"where kind = ? and key = ? and value in ({placeholders})"
+        )
+        res = self._execute(
+            select_sql, [kind, key, *(index_value(value) for value in values)]
+        )
+        if res.is_err():
+            raise ValueError(res.err())
+        return {UID(row[0]) for row in res.ok().fetchall()}
+
+    def _len(self) -> int:
+        select_sql = f"select count(*) from {self.table_name}"  # nosec
+        res = self._execute(select_sql)
+        if res.is_err():
+            raise ValueError(res.err())
+        return res.ok().fetchone()[0]
+
+
 @serializable()
 class SQLiteStorePartition(KeyValueStorePartition):
     """SQLite StorePartition
 
+    Unique and searchable keys are kept in an indexed SQLiteIndexStore table
+    instead of the unique_keys and searchable_keys dicts of the base partition,
+    which are left empty.
+
     Parameters:
         `settings`: PartitionSettings
             PySyft specific settings, used for indexing and partitioning
@@ -367,6 +520,163 @@ class SQLiteStorePartition(KeyValueStorePartition):
             SQLite specific configuration
     """
 
+    def init_store(self) -> Result[Ok, Err]:
+        # created first, partitions opened concurrently can fail to seed the
+        # unique and searchable key dicts but are still used afterwards
+        try:
+            self.index = SQLiteIndexStore("index", self.settings, self.store_config)
+        except BaseException as e:
+            return Err(str(e))
+
+        store_status = super().init_store()
+        if store_status.is_err():
+            return store_status
+
+        try:
+            # partitions written before the index table existed
+            if len(self.index) == 0 and len(self.data) > 0:
+                self._rebuild_index()
+        except BaseException as e:
+            return Err(str(e))
+
+        return Ok(True)
+
+    def _rebuild_index(self) -> None:
+        with self.transaction():
+            for obj in self.data.values():
+                self._set_keys(
+                    store_query_key=self.settings.store_key.with_obj(obj),
+                    unique_query_keys=self.settings.unique_keys.with_obj(obj),
+                    searchable_query_keys=self.settings.searchable_keys.with_obj(obj),
+                )
+
+    def _set_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        uid = store_query_key.value
+        for qk in unique_query_keys.all:
+            # a unique value points to the last object it was set for
+            self.index.remove_value(INDEX_UNIQUE, qk.key, qk.value)
+            self.index.add(INDEX_UNIQUE, qk.key, qk.value, uid)
+
+        for qk in searchable_query_keys.all:
+            # list values are stored as one row per item
+            values = qk.value if qk.type_list else [qk.value]
+            for value in values:
+                self.index.add(INDEX_SEARCHABLE, qk.key, value, uid)
+
+    def _set_data_and_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+        obj: SyftObject,
+    ) -> None:
+        with self.transaction():
+            self._set_keys(
+                store_query_key=store_query_key,
+                unique_query_keys=unique_query_keys,
+                searchable_query_keys=searchable_query_keys,
+            )
+            self.data[store_query_key.value] = obj
+
+    def _remove_keys(
+        self,
+        store_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        with self.transaction():
+            for qk in unique_query_keys.all:
+                self.index.remove_uid(INDEX_UNIQUE, qk.key, store_key.value)
+            for qk in searchable_query_keys.all:
+                self.index.remove_uid(INDEX_SEARCHABLE, qk.key, store_key.value)
+
+    def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        for _unique_ck in self.unique_cks:
+            qk = _unique_ck.with_obj(obj)
+            self.index.remove_value(INDEX_UNIQUE, qk.key, qk.value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        uid = self.settings.store_key.with_obj(obj).value
+        for _search_ck in self.searchable_cks:
+            self.index.remove_uid(INDEX_SEARCHABLE, _search_ck.key, uid)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _get_keys_index(self, qks: QueryKeys) -> Result[set[Any], str]:
+        try:
+            unique_keys = {pk.key for pk in self.unique_cks}
+            # match AND
+            subsets: list = []
+            for qk in qks.all:
+                if qk.key not in unique_keys:
+                    return Err(f"Failed to query index with {qk}")
+                subset = self.index.find(INDEX_UNIQUE, qk.key, [qk.value])
+                if len(subset) == 0:
+                    # must be at least one in all query keys
+                    continue
+                subsets.append(subset)
+
+            if len(subsets) == 0:
+                return Ok(set())
+            return Ok(set.intersection(*subsets))
+        except Exception as e:
+            return Err(f"Failed to query with {qks}. {e}")
+
+    def _find_keys_search(self, qks: QueryKeys) -> Result[set[QueryKey], str]:
+        try:
+            searchable_keys = {pk.key for pk in self.searchable_cks}
+            # match AND
+            subsets = []
+            for qk in qks.all:
+                if qk.key not in searchable_keys:
+                    return Err(f"Failed to search with {qk}")
+                if qk.type_list:
+                    # match OR against all items of the list
+                    matches = (
+                        self.index.find(INDEX_SEARCHABLE, qk.key, list(qk.value))
+                        if len(qk.value)
+                        else set()
+                    )
+                    if len(matches):
+                        subsets.append(matches)
+                else:
+                    subsets.append(
+                        self.index.find(INDEX_SEARCHABLE, qk.key, [qk.value])
+                    )
+
+            if len(subsets) == 0:
+                return Ok(set())
+            return Ok(set.intersection(*subsets))
+        except Exception as e:
+            return Err(f"Failed to query with {qks}. {e}")
+
+    def _check_partition_keys_unique(
+        self, unique_query_keys: QueryKeys
+    ) -> UniqueKeyCheck:
+        # dont check the store key
+        qks = [
+            x
+            for x in unique_query_keys.all
+            if x.partition_key != self.settings.store_key
+        ]
+        matches = [
+            qk.key
+            for qk in qks
+            if len(self.index.find(INDEX_UNIQUE, qk.key, [qk.value])) > 0
+        ]
+
+        if len(matches) == 0:
+            return UniqueKeyCheck.EMPTY
+        elif len(matches) == len(qks):
+            return UniqueKeyCheck.MATCHES
+
+        return UniqueKeyCheck.ERROR
+
     def close(self) -> None:
         self.lock.acquire()
         try:
@@ -383,8 +693,6 @@ class SQLiteStorePartition(KeyValueStorePartition):
         self.lock.acquire()
         try:
             self.data._commit()
-            self.unique_keys._commit()
-            self.searchable_keys._commit()
         except BaseException:
             pass
         self.lock.release()
@@ -3,10 +3,12 @@ from collections.abc import Callable
 from collections.abc import Iterator
 from datetime import datetime
 from datetime import timedelta
+import hashlib
 import mimetypes
 from pathlib import Path
 from queue import Queue
 import sys
+from tempfile import SpooledTemporaryFile
 import threading
 from time import sleep
 from typing import Any
@@ -25,6 +27,7 @@ from ..client.client import SyftClient
 from ..node.credentials import SyftVerifyKey
 from ..serde import serialize
 from ..serde.serializable import serializable
+from ..serde.stream import iter_stream
 from ..service.action.action_object import ActionObject
 from ..service.action.action_object import ActionObjectPointer
 from ..service.action.action_object import BASE_PASSTHROUGH_ATTRS
@@ -50,6 +53,60 @@ if TYPE_CHECKING:
 
 READ_EXPIRATION_TIME = 1800  # seconds
 DEFAULT_CHUNK_SIZE = 10000 * 1024
+# uploads are serialized into memory up to this size, larger ones into a file
+BLOB_SPOOL_MAX_MEMORY = 64 * 1024 * 1024
+
+
+def file_checksum(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """sha256 hex digest of a file, read a chunk at a time."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+class SpooledBlob:
+    """An object serialized once for an upload, into a spooled temporary file.
+
+    The size and the checksum of the data are computed while it is written, so
+    the object doesn't have to be serialized again to allocate the blob.
+    """
+
+    def __init__(self, max_memory: int = BLOB_SPOOL_MAX_MEMORY) -> None:
+        self.file = SpooledTemporaryFile(max_size=max_memory)  # noqa: SIM115
+        self.size = 0
+        self._checksum = hashlib.sha256()
+
+    @classmethod
+    def from_obj(cls, obj: Any, stream: bool = False) -> Self:
+        """Serialize `obj`, in the stream format if `stream` is set."""
+        spooled = cls()
+        if stream:
+            for chunk in iter_stream(obj):
+                spooled.write(chunk)
+        else:
+            spooled.write(serialize._serialize(obj=obj, to_bytes=True))
+        spooled.file.seek(0)
+        return spooled
+
+    @property
+    def checksum(self) -> str:
+        return self._checksum.hexdigest()
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        self.file.write(chunk)
+        self._checksum.update(chunk)
+        self.size += len(chunk)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
 @serializable()
@@ -225,9 +282,11 @@ class SecureFilePathLocation(SyftObject):
 @serializable()
 class SeaweedSecureFilePathLocation(SecureFilePathLocation):
     __canonical_name__ = "SeaweedSecureFilePathLocation"
-    __version__ = SYFT_OBJECT_VERSION_3
+    __version__ = SYFT_OBJECT_VERSION_4
 
     upload_id: str | None = None
+    # ETags of the parts uploaded so far by part number, to resume the upload
+    uploaded_parts: dict[int, str] = {}
 
     def generate_url(
         self,
@@ -289,7 +348,7 @@ class AzureSecureFilePathLocation(SecureFilePathLocation):
 @serializable()
 class BlobStorageEntry(SyftObject):
     __canonical_name__ = "BlobStorageEntry"
-    __version__ = SYFT_OBJECT_VERSION_3
+    __version__ = SYFT_OBJECT_VERSION_4
 
     id: UID
     location: SecureFilePathLocation | SeaweedSecureFilePathLocation
@@ -300,8 +359,20 @@ class BlobStorageEntry(SyftObject):
     uploaded_by: SyftVerifyKey
     created_at: DateTime = DateTime.now()
     bucket_name: str | None = None
+    # sha256 hex digest of the data, if the uploader computed it
+    checksum: str | None = None
+    # set once all the data is written and the node verified the checksum,
+    # only uploaded entries are deduplicated
+    uploaded: bool = False
+    # allocations sharing the entry by user, see BlobStorageService.allocate
+    references: dict[SyftVerifyKey, int] = {}
 
-    __attr_searchable__ = ["bucket_name"]
+    __attr_searchable__ = ["bucket_name", "checksum"]
+
+    @property
+    def ref_count(self) -> int:
+        # entries that aren't allocated, e.g. mounted ones, have a single user
+        return sum(self.references.values()) or 1
 
 
 @serializable()
@@ -318,19 +389,24 @@ class BlobStorageMetadata(SyftObject):
 @serializable()
 class CreateBlobStorageEntry(SyftObject):
     __canonical_name__ = "CreateBlobStorageEntry"
-    __version__ = SYFT_OBJECT_VERSION_2
+    __version__ = SYFT_OBJECT_VERSION_3
 
     id: UID
     type_: type | None = None
     mimetype: str = "bytes"
     file_size: int
     extensions: list[str] = []
+    checksum: str | None = None
 
     @classmethod
     def from_obj(cls, obj: SyftObject) -> Self:
         file_size = sys.getsizeof(serialize._serialize(obj=obj, to_bytes=True))
         return cls(file_size=file_size, type_=type(obj))
 
+    @classmethod
+    def from_spooled(cls, spooled: SpooledBlob, type_: type | None) -> Self:
+        return cls(file_size=spooled.size, checksum=spooled.checksum, type_=type_)
+
     @classmethod
     def from_path(cls, fp: str | Path, mimetype: str | None = None) -> Self:
         path = Path(fp)
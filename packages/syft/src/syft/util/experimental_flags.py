@@ -20,6 +20,7 @@ class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+        self._MEMORY_MAP_BLOB_STORAGE = False
         self._CAN_REGISTER = str_to_bool(
             os.getenv(
                 "ENABLE_SIGNUP",
@@ -47,6 +48,14 @@ class ExperimentalFlags:
     def APACHE_ARROW_COMPRESSION(self, value: ApacheArrowCompression) -> None:
         self._APACHE_ARROW_COMPRESSION = value
 
+    @property
+    def MEMORY_MAP_BLOB_STORAGE(self) -> bool:
+        return self._MEMORY_MAP_BLOB_STORAGE
+
+    @MEMORY_MAP_BLOB_STORAGE.setter
+    def MEMORY_MAP_BLOB_STORAGE(self, value: bool) -> None:
+        self._MEMORY_MAP_BLOB_STORAGE = value
+
     @property
     def USE_NEW_SERVICE(self) -> bool:
         return str_to_bool(os.getenv("USE_NEW_SERVICE", "False"))
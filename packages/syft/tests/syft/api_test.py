@@ -1,16 +1,31 @@
 # stdlib
 from collections.abc import Callable
 from textwrap import dedent
+import time
 
 # third party
+from fastapi import Request
+from fastapi import Response
 import numpy as np
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import SyftAPIBatchCall
+from syft.client.api import SyftAPIBatchResult
+from syft.client.api import SyftAPICall
+from syft.node.routes import make_routes
 from syft.service.response import SyftAttributeError
+from syft.service.response import SyftError
+from syft.service.response import SyftException
+from syft.service.service import ServiceConfigRegistry
+from syft.service.service import UserServiceConfigRegistry
 from syft.service.user.user import UserUpdate
 from syft.service.user.user_roles import ServiceRole
+from syft.service.user.user_service import UserRoleCache
+
+# relative
+from ..utils.custom_markers import large_benchmark
 
 
 def test_api_cache_invalidation(worker):
@@ -37,10 +52,16 @@ def test_api_cache_invalidation(worker):
         return x + 1
 
     my_func.code = dedent(my_func.code)
+    verify_key = root_domain_client.credentials.verify_key
+    etag, _ = worker.get_api_bytes(verify_key, "dev")
 
     assert root_domain_client.code.request_code_execution(my_func)
     # check that function is added to api without refreshing the api manually
     assert isinstance(root_domain_client.code.my_func, Callable)
+    # and that the node does not serve the cached API without it
+    new_etag, api_bytes = worker.get_api_bytes(verify_key, "dev")
+    assert new_etag != etag
+    assert "code.call_my_func" in sy.deserialize(api_bytes, from_bytes=True).endpoints
 
 
 def test_api_cache_invalidation_login(root_verify_key, worker):
@@ -78,3 +99,256 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_user_service_config_registry_per_role(worker):
+    registry = UserServiceConfigRegistry.from_role(ServiceRole.DATA_SCIENTIST)
+    assert UserServiceConfigRegistry.from_role(ServiceRole.DATA_SCIENTIST) is registry
+    assert "user.get_all" not in registry
+    assert "user.get_all" in UserServiceConfigRegistry.from_role(ServiceRole.ADMIN)
+
+    # the registries are shared between calls and cannot be changed
+    with pytest.raises(TypeError):
+        registry.get_registered_configs()["user.get_all"] = None
+
+    # registering a new service config rebuilds them
+    config = ServiceConfigRegistry.get_registered_configs()["user.get_all"]
+    try:
+        ServiceConfigRegistry.register(
+            config.model_copy(update={"public_path": "user.get_all_copy"})
+        )
+        assert (
+            UserServiceConfigRegistry.from_role(ServiceRole.DATA_SCIENTIST)
+            is not registry
+        )
+        assert "user.get_all_copy" in UserServiceConfigRegistry.from_role(
+            ServiceRole.ADMIN
+        )
+    finally:
+        del ServiceConfigRegistry.__service_config_registry__["user.get_all_copy"]
+        ServiceConfigRegistry.__role_registries__.clear()
+
+
+def _api_calls_per_sec(worker, client, path: str, n_calls: int) -> float:
+    api_call = SyftAPICall(node_uid=worker.id, path=path, args=[], kwargs={})
+    signed_call = api_call.sign(client.api.signing_key)
+    start = time.time()
+    for _ in range(n_calls):
+        worker.handle_api_call(signed_call)
+    return n_calls / (time.time() - start)
+
+
+@large_benchmark()
+def test_trivial_api_calls_benchmark(worker, monkeypatch):
+    n_calls = 2_000
+    client = worker.root_client
+    paths = ["metadata", "user.get_current_user"]
+    cached = {path: _api_calls_per_sec(worker, client, path, n_calls) for path in paths}
+
+    # look up the role and filter the registry on every call, as before caching
+    def from_role(cls, role):
+        return cls(
+            {
+                k: config
+                for k, config in ServiceConfigRegistry.get_registered_configs().items()
+                if config.has_permission(role)
+            }
+        )
+
+    monkeypatch.setattr(UserServiceConfigRegistry, "from_role", classmethod(from_role))
+    monkeypatch.setattr(UserRoleCache, "get", lambda self, credentials: None)
+    uncached = {
+        path: _api_calls_per_sec(worker, client, path, n_calls) for path in paths
+    }
+
+    for path in paths:
+        print(
+            f"\n{path}: {uncached[path]:.0f} calls/s uncached, "
+            f"{cached[path]:.0f} calls/s cached"
+        )
+
+
+@sy.mock_api_endpoint()
+def mock_function(context) -> str:
+    return -42
+
+
+@sy.private_api_endpoint()
+def private_function(context) -> str:
+    return 42
+
+
+def test_api_bytes_cached_until_api_changes(worker):
+    root_client = worker.root_client
+    verify_key = root_client.credentials.verify_key
+    etag, api_bytes = worker.get_api_bytes(verify_key, "dev")
+    assert worker.get_api_bytes(verify_key, "dev") == (etag, api_bytes)
+    assert sy.deserialize(api_bytes, from_bytes=True).node_uid == worker.id
+
+    new_endpoint = sy.TwinAPIEndpoint(
+        path="testapi.query",
+        private_function=private_function,
+        mock_function=mock_function,
+    )
+    assert root_client.api.services.api.add(endpoint=new_endpoint)
+    new_etag, api_bytes = worker.get_api_bytes(verify_key, "dev")
+    assert new_etag != etag
+    assert "testapi.query" in sy.deserialize(api_bytes, from_bytes=True).endpoints
+
+    assert root_client.api.services.api.delete(endpoint_path="testapi.query")
+    assert worker.get_api_bytes(verify_key, "dev")[0] != new_etag
+
+
+def test_api_bytes_cached_per_role(worker):
+    root_client = worker.root_client
+    root_client.register(
+        name="a", email="a@b.org", password="aaa", password_verify="aaa"
+    )
+    ds_client = worker.guest_client.login(email="a@b.org", password="aaa")
+    verify_key = ds_client.credentials.verify_key
+    etag, api_bytes = worker.get_api_bytes(verify_key, "dev")
+    assert "user.get_all" not in sy.deserialize(api_bytes, from_bytes=True).endpoints
+
+    user_id = [u for u in worker.root_client.users if u.email == "a@b.org"][0].id
+    assert worker.root_client.api.services.user.update(
+        user_id, UserUpdate(role=ServiceRole.DATA_OWNER)
+    )
+    new_etag, api_bytes = worker.get_api_bytes(verify_key, "dev")
+    assert new_etag != etag
+    assert "user.get_all" in sy.deserialize(api_bytes, from_bytes=True).endpoints
+
+
+def test_api_route_not_modified(worker):
+    route = [r for r in make_routes(worker).routes if r.path == "/api"][0]
+    verify_key = str(worker.root_client.credentials.verify_key)
+
+    def get_api(if_none_match: str | None = None) -> Response:
+        headers = [] if if_none_match is None else [(b"if-none-match", if_none_match)]
+        request = Request({"type": "http", "headers": headers})
+        return route.endpoint(
+            request=request, verify_key=verify_key, communication_protocol="dev"
+        )
+
+    response = get_api()
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert sy.deserialize(response.body, from_bytes=True).node_uid == worker.id
+
+    response = get_api(if_none_match=etag.encode())
+    assert response.status_code == 304
+    assert response.body == b""
+
+    response = get_api(if_none_match=b'"old"')
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
+def test_api_batch_call(worker):
+    root_client = worker.root_client
+    root_client.register(
+        name="a", email="a@b.org", password="aaa", password_verify="aaa"
+    )
+    with root_client.batch() as batch:
+        me = root_client.api.services.user.get_current_user()
+        users = root_client.api.services.user.get_all()
+        missing = root_client.api.services.user.view(uid=sy.UID())
+        assert isinstance(me, SyftAPIBatchResult)
+        with pytest.raises(SyftException):
+            assert me.result
+
+        # paged access needs the result of get_all right away
+        with pytest.raises(SyftException):
+            root_client.api.services.user[0]
+        with pytest.raises(SyftException):
+            list(root_client.api.services.user)
+
+    assert len(batch.results) == 3
+    assert me.result.email == "info@openmined.org"
+    assert {u.email for u in users.result} == {"info@openmined.org", "a@b.org"}
+    assert isinstance(missing.result, SyftError)
+    # calls outside the batch are sent right away
+    assert root_client.api.services.user.get_current_user().email == me.result.email
+
+
+def test_api_batch_call_old_protocol(worker, monkeypatch):
+    api = worker.root_client.api
+    # released before batch calls, the calls are sent one by one
+    monkeypatch.setattr(api, "communication_protocol", 4)
+    sent = []
+    send_call = api._send_call
+
+    def recording_send_call(api_call):
+        sent.append(type(api_call))
+        return send_call(api_call)
+
+    monkeypatch.setattr(api, "_send_call", recording_send_call)
+    with api.batch():
+        me = api.services.user.get_current_user()
+        users = api.services.user.get_all()
+
+    assert sent == [SyftAPICall, SyftAPICall]
+    assert me.result.email == "info@openmined.org"
+    assert [u.email for u in users.result] == ["info@openmined.org"]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_api_batch_call_in_order(worker, parallel):
+    root_client = worker.root_client
+    calls = [
+        SyftAPICall(node_uid=worker.id, path=path, args=[], kwargs={})
+        for path in ["user.get_current_user", "metadata", "user.get_all"] * 4
+    ]
+    batch_call = SyftAPIBatchCall(node_uid=worker.id, calls=calls, parallel=parallel)
+    signed_call = batch_call.sign(root_client.api.signing_key)
+    results = worker.handle_api_call(signed_call).message.data
+
+    assert len(results) == len(calls)
+    for call, result in zip(calls, results):
+        if call.path == "metadata":
+            assert result.id == worker.id
+        elif call.path == "user.get_all":
+            assert isinstance(result, list)
+        else:
+            assert result.email == "info@openmined.org"
+
+
+def test_api_batch_call_checks_signature_and_role(worker):
+    guest_client = worker.guest_client
+    calls = [SyftAPICall(node_uid=worker.id, path="user.get_all", args=[], kwargs={})]
+    signed_call = SyftAPIBatchCall(node_uid=worker.id, calls=calls).sign(
+        guest_client.api.signing_key
+    )
+    results = worker.handle_api_call(signed_call).message.data
+    assert isinstance(results[0], SyftError)
+
+    signed_call.signature = b"0" * len(signed_call.signature)
+    assert isinstance(worker.handle_api_call(signed_call).message.data, SyftError)
+
+
+def test_api_module_indexes_page_views(worker, monkeypatch):
+    root_client = worker.root_client
+    for name in "abc":
+        root_client.register(
+            name=name,
+            email=f"{name}@b.org",
+            password="aaa",
+            password_verify="aaa",
+        )
+    users = root_client.api.services.user
+    emails = [user.email for user in users.get_all()]
+
+    calls = []
+    get_all = users.get_all
+
+    def counting_get_all(*args, **kwargs):
+        calls.append(kwargs)
+        return get_all(*args, **kwargs)
+
+    counting_get_all.signature = get_all.signature
+    monkeypatch.setattr(users, "get_all", counting_get_all)
+    # user.get_all returns a UserViewPage, it is indexed without a second call
+    assert users[1].email == emails[1]
+    assert calls == [{"page_size": 1, "page_index": 1}]
+    assert [user.email for user in users] == emails
+    with pytest.raises(IndexError):
+        users[len(emails)]
@@ -1,18 +1,39 @@
 # stdlib
+import hashlib
 import io
+from pathlib import Path
 import random
 
 # third party
+import numpy as np
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import APIRegistry
+from syft.node.credentials import SyftSigningKey
+from syft.node.node import AuthNodeContextRegistry
+from syft.serde.stream import is_stream_serde
+from syft.service.action import action_object
+from syft.service.action.action_data_cache import ActionDataCache
+from syft.service.action.action_data_empty import ActionDataEmpty
+from syft.service.action.action_permissions import ActionObjectREAD
 from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
 from syft.service.user.user import UserCreate
+from syft.service.user.user_roles import ServiceRole
 from syft.store.blob_storage import BlobDeposit
 from syft.store.blob_storage import SyftObjectRetrieval
+from syft.store.blob_storage import on_disk
+from syft.store.blob_storage.on_disk import OnDiskBlobRetrieval
+from syft.store.blob_storage.on_disk import OnDiskBlobStorageConnection
+from syft.types import blob_storage as blob_storage_types
+from syft.types.blob_storage import BlobFile
+from syft.types.blob_storage import BlobStorageEntry
 from syft.types.blob_storage import CreateBlobStorageEntry
+from syft.types.blob_storage import SpooledBlob
+from syft.util.experimental_flags import flags
 
 raw_data = {"test": "test"}
 data = sy.serialize(raw_data, to_bytes=True)
@@ -99,3 +120,283 @@ def test_blob_storage_delete(authed_context, blob_storage):
 
     with pytest.raises(FileNotFoundError):
         blob_storage.read(authed_context, blob_deposit.blob_storage_entry_id)
+
+
+def test_blob_storage_write_checksum(authed_context, blob_storage):
+    with SpooledBlob.from_obj(raw_data) as spooled:
+        blob_data = CreateBlobStorageEntry.from_spooled(spooled, type_=dict)
+        assert spooled.size == len(data)
+        assert spooled.checksum == hashlib.sha256(data).hexdigest()
+
+        blob_deposit = blob_storage.allocate(authed_context, blob_data)
+        entry = blob_storage.get_blob_storage_entry_by_uid(
+            authed_context, blob_deposit.blob_storage_entry_id
+        )
+        assert entry.checksum == spooled.checksum
+        assert isinstance(blob_deposit.write(spooled.file), SyftSuccess)
+
+    # corrupted uploads are rejected
+    blob_data = CreateBlobStorageEntry(
+        file_size=len(data), checksum=hashlib.sha256(b"other").hexdigest(), type_=dict
+    )
+    blob_deposit = blob_storage.allocate(authed_context, blob_data)
+    result = blob_deposit.write(io.BytesIO(data[:-1]))
+    assert isinstance(result, SyftError)
+
+
+def test_blob_storage_write_once_by_uploader(worker, authed_context, blob_storage):
+    with SpooledBlob.from_obj(raw_data) as spooled:
+        blob_data = CreateBlobStorageEntry.from_spooled(spooled, type_=dict)
+        blob_deposit = blob_storage.allocate(authed_context, blob_data)
+        uid = blob_deposit.blob_storage_entry_id
+        other_context = AuthedServiceContext(
+            node=worker, credentials=SyftSigningKey.generate().verify_key
+        )
+        blob_storage.stash.add_permission(
+            ActionObjectREAD(uid=uid, credentials=other_context.credentials)
+        )
+        result = blob_storage.write_to_disk(other_context, uid=uid, data=b"junk")
+        assert isinstance(result, SyftError)
+
+        # a failed upload leaves nothing behind at the entry's path
+        result = blob_storage.write_to_disk(authed_context, uid=uid, data=b"junk")
+        assert isinstance(result, SyftError)
+        entry = blob_storage.get_blob_storage_entry_by_uid(authed_context, uid)
+        assert list(Path(entry.location.path).parent.glob(f"{uid}*")) == []
+
+        assert isinstance(blob_deposit.write(spooled.file), SyftSuccess)
+
+    # uploaded data can't be overwritten or truncated
+    result = blob_storage.write_to_disk(authed_context, uid=uid, data=data)
+    assert isinstance(result, SyftError)
+    assert blob_storage.read(authed_context, uid).read() == raw_data
+
+
+def test_action_object_blob_serialized_once(
+    worker, authed_context, blob_storage, monkeypatch
+):
+    calls = []
+    iter_stream = blob_storage_types.iter_stream
+
+    def counting_iter_stream(obj):
+        calls.append(obj)
+        return iter_stream(obj)
+
+    monkeypatch.setattr(blob_storage_types, "iter_stream", counting_iter_stream)
+    array = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(array).send(worker.root_client)
+
+    assert len(calls) == 1
+    blob = blob_storage.read(authed_context, obj.syft_blob_storage_entry_id)
+    assert (blob.read() == array).all()
+
+
+def upload(context, blob_storage):
+    # deposits write through the node context of the uploader
+    AuthNodeContextRegistry.set_node_context(
+        context.node.id, context, context.credentials
+    )
+    with SpooledBlob.from_obj(raw_data) as spooled:
+        blob_data = CreateBlobStorageEntry.from_spooled(spooled, type_=dict)
+        blob_deposit = blob_storage.allocate(context, blob_data)
+        if isinstance(blob_deposit, BlobStorageEntry):
+            return blob_deposit.id
+        assert isinstance(blob_deposit.write(spooled.file), SyftSuccess)
+        return blob_deposit.blob_storage_entry_id
+
+
+@pytest.fixture
+def admin_context(worker):
+    yield AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key, role=ServiceRole.ADMIN
+    )
+
+
+def test_blob_storage_deduplicated_allocate(admin_context, blob_storage):
+    first = upload(admin_context, blob_storage)
+    second = upload(admin_context, blob_storage)
+    assert first == second
+
+    entry = blob_storage.get_blob_storage_entry_by_uid(admin_context, first)
+    assert entry.references == {admin_context.credentials: 2}
+    savings = blob_storage.get_storage_savings(admin_context)
+    assert savings["references"] == savings["entries"] + 1
+    assert savings["saved_bytes"] == entry.file_size
+
+    # the data is deleted with the last reference
+    assert isinstance(blob_storage.delete(admin_context, first), SyftSuccess)
+    assert blob_storage.read(admin_context, first).read() == raw_data
+    assert isinstance(blob_storage.delete(admin_context, first), SyftSuccess)
+    assert isinstance(blob_storage.read(admin_context, first), SyftError)
+
+
+def test_blob_storage_deduplication_needs_permission(
+    admin_context, other_context, blob_storage
+):
+    first = upload(admin_context, blob_storage)
+    # entries of other users are not shared with callers that can't read them
+    assert upload(other_context, blob_storage) != first
+
+
+@pytest.fixture
+def other_context(worker):
+    yield AuthedServiceContext(
+        node=worker,
+        credentials=SyftSigningKey.generate().verify_key,
+        role=ServiceRole.DATA_SCIENTIST,
+    )
+
+
+def test_blob_storage_deduplicated_references_per_user(
+    admin_context, other_context, blob_storage
+):
+    first = upload(admin_context, blob_storage)
+    blob_storage.stash.add_permission(
+        ActionObjectREAD(uid=first, credentials=other_context.credentials)
+    )
+    assert upload(other_context, blob_storage) == first
+    entry = blob_storage.get_blob_storage_entry_by_uid(admin_context, first)
+    assert entry.references == {
+        admin_context.credentials: 1,
+        other_context.credentials: 1,
+    }
+
+    # users only drop their own references
+    assert isinstance(blob_storage.delete(admin_context, first), SyftSuccess)
+    assert isinstance(blob_storage.delete(admin_context, first), SyftError)
+    assert blob_storage.read(other_context, first).read() == raw_data
+    assert isinstance(blob_storage.delete(other_context, first), SyftSuccess)
+    assert isinstance(blob_storage.read(admin_context, first), SyftError)
+
+
+def test_blob_storage_deduplication_trusts_data_owners(
+    admin_context, other_context, blob_storage
+):
+    first = upload(other_context, blob_storage)
+    # data uploaded by data scientists is only shared with themselves
+    assert upload(admin_context, blob_storage) != first
+    assert upload(other_context, blob_storage) == first
+
+
+def test_blob_storage_mark_write_complete_verifies_checksum(
+    authed_context, blob_storage, monkeypatch
+):
+    # multipart uploads are completed without checking the data
+    monkeypatch.setattr(
+        OnDiskBlobStorageConnection,
+        "complete_multipart_upload",
+        lambda self, obj, etags: SyftSuccess(message="Successfully saved file."),
+        raising=False,
+    )
+    blob_data = CreateBlobStorageEntry(
+        file_size=len(data), checksum=hashlib.sha256(b"other").hexdigest(), type_=dict
+    )
+    uid = blob_storage.allocate(authed_context, blob_data).blob_storage_entry_id
+    entry = blob_storage.get_blob_storage_entry_by_uid(authed_context, uid)
+    path = Path(entry.location.path)
+    path.write_bytes(data)
+
+    result = blob_storage.mark_write_complete(authed_context, uid=uid, etags=[])
+    assert isinstance(result, SyftError)
+    assert not path.exists()
+    entry = blob_storage.get_blob_storage_entry_by_uid(authed_context, uid)
+    assert not entry.uploaded
+
+
+def test_action_object_blob_deduplicated(worker):
+    root_client = worker.root_client
+    array = np.arange(10_000)
+    first = sy.ActionObject.from_obj(array).send(root_client)
+    second = sy.ActionObject.from_obj(array.copy()).send(root_client)
+
+    assert first.syft_blob_storage_entry_id == second.syft_blob_storage_entry_id
+    assert (root_client.api.services.action.get(second.id) == array).all()
+
+
+@pytest.fixture
+def range_reads(monkeypatch):
+    # small chunks, so the test files are written and read in many ranges
+    monkeypatch.setattr(on_disk, "DEFAULT_CHUNK_SIZE", 1024)
+    read_range = OnDiskBlobStorageConnection.read_range
+    lengths = []
+
+    def recording_read_range(self, fp, offset, length):
+        lengths.append(length)
+        return read_range(self, fp, offset, length)
+
+    monkeypatch.setattr(OnDiskBlobStorageConnection, "read_range", recording_read_range)
+    yield lengths
+
+
+def test_on_disk_blob_file_ranged_read(worker, range_reads, tmp_path):
+    root_client = worker.root_client
+    lines = [f"line {i}".encode() for i in range(2_000)]
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+
+    blob_file = BlobFile(file_name=path.name, path=path)
+    assert blob_file.upload_to_blobstorage(root_client) is None
+
+    retrieval = root_client.api.services.blob_storage.read(
+        blob_file.syft_blob_storage_entry_id
+    )
+    assert isinstance(retrieval, OnDiskBlobRetrieval)
+    assert list(blob_file._iter_lines(chunk_size=512)) == lines
+    assert range_reads and max(range_reads) <= 512
+    assert blob_file.read() == path.read_bytes()
+
+
+def test_on_disk_action_object_ranged_read(worker, range_reads, monkeypatch):
+    monkeypatch.setattr(action_object, "supports_flat_serde", lambda protocol: True)
+    array = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(array).send(worker.root_client)
+
+    assert (worker.root_client.api.services.action.get(obj.id) == array).all()
+    assert len(range_reads) > 1
+
+
+@pytest.mark.parametrize("new_protocol", [True, False])
+def test_action_object_blob_format_follows_protocol(
+    worker, authed_context, blob_storage, monkeypatch, new_protocol
+):
+    # clients on older protocols can't read streamed blobs
+    monkeypatch.setattr(
+        action_object, "supports_flat_serde", lambda protocol: new_protocol
+    )
+    array = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(array).send(worker.root_client)
+
+    blob = blob_storage.read(authed_context, obj.syft_blob_storage_entry_id)
+    assert is_stream_serde(blob.syft_object) is new_protocol
+    assert (blob.read() == array).all()
+    assert (worker.root_client.api.services.action.get(obj.id) == array).all()
+
+
+def test_memory_mapped_blob_storage(worker, blob_storage, monkeypatch):
+    monkeypatch.setattr(flags, "_MEMORY_MAP_BLOB_STORAGE", True)
+    # the node reads the blob itself instead of sharing the client's copy
+    monkeypatch.setattr(action_object, "ACTION_DATA_CACHE", ActionDataCache(max_size=0))
+    root_client = worker.root_client
+    array = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(array).send(root_client)
+
+    # clients get the data, the mapping stays on the node
+    assert (root_client.api.services.action.get(obj.id) == array).all()
+
+    # on the node there is no client api, reads go through the node context
+    monkeypatch.setattr(APIRegistry, "api_for", lambda node_uid, user_verify_key: None)
+    context = AuthedServiceContext(
+        node=worker, credentials=root_client.verify_key, role=ServiceRole.ADMIN
+    )
+    AuthNodeContextRegistry.set_node_context(worker.id, context, context.credentials)
+    node_obj = worker.get_service("ActionService")._get(context, obj.id).ok()
+    node_obj.syft_action_data_cache = ActionDataEmpty()
+    mapped = node_obj.syft_action_data
+    assert isinstance(mapped, np.memmap)
+    assert (mapped == array).all()
+
+    # mapped results can be serialized and stored again
+    restored = sy.deserialize(sy.serialize(mapped[2:5], to_bytes=True), from_bytes=True)
+    assert type(restored) is np.ndarray
+    again = sy.ActionObject.from_obj(mapped[2:5]).send(root_client)
+    assert (root_client.api.services.action.get(again.id) == array[2:5]).all()
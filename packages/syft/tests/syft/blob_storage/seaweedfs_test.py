@@ -0,0 +1,220 @@
+# stdlib
+import base64
+from collections import Counter
+import hashlib
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import io
+import threading
+import time
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+# third party
+import boto3
+import pytest
+
+# syft absolute
+from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftError
+from syft.service.response import SyftSuccess
+from syft.store.blob_storage import seaweedfs
+from syft.store.blob_storage.seaweedfs import SeaweedFSBlobDeposit
+from syft.store.blob_storage.seaweedfs import SeaweedFSClientConfig
+from syft.store.blob_storage.seaweedfs import SeaweedFSConnection
+from syft.types.blob_storage import BlobStorageEntry
+from syft.types.blob_storage import SeaweedSecureFilePathLocation
+from syft.types.grid_url import GridURL
+from syft.types.uid import UID
+
+PART_SIZE = 1024
+
+
+class S3PartHandler(BaseHTTPRequestHandler):
+    """Handles presigned upload_part PUTs like S3: the Content-MD5 header is
+    checked and the md5 of the part is returned as its ETag."""
+
+    def do_PUT(self) -> None:
+        server = self.server
+        part_no = int(parse_qs(urlparse(self.path).query)["partNumber"][0])
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with server.lock:
+            server.attempts[part_no] += 1
+            failure = server.failures.get((part_no, server.attempts[part_no]))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        # long enough for the uploads of the other parts to overlap
+        time.sleep(0.05)
+        with server.lock:
+            server.active -= 1
+
+        md5 = hashlib.md5(body, usedforsecurity=False)
+        if failure == "error":
+            self.send_response(500)
+        elif self.headers["Content-MD5"] != base64.b64encode(md5.digest()).decode():
+            self.send_response(400)
+        else:
+            server.parts[part_no] = body
+            etag = "0" * 32 if failure == "etag" else md5.hexdigest()
+            self.send_response(200)
+            self.send_header("ETag", f'"{etag}"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def s3():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), S3PartHandler)
+    server.lock = threading.Lock()
+    server.parts = {}
+    server.attempts = Counter()
+    server.failures = {}
+    server.active = 0
+    server.max_active = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def node_calls(monkeypatch):
+    calls = {
+        "blob_storage.mark_part_complete": [],
+        "blob_storage.mark_write_complete": [],
+    }
+
+    def from_api_or_context(func_or_path, **kwargs):
+        def service_method(**kwargs):
+            calls[func_or_path].append(kwargs)
+            return SyftSuccess(message="ok")
+
+        return service_method
+
+    monkeypatch.setattr(seaweedfs, "from_api_or_context", from_api_or_context)
+    yield calls
+
+
+def make_deposit(s3, data: bytes, **kwargs) -> SeaweedFSBlobDeposit:
+    host, port = s3.server_address
+    n_parts = -(-len(data) // PART_SIZE)
+    urls = [
+        GridURL.from_url(f"http://{host}:{port}/bucket/key?partNumber={i}&uploadId=1")
+        for i in range(1, n_parts + 1)
+    ]
+    return SeaweedFSBlobDeposit(
+        blob_storage_entry_id=UID(),
+        urls=urls,
+        size=len(data),
+        part_size=PART_SIZE,
+        **kwargs,
+    )
+
+
+def etag(part: bytes) -> str:
+    return f'"{hashlib.md5(part, usedforsecurity=False).hexdigest()}"'
+
+
+def split(data: bytes) -> list[bytes]:
+    return [data[i : i + PART_SIZE] for i in range(0, len(data), PART_SIZE)]
+
+
+data = b"".join(f"line {i}\n".encode() for i in range(1_000))
+
+
+def test_seaweedfs_parallel_upload(s3, node_calls):
+    deposit = make_deposit(s3, data, upload_workers=3)
+
+    assert isinstance(deposit.write(io.BytesIO(data)), SyftSuccess)
+
+    parts = split(data)
+    assert b"".join(s3.parts[i] for i in sorted(s3.parts)) == data
+    assert 1 < s3.max_active <= 3
+    assert sorted(
+        (call["part_no"], call["etag"])
+        for call in node_calls["blob_storage.mark_part_complete"]
+    ) == [(i, etag(part)) for i, part in enumerate(parts, start=1)]
+    (complete,) = node_calls["blob_storage.mark_write_complete"]
+    assert complete["etags"] == [
+        {"ETag": etag(part), "PartNumber": i} for i, part in enumerate(parts, start=1)
+    ]
+    assert complete["no_lines"] == 1_000
+
+
+def test_seaweedfs_upload_part_retry(s3, node_calls):
+    s3.failures = {(2, 1): "error", (3, 1): "etag"}
+    deposit = make_deposit(s3, data)
+
+    assert isinstance(deposit.write(io.BytesIO(data)), SyftSuccess)
+    assert s3.attempts[2] == s3.attempts[3] == 2
+    assert b"".join(s3.parts[i] for i in sorted(s3.parts)) == data
+
+
+def test_seaweedfs_upload_part_retries_exhausted(s3, node_calls):
+    s3.failures = {
+        (1, attempt): "error" for attempt in range(1, seaweedfs.PART_UPLOAD_RETRIES + 1)
+    }
+    deposit = make_deposit(s3, data)
+
+    assert isinstance(deposit.write(io.BytesIO(data)), SyftError)
+    assert s3.attempts[1] == seaweedfs.PART_UPLOAD_RETRIES
+    assert node_calls["blob_storage.mark_write_complete"] == []
+
+
+def test_seaweedfs_resume_upload(s3, node_calls):
+    parts = split(data)
+    uploaded = {1: etag(parts[0]), 2: etag(parts[1])}
+    deposit = make_deposit(s3, data, uploaded_parts=uploaded)
+
+    assert isinstance(deposit.write(io.BytesIO(data)), SyftSuccess)
+    assert 1 not in s3.attempts and 2 not in s3.attempts
+    (complete,) = node_calls["blob_storage.mark_write_complete"]
+    assert complete["etags"] == [
+        {"ETag": etag(part), "PartNumber": i} for i, part in enumerate(parts, start=1)
+    ]
+    assert complete["no_lines"] == 1_000
+
+
+def test_seaweedfs_mark_part_complete(worker, s3):
+    credentials = worker.signing_key.verify_key
+    blob_storage = worker.get_service("BlobStorageService")
+    context = AuthedServiceContext(node=worker, credentials=credentials)
+    entry = BlobStorageEntry(
+        location=SeaweedSecureFilePathLocation(path="key", upload_id="1"),
+        file_size=3 * seaweedfs.DEFAULT_FILE_PART_SIZE,
+        uploaded_by=credentials,
+    )
+    blob_storage.stash.set(credentials, entry)
+
+    result = blob_storage.mark_part_complete(
+        context, uid=entry.id, part_no=2, etag='"abc"'
+    )
+    assert isinstance(result, SyftSuccess)
+    stored = blob_storage.get_blob_storage_entry_by_uid(context, entry.id)
+    assert stored.location.uploaded_parts == {2: '"abc"'}
+
+    # a resumed deposit skips the parts that were uploaded
+    host, port = s3.server_address
+    config = SeaweedFSClientConfig(
+        host=host,
+        port=port,
+        access_key="key",
+        secret_key="secret",
+        region="us-east-1",
+        upload_workers=2,
+    )
+    client = boto3.client(
+        "s3",
+        endpoint_url=config.endpoint_url,
+        aws_access_key_id=config.access_key,
+        aws_secret_access_key=config.secret_key,
+        region_name=config.region,
+    )
+    with SeaweedFSConnection(client, config.default_bucket_name, config) as conn:
+        deposit = conn.write(stored)
+    assert len(deposit.urls) == 3
+    assert deposit.upload_workers == 2
+    assert deposit.uploaded_parts == {2: '"abc"'}
@@ -1,3 +1,30 @@
+# stdlib
+import asyncio
+import gzip
+from secrets import token_hex
+import time
+from types import SimpleNamespace
+
+# third party
+from fastapi import Request
+import pytest
+import requests
+
+# syft absolute
+import syft as sy
+from syft.client import aio
+from syft.client import connection
+from syft.client.api import SyftAPICall
+from syft.client.client import HTTPConnection
+from syft.client.connection import compress_payload
+from syft.client.connection import make_http_session
+from syft.node import routes
+from syft.node.routes import make_routes
+
+# relative
+from ..utils.custom_markers import large_benchmark
+
+
 def test_client_logged_in_user(worker):
     guest_client = worker.guest_client
     assert guest_client.logged_in_user == ""
@@ -15,3 +42,194 @@ def test_client_logged_in_user(worker):
     client = client.login(email="sheldon@caltech.edu", password="bazinga")
 
     assert client.logged_in_user == "sheldon@caltech.edu"
+
+
+def mock_api_session(worker, statuses: list[int]) -> object:
+    """A session answering /api requests with the route of `worker`."""
+    route = [r for r in make_routes(worker).routes if r.path == "/api"][0]
+
+    class MockSession:
+        def get(self, url, params, headers, **kwargs):
+            if_none_match = headers.get("If-None-Match")
+            request = Request(
+                {
+                    "type": "http",
+                    "headers": (
+                        []
+                        if if_none_match is None
+                        else [(b"if-none-match", if_none_match.encode())]
+                    ),
+                }
+            )
+            response = route.endpoint(request=request, **params)
+            statuses.append(response.status_code)
+            return SimpleNamespace(
+                url=url,
+                status_code=response.status_code,
+                headers=response.headers,
+                content=response.body,
+            )
+
+    return MockSession()
+
+
+def test_http_connection_reuses_unchanged_api(worker, monkeypatch):
+    statuses = []
+    monkeypatch.setattr(HTTPConnection, "session", mock_api_session(worker, statuses))
+    connection = HTTPConnection(url=f"http://{token_hex(4)}.localhost:8080")
+    credentials = worker.root_client.credentials
+
+    api = connection.get_api(credentials, "dev")
+    assert (
+        connection.get_api(credentials, "dev").endpoints.keys() == api.endpoints.keys()
+    )
+    assert statuses == [200, 304]
+
+
+def test_http_connection_api_cache_is_bounded(worker, monkeypatch):
+    monkeypatch.setattr(HTTPConnection, "session", mock_api_session(worker, []))
+    monkeypatch.setattr(HTTPConnection, "__api_cache__", {})
+    monkeypatch.setattr(HTTPConnection, "__api_cache_max_size__", 2)
+    credentials = worker.root_client.credentials
+
+    for _ in range(5):
+        connection = HTTPConnection(url=f"http://{token_hex(4)}.localhost:8080")
+        connection.get_api(credentials, "dev")
+        assert 0 < len(HTTPConnection.__api_cache__) <= 2
+
+
+def test_make_http_session_pool():
+    session = make_http_session(pool_size=4, max_retries=2)
+    adapter = session.get_adapter("http://localhost:8080")
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+
+
+def test_api_call_compressed(worker, monkeypatch):
+    route = [r for r in make_routes(worker).routes if r.path == "/api_call"][0]
+    credentials = worker.root_client.credentials
+    api_call = SyftAPICall(
+        node_uid=worker.id, path="user.get_current_user", args=[], kwargs={}
+    )
+    msg_bytes = sy.serialize(api_call.sign(credentials), to_bytes=True)
+
+    monkeypatch.setattr(connection, "HTTP_COMPRESSION", False)
+    assert compress_payload(msg_bytes) == (msg_bytes, {})
+
+    monkeypatch.setattr(connection, "HTTP_COMPRESSION", True)
+    data, headers = compress_payload(msg_bytes)
+    assert headers == {"Content-Encoding": "gzip"}
+    assert len(data) < len(msg_bytes)
+
+    request = Request({"type": "http", "headers": [(b"content-encoding", b"gzip")]})
+    response = route.endpoint(request=request, data=data)
+    assert response.headers["Content-Encoding"] == "gzip"
+    signed_result = sy.deserialize(gzip.decompress(response.body), from_bytes=True)
+    assert signed_result.message.data.email == "info@openmined.org"
+
+
+@pytest.mark.parametrize(
+    "data, status_code",
+    [
+        # decompresses to more than the limit
+        (gzip.compress(b"\0" * 10_000), 413),
+        (b"not gzip", 400),
+        (gzip.compress(b"\0" * 100)[:-10], 400),
+    ],
+)
+def test_api_call_compressed_invalid(worker, monkeypatch, data, status_code):
+    monkeypatch.setattr(routes, "MAX_API_CALL_SIZE", 1_000)
+    route = [r for r in make_routes(worker).routes if r.path == "/api_call"][0]
+
+    request = Request({"type": "http", "headers": [(b"content-encoding", b"gzip")]})
+    response = route.endpoint(request=request, data=data)
+    assert response.status_code == status_code
+
+
+def _sequential_calls_time(client, n_calls: int) -> float:
+    start = time.time()
+    for _ in range(n_calls):
+        client.api.services.user.get_current_user()
+    return time.time() - start
+
+
+@large_benchmark()
+def test_http_sequential_calls_benchmark(monkeypatch):
+    n_calls = 1_000
+    node = sy.orchestra.launch(name=token_hex(8), port="auto", reset=True)
+    try:
+        client = node.login(email="info@openmined.org", password="changethis")
+
+        pooled = _sequential_calls_time(client, n_calls)
+
+        monkeypatch.setattr(connection, "HTTP_COMPRESSION", True)
+        compressed = _sequential_calls_time(client, n_calls)
+        monkeypatch.setattr(connection, "HTTP_COMPRESSION", False)
+
+        # a new connection per call, as with a bare requests.post
+        monkeypatch.setattr(HTTPConnection, "session", requests)
+        unpooled = _sequential_calls_time(client, n_calls)
+    finally:
+        node.land()
+
+    print(
+        f"\n{n_calls} sequential calls: {unpooled:.3f}s new connections, "
+        f"{pooled:.3f}s pooled, {compressed:.3f}s pooled and compressed"
+    )
+
+
+def test_aio_client_concurrent_calls(worker):
+    async def main():
+        client = await sy.aio.login(
+            email="info@openmined.org", password="changethis", node=worker
+        )
+        user = client.api.services.user
+        users = await aio.gather(user.get_current_user() for _ in range(20))
+        ids = await user.view.map([u.id for u in users], limit=4)
+        return users, ids, await client.users.get_all()
+
+    users, views, all_users = asyncio.run(main())
+    assert {u.email for u in users} == {"info@openmined.org"}
+    assert [u.id for u in views] == [u.id for u in users]
+    assert len(all_users) == 1
+
+
+def test_aio_gather_bounded():
+    running = []
+    max_running = 0
+
+    async def call(i):
+        nonlocal max_running
+        running.append(i)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0.01)
+        running.remove(i)
+        return i
+
+    results = asyncio.run(aio.gather((call(i) for i in range(20)), limit=3))
+    assert results == list(range(20))
+    assert max_running == 3
+
+
+@large_benchmark()
+def test_aio_concurrent_calls_benchmark():
+    n_calls = 500
+    node = sy.orchestra.launch(name=token_hex(8), port="auto", reset=True)
+    try:
+        client = node.login(email="info@openmined.org", password="changethis")
+        sequential = _sequential_calls_time(client, n_calls)
+
+        async def main():
+            user = aio.AsyncSyftClient(client).api.services.user
+            start = time.time()
+            await aio.gather(user.get_current_user() for _ in range(n_calls))
+            return time.time() - start
+
+        concurrent = asyncio.run(main())
+    finally:
+        node.land()
+
+    print(
+        f"\n{n_calls} calls: {sequential:.3f}s sequential, "
+        f"{concurrent:.3f}s concurrent with sy.aio"
+    )
@@ -0,0 +1,138 @@
+# stdlib
+from collections import OrderedDict
+from textwrap import dedent
+from time import perf_counter
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.protocol.data_protocol import FLAT_SERDE_MIN_PROTOCOL
+from syft.protocol.data_protocol import supports_flat_serde
+from syft.serde.recursive_flat import FLAT_SERDE_HEADER
+from syft.serde.recursive_flat import is_flat_serde
+from syft.service.action.action_object import Action
+from syft.service.action.action_object import ActionObject
+from syft.service.job.job_stash import Job
+from syft.service.job.job_stash import JobStatus
+from syft.service.log.log import SyftLog
+from syft.service.response import SyftError
+from syft.types.uid import LineageID
+from syft.types.uid import UID
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        1,
+        "flat",
+        None,
+        [1, (2, 3.0), {"a": frozenset([4])}],
+        OrderedDict(a=[1], b={2}),
+        np.arange(10),
+        pd.DataFrame({"a": [1, 2]}),
+        int,
+        SyftLog(job_id=UID(), stdout="out"),
+    ],
+)
+def test_flat_serde_roundtrip(obj) -> None:
+    blob = sy.serialize(obj, to_bytes=True, flat=True)
+    assert is_flat_serde(blob)
+    assert not is_flat_serde(sy.serialize(obj, to_bytes=True))
+
+    result = sy.deserialize(blob, from_bytes=True)
+    assert type(result) is type(obj)
+    if isinstance(obj, np.ndarray):
+        assert (result == obj).all()
+    elif isinstance(obj, pd.DataFrame):
+        assert result.equals(obj)
+    else:
+        assert result == obj
+
+
+def test_flat_serde_header_is_not_a_capnp_message() -> None:
+    # a capnp message starts with its segment count - 1 as a little endian uint32
+    assert int.from_bytes(FLAT_SERDE_HEADER[:4], "little") == 2**32 - 1
+
+
+def test_supports_flat_serde() -> None:
+    assert supports_flat_serde("dev")
+    assert supports_flat_serde(FLAT_SERDE_MIN_PROTOCOL)
+    assert supports_flat_serde(str(FLAT_SERDE_MIN_PROTOCOL))
+    assert not supports_flat_serde(FLAT_SERDE_MIN_PROTOCOL - 1)
+    assert not supports_flat_serde(None)
+
+
+def test_signed_call_answers_in_request_format(worker) -> None:
+    root_client = worker.root_client
+    api_call = sy.client.api.SyftAPICall(
+        node_uid=worker.id, path="metadata", args=[], kwargs={}
+    )
+
+    for flat in (True, False):
+        signed_call = api_call.sign(root_client.api.signing_key, flat=flat)
+        assert signed_call.is_flat_serde == flat
+        signed_result = worker.handle_api_call(signed_call)
+        assert signed_result.is_flat_serde == flat
+        assert not isinstance(signed_result.message.data, SyftError)
+
+
+def serde_stats(obj, flat: bool, rounds: int = 3) -> tuple[int, float, float]:
+    encode = decode = 0.0
+    for _ in range(rounds):
+        start = perf_counter()
+        blob = sy.serialize(obj, to_bytes=True, flat=flat)
+        encode += perf_counter() - start
+
+        start = perf_counter()
+        sy.deserialize(blob, from_bytes=True)
+        decode += perf_counter() - start
+    return len(blob), encode / rounds, decode / rounds
+
+
+def test_flat_serde_benchmark(worker) -> None:
+    root_client = worker.root_client
+    dataset = sy.Dataset(
+        name="flat benchmark",
+        asset_list=[sy.Asset(name="a", data=np.arange(10), mock=np.arange(10))],
+    )
+    root_client.upload_dataset(dataset)
+
+    @sy.syft_function_single_use(x=root_client.datasets[0].assets[0])
+    def compute(x):
+        return x + 1
+
+    compute.code = dedent(compute.code)
+    request = root_client.code.request_code_execution(compute)
+
+    action = Action(
+        path="action.execute",
+        op="__add__",
+        remote_self=LineageID(),
+        args=[LineageID()],
+        kwargs={},
+    )
+    objs = {
+        "SyftAPI": worker.get_api(root_client.verify_key, "dev"),
+        "Job": Job(
+            id=UID(),
+            node_uid=worker.id,
+            action=action,
+            result=ActionObject.from_obj(np.arange(100)),
+            status=JobStatus.COMPLETED,
+        ),
+        "UserCode": request.code,
+    }
+
+    for name, obj in objs.items():
+        size, encode, decode = serde_stats(obj, flat=False)
+        flat_size, flat_encode, flat_decode = serde_stats(obj, flat=True)
+        print(
+            f"\n{name}: nested {size} bytes, encode {encode * 1000:.1f}ms, "
+            f"decode {decode * 1000:.1f}ms | flat {flat_size} bytes, "
+            f"encode {flat_encode * 1000:.1f}ms, decode {flat_decode * 1000:.1f}ms"
+        )
+        assert flat_size < size
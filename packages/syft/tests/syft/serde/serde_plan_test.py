@@ -0,0 +1,140 @@
+# stdlib
+from textwrap import dedent
+from time import perf_counter
+
+# third party
+import numpy as np
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.node.credentials import SyftSigningKey
+from syft.serde.recursive import SERDE_PLANS
+from syft.serde.recursive import TYPE_BANK
+from syft.serde.recursive import get_serde_plan
+from syft.serde.serializable import serializable
+from syft.service.log.log import SyftLog
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
+
+
+@serializable(attrs=["a", "b", "c"], without=["c"])
+class PlanExample:
+    def __init__(self, a: int, b: str, c: float) -> None:
+        self.a = a
+        self.b = b
+        self.c = c
+
+
+def get_fqn_for_class(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+def test_serde_plan_is_cached() -> None:
+    fqn = get_fqn_for_class(PlanExample)
+    plan = get_serde_plan(fqn)
+
+    assert get_serde_plan(fqn) is plan
+    assert [name for name, _ in plan.fields] == ["a", "b"]
+
+    blob = sy.serialize(PlanExample(1, "b", 3.0), to_bytes=True)
+    obj = sy.deserialize(blob, from_bytes=True)
+    assert (obj.a, obj.b) == (1, "b")
+    assert not hasattr(obj, "c")
+    assert plan.class_type is PlanExample
+
+
+def test_serde_plan_recompiled_on_register() -> None:
+    fqn = get_fqn_for_class(PlanExample)
+    plan = get_serde_plan(fqn)
+
+    serializable(attrs=["a", "b", "c"])(PlanExample)
+    try:
+        new_plan = get_serde_plan(fqn)
+        assert new_plan is not plan
+        assert [name for name, _ in new_plan.fields] == ["a", "b", "c"]
+    finally:
+        serializable(attrs=["a", "b", "c"], without=["c"])(PlanExample)
+
+
+def test_serde_plan_hashing_excludes_attrs() -> None:
+    log = SyftLog(job_id=UID(), stdout="out")
+    plan = get_serde_plan(get_fqn_for_class(SyftLog))
+
+    fields = [name for name, _ in plan.fields_for(log, for_hashing=False)]
+    hash_fields = [name for name, _ in plan.fields_for(log, for_hashing=True)]
+    assert "syft_node_location" in fields
+    assert "syft_node_location" not in hash_fields
+    assert log.hash() == SyftLog(id=log.id, job_id=log.job_id, stdout="out").hash()
+
+
+def common_syft_objects(root_client) -> list:
+    """Objects of the SyftObject types a typical session produces: the contents
+    of a node's stores after a dataset upload and code request, the API call
+    envelopes, and every SyftObject that can be built from defaults."""
+    dataset = sy.Dataset(
+        name="plan benchmark",
+        asset_list=[sy.Asset(name="a", data=np.arange(10), mock=np.arange(10))],
+    )
+    root_client.upload_dataset(dataset)
+
+    @sy.syft_function_single_use(x=root_client.datasets[0].assets[0])
+    def compute(x):
+        return x + 1
+
+    compute.code = dedent(compute.code)
+    root_client.code.request_code_execution(compute)
+
+    signing_key = SyftSigningKey.generate()
+    call = SyftAPICall(node_uid=UID(), path="log.get", args=[UID()], kwargs={"page": 1})
+    objs = [
+        call,
+        call.sign(signing_key),
+        SyftAPIData(data=SyftLog(job_id=UID())).sign(signing_key),
+        SyftLog(job_id=UID(), stdout="line\n" * 100),
+    ]
+
+    node = root_client.api.connection.node
+    for partition in node.document_store.partitions.values():
+        objs.extend(partition.data.values())
+
+    for serde_attributes in TYPE_BANK.values():
+        cls = serde_attributes[7]
+        if serde_attributes[0] or not isinstance(cls, type):
+            continue
+        if not issubclass(cls, SyftObject):
+            continue
+        try:
+            obj = cls()
+            sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+        except Exception:  # nosec
+            continue
+        objs.append(obj)
+
+    by_type: dict[type, object] = {}
+    for obj in objs:
+        by_type.setdefault(type(obj), obj)
+    return list(by_type.values())[:50]
+
+
+def roundtrip_per_second(objs: list, rounds: int, cold: bool) -> float:
+    start = perf_counter()
+    for _ in range(rounds):
+        for obj in objs:
+            if cold:
+                SERDE_PLANS.clear()
+            sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+    return rounds * len(objs) / (perf_counter() - start)
+
+
+def test_serde_plan_benchmark(root_domain_client) -> None:
+    objs = common_syft_objects(root_domain_client)
+    assert len(objs) >= 25
+
+    cold = roundtrip_per_second(objs, rounds=5, cold=True)
+    warm = roundtrip_per_second(objs, rounds=5, cold=False)
+    print(
+        f"\nserde round trips over {len(objs)} SyftObject types: "
+        f"{cold:.0f}/s recompiling plans, {warm:.0f}/s with compiled plans"
+    )
@@ -0,0 +1,284 @@
+# stdlib
+from io import BytesIO
+import multiprocessing
+import resource
+import shutil
+import tracemalloc
+
+# third party
+import numpy as np
+import pandas as pd
+import psutil
+import pyarrow as pa
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.stream import STREAM_SERDE_HEADER
+from syft.serde.stream import StreamReader
+from syft.serde.stream import is_stream_serde
+from syft.serde.stream import stream_size
+from syft.service.log.log import SyftLog
+from syft.types.uid import UID
+
+# relative
+from ...utils.custom_markers import large_benchmark
+
+MB = 2**20
+
+
+class ChunkRecorder(BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.max_write = 0
+
+    def write(self, data) -> int:
+        self.max_write = max(self.max_write, memoryview(data).nbytes)
+        return super().write(data)
+
+
+class ReadOnlyFile:
+    """A file object without readinto, like some socket wrappers."""
+
+    def __init__(self, data: bytes) -> None:
+        self._file = BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+
+def roundtrip(obj, chunk_size: int = 1024):
+    fileobj = BytesIO()
+    sy.serialize_to_stream(obj, fileobj, chunk_size=chunk_size)
+    fileobj.seek(0)
+    return sy.deserialize_from_stream(fileobj, chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(10_000, dtype=np.float64),
+        np.arange(12).reshape(3, 4),
+        np.asfortranarray(np.arange(12).reshape(3, 4)),
+        np.arange(100)[::3],
+        np.array(5),
+        np.empty((0, 3)),
+        np.array(["a", "bc"]),
+        np.array(["2024-01-01"], dtype="datetime64[D]"),
+        np.array([True, False]),
+    ],
+)
+def test_stream_numpy_roundtrip(array: np.ndarray) -> None:
+    result = roundtrip(array)
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert (result == array).all()
+    assert result.flags.writeable
+
+
+def test_stream_dataframe_roundtrip() -> None:
+    df = pd.DataFrame({"a": np.arange(1000), "b": [str(i) for i in range(1000)]})
+    assert roundtrip(df).equals(df)
+
+
+def test_stream_arrow_roundtrip() -> None:
+    table = pa.table({"a": np.arange(1000), "b": [str(i) for i in range(1000)]})
+    assert roundtrip(table).equals(table)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": [1, 2.0]},
+        SyftLog(job_id=UID(), stdout="out"),
+    ],
+)
+def test_stream_fallback_roundtrip(obj) -> None:
+    result = roundtrip(obj)
+    if isinstance(obj, np.ndarray):
+        assert result.tolist() == obj.tolist()
+    else:
+        assert result == obj
+
+
+def test_stream_writes_bounded_chunks() -> None:
+    array = np.arange(100_000, dtype=np.int64)
+    fileobj = ChunkRecorder()
+    sy.serialize_to_stream(array, fileobj, chunk_size=4096)
+    assert fileobj.max_write <= 4096
+    assert len(fileobj.getvalue()) > array.nbytes
+
+
+def test_stream_without_readinto() -> None:
+    array = np.arange(10_000)
+    fileobj = BytesIO()
+    sy.serialize_to_stream(array, fileobj)
+    result = sy.deserialize_from_stream(ReadOnlyFile(fileobj.getvalue()))
+    assert (result == array).all()
+
+
+def test_stream_bytes_are_deserializable() -> None:
+    fileobj = BytesIO()
+    sy.serialize_to_stream(np.arange(10), fileobj)
+    blob = fileobj.getvalue()
+    assert is_stream_serde(blob)
+    assert blob.startswith(STREAM_SERDE_HEADER)
+    assert (sy.deserialize(blob, from_bytes=True) == np.arange(10)).all()
+
+
+def test_stream_rejects_other_formats() -> None:
+    with pytest.raises(ValueError):
+        sy.deserialize_from_stream(BytesIO(sy.serialize(1, to_bytes=True)))
+    with pytest.raises(EOFError):
+        sy.deserialize_from_stream(BytesIO(STREAM_SERDE_HEADER[:3]))
+
+
+def write_stream(obj, tmp_path):
+    path = tmp_path / "stream.bin"
+    with open(path, "wb") as fileobj:
+        sy.serialize_to_stream(obj, fileobj)
+    return path
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(10_000, dtype=np.float64),
+        np.asfortranarray(np.arange(12).reshape(3, 4)),
+        np.array(5),
+        np.empty((0, 3)),
+    ],
+)
+def test_memory_map_numpy(array: np.ndarray, tmp_path) -> None:
+    path = write_stream(array, tmp_path)
+    result = sy.deserialize_from_file(path, memory_map=True)
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert (result == array).all()
+    assert (sy.deserialize_from_file(path) == array).all()
+
+
+def test_memory_map_numpy_is_copy_on_write(tmp_path) -> None:
+    array = np.arange(1000)
+    path = write_stream(array, tmp_path)
+    result = sy.deserialize_from_file(path, memory_map=True)
+    assert isinstance(result, np.memmap)
+    result[:] = 0
+    assert (sy.deserialize_from_file(path, memory_map=True) == array).all()
+
+
+def test_memory_map_arrow_and_dataframe(tmp_path) -> None:
+    df = pd.DataFrame({"a": np.arange(1000), "b": [str(i) for i in range(1000)]})
+    path = write_stream(df, tmp_path)
+    assert sy.deserialize_from_file(path, memory_map=True).equals(df)
+
+    table = pa.Table.from_pandas(df)
+    path = write_stream(table, tmp_path)
+    assert sy.deserialize_from_file(path, memory_map=True).equals(table)
+
+
+def test_memory_map_other_formats(tmp_path) -> None:
+    obj = {"a": [1, 2.0], "b": "c"}
+    path = write_stream(obj, tmp_path)
+    assert sy.deserialize_from_file(path, memory_map=True) == obj
+
+    path.write_bytes(sy.serialize(obj, to_bytes=True))
+    assert sy.deserialize_from_file(path, memory_map=True) == obj
+    assert sy.deserialize_from_file(path) == obj
+
+
+def test_memory_map_does_not_read_payload(tmp_path) -> None:
+    array = np.random.randint(0, 255, size=16 * MB, dtype=np.uint8)
+    path = write_stream(array, tmp_path)
+
+    tracemalloc.start()
+    result = sy.deserialize_from_file(path, memory_map=True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < MB
+    assert (result == array).all()
+
+
+def peak_rss_growth(func, size: int) -> float:
+    """Runs func on a `size` byte numpy array in a forked process, returning
+    how far its peak RSS rose above the RSS it started with, as a multiple of
+    the payload size."""
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+
+    def target() -> None:
+        array = np.full(size, 7, dtype=np.uint8)
+        start = psutil.Process().memory_info().rss
+        func(array)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        queue.put(max(peak - start, 0) / size)
+
+    process = context.Process(target=target)
+    process.start()
+    growth = queue.get(timeout=600)
+    process.join()
+    return growth
+
+
+def _run_benchmark(size: int, tmp_path) -> None:
+    path = tmp_path / "stream.bin"
+
+    def upload_bytes(array: np.ndarray) -> None:
+        # what blob uploads did before, the payload is serialized in memory
+        with open(path, "wb") as fileobj:
+            shutil.copyfileobj(BytesIO(sy.serialize(array, to_bytes=True)), fileobj)
+
+    def upload_stream(array: np.ndarray) -> None:
+        with open(path, "wb") as fileobj:
+            shutil.copyfileobj(StreamReader(array, chunk_size=MB), fileobj, MB)
+
+    def read_stream(array: np.ndarray) -> None:
+        with open(path, "rb") as fileobj:
+            assert sy.deserialize_from_stream(fileobj, chunk_size=MB).shape == (size,)
+
+    bytes_growth = peak_rss_growth(upload_bytes, size)
+    stream_growth = peak_rss_growth(upload_stream, size)
+    read_growth = peak_rss_growth(read_stream, size)
+    print(
+        f"\nupload {size // MB} MB numpy array: peak RSS grows by "
+        f"{bytes_growth:.2f}x payload from bytes, {stream_growth:.2f}x streamed, "
+        f"reading it back {read_growth:.2f}x"
+    )
+    # streaming only holds a chunk at a time, reading only allocates the result
+    assert stream_growth * size < 16 * MB
+    assert read_growth < 1.25
+    assert bytes_growth > 0.75
+
+
+def test_stream_benchmark_64mb(tmp_path) -> None:
+    _run_benchmark(64 * MB, tmp_path)
+
+
+@large_benchmark()
+@pytest.mark.parametrize("size", [1024 * MB, 4096 * MB])
+def test_stream_benchmark_large(size: int, tmp_path) -> None:
+    _run_benchmark(size, tmp_path)
+
+
+def test_stream_reader_matches_stream() -> None:
+    df = pd.DataFrame({"x": np.arange(10_000), "y": [str(i) for i in range(10_000)]})
+    for obj in [np.arange(10_000).reshape(100, 100), df, {"a": [1, 2]}]:
+        fileobj = BytesIO()
+        sy.serialize_to_stream(obj, fileobj, chunk_size=1024)
+        reader = StreamReader(obj, chunk_size=1024)
+        # reads are filled up to the requested size until the stream ends
+        first = reader.read(100)
+        assert len(first) == 100
+        assert first + reader.read() == fileobj.getvalue()
+        assert stream_size(obj, chunk_size=1024) == len(fileobj.getvalue())
+
+
+def test_stream_dataframe_in_batches() -> None:
+    df = pd.DataFrame({"x": np.arange(10_000, dtype=np.int64)}, index=np.arange(10_000))
+    fileobj = ChunkRecorder()
+    sy.serialize_to_stream(df, fileobj, chunk_size=8 * 1024)
+    # the frame is converted a slice at a time instead of as one table
+    assert fileobj.max_write < 32 * 1024
+    fileobj.seek(0)
+    assert sy.deserialize_from_stream(fileobj).equals(df)
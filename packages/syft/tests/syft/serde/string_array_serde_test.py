@@ -0,0 +1,74 @@
+# stdlib
+from time import perf_counter
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import arraytoarrowutf8
+from syft.serde.arrow import arraytonumpyutf8
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_serialize
+from syft.serde.arrow import numpyutf8toarray
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(["a", "bc", "", "déjà vu", "🐍"]),
+        np.array([["a", "b"], ["c", "dddd"]]),
+        np.array("scalar"),
+        np.array([], dtype=str),
+        np.empty((0, 2), dtype="<U3"),
+    ],
+)
+@pytest.mark.parametrize("flat", [False, True])
+def test_string_array_roundtrip(array: np.ndarray, flat: bool) -> None:
+    blob = sy.serialize(array, to_bytes=True, flat=flat)
+    result = sy.deserialize(blob, from_bytes=True)
+    # only the flat format keeps the itemsize of empty arrays
+    assert result.dtype == array.dtype if flat else result.dtype.kind == "U"
+    assert result.shape == array.shape
+    assert (result == array).all()
+
+
+def test_string_array_format_follows_flat_serde() -> None:
+    array = np.array([["a", "déjà"], ["", "vu"]])
+    # peers on older protocols can still decode the nested format
+    layout = sy.deserialize(numpy_serialize(array), from_bytes=True)
+    assert isinstance(layout, np.ndarray)
+    assert (numpyutf8toarray(layout) == array).all()
+
+    result = numpy_deserialize(arraytoarrowutf8(array))
+    assert result.shape == array.shape
+    assert (result == array).all()
+
+
+def test_string_array_is_not_widened() -> None:
+    array = np.array([str(i) for i in range(10_000)])
+    utf8_size = sum(len(item) for item in array.tolist())
+    new_size = len(arraytoarrowutf8(array))
+    assert new_size < 2 * utf8_size + 8 * len(array) + 1024
+    assert new_size < len(arraytonumpyutf8(array))
+
+
+def test_string_array_benchmark_1m() -> None:
+    array = np.array([f"item-{i}" for i in range(1_000_000)])
+
+    start = perf_counter()
+    blob = sy.serialize(array, to_bytes=True, flat=True)
+    encode = perf_counter() - start
+
+    start = perf_counter()
+    result = sy.deserialize(blob, from_bytes=True)
+    decode = perf_counter() - start
+
+    print(
+        f"\n1M element string array: {len(blob) / 2**20:.1f} MB, "
+        f"encode {encode:.3f}s, decode {decode:.3f}s"
+    )
+    assert (result == array).all()
+    # utf-8 data plus 8 byte offsets, instead of 8 bytes per utf-8 byte
+    assert len(blob) < 32 * 2**20
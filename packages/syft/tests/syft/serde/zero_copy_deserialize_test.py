@@ -0,0 +1,80 @@
+# stdlib
+from time import perf_counter
+import tracemalloc
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import combine_bytes
+from syft.service.action.action_object import ActionObject
+
+# relative
+from ...utils.custom_markers import large_benchmark
+
+MB = 2**20
+
+
+def test_combine_bytes_single_chunk_is_not_copied() -> None:
+    chunk = b"a" * 1024
+    assert combine_bytes([chunk]) is chunk
+
+
+def test_combine_bytes_multi_chunk() -> None:
+    chunks = [b"a" * 10, b"b" * 5, b"", b"c" * 3]
+    combined = combine_bytes(chunks)
+    assert isinstance(combined, bytearray)
+    assert combined == b"".join(chunks)
+
+
+@pytest.mark.parametrize("blob_type", [bytes, bytearray, memoryview])
+def test_deserialize_bytes_like(blob_type: type) -> None:
+    obj = {"a": [1, 2.0, "three"], "b": np.arange(10), "c": b"raw"}
+    blob = blob_type(sy.serialize(obj, to_bytes=True))
+    result = sy.deserialize(blob, from_bytes=True)
+    assert result["a"] == obj["a"]
+    assert (result["b"] == obj["b"]).all()
+    assert result["c"] == b"raw"
+    assert isinstance(result["c"], bytes)
+
+
+def deserialize_benchmark(size: int) -> tuple[float, float]:
+    """Returns the wall time and the peak allocation of deserializing an
+    ActionObject wrapping a `size` byte numpy array, the latter expressed as a
+    multiple of the payload size (i.e. the number of payload copies)."""
+    data = np.random.randint(0, 255, size=size, dtype=np.uint8)
+    blob = sy.serialize(ActionObject.from_obj(data), to_bytes=True)
+
+    tracemalloc.start()
+    start = perf_counter()
+    result = sy.deserialize(blob, from_bytes=True)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert (result.syft_action_data == data).all()
+    return elapsed, peak / size
+
+
+def _run_benchmark(size: int) -> None:
+    elapsed, copies = deserialize_benchmark(size)
+    print(
+        f"\ndeserialize {size // MB} MB numpy ActionObject: "
+        f"{elapsed:.3f}s, peak allocation {copies:.2f}x payload"
+    )
+    # one copy for each capnp nesting level we read the payload out of,
+    # plus the final array; without the zero-copy path this grows with
+    # every level of nesting
+    assert copies < 6
+
+
+def test_deserialize_benchmark_1mb() -> None:
+    _run_benchmark(1 * MB)
+
+
+@large_benchmark()
+@pytest.mark.parametrize("size", [100 * MB, 1024 * MB])
+def test_deserialize_benchmark_large(size: int) -> None:
+    _run_benchmark(size)
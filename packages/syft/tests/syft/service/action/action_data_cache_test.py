@@ -0,0 +1,174 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.service.action import action_object
+from syft.service.action.action_data_cache import ActionDataCache
+from syft.service.action.action_data_empty import ActionDataEmpty
+from syft.service.blob_storage import service as blob_storage_service
+from syft.service.blob_storage.service import BlobStorageService
+from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftSuccess
+from syft.types.uid import UID
+
+verify_key = SyftSigningKey.generate().verify_key
+
+
+def array(size: int) -> np.ndarray:
+    return np.zeros(size // 8, dtype=np.int64)
+
+
+def test_action_data_cache_lru():
+    cache = ActionDataCache(max_size=2_000, disk_dir=None)
+    first, second, third = UID(), UID(), UID()
+
+    assert isinstance(cache.get(first, verify_key), ActionDataEmpty)
+    cache.put(first, verify_key, array(800))
+    cache.put(second, verify_key, array(800))
+    # first is now the most recently used, second is evicted by third
+    assert cache.get(first, verify_key).nbytes == 800
+    cache.put(third, verify_key, array(800))
+
+    assert isinstance(cache.get(second, verify_key), ActionDataEmpty)
+    assert cache.get(third, verify_key).nbytes == 800
+    assert cache.stats["size"] == 1_600
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 2, 1)
+
+    # larger than the budget, not cached
+    cache.put(second, verify_key, array(4_000))
+    assert isinstance(cache.get(second, verify_key), ActionDataEmpty)
+
+
+def test_action_data_cache_per_reader():
+    cache = ActionDataCache(max_size=2_000, disk_dir=None)
+    uid = UID()
+    cache.put(uid, verify_key, array(800))
+
+    other_key = SyftSigningKey.generate().verify_key
+    assert isinstance(cache.get(uid, other_key), ActionDataEmpty)
+
+
+def test_action_data_cache_disk_tier(tmp_path):
+    cache = ActionDataCache(max_size=1_000, disk_dir=tmp_path, max_disk_size=2_000)
+    first, second, third = UID(), UID(), UID()
+    data = np.arange(100)
+
+    cache.put(first, verify_key, data)
+    cache.put(second, verify_key, array(800))
+    assert cache.stats["disk_entries"] == 1
+
+    # read back from disk and moved to memory, spilling second
+    assert (cache.get(first, verify_key) == data).all()
+    assert cache.disk_hits == 1
+    assert cache.stats["entries"] == cache.stats["disk_entries"] == 1
+
+    # the disk budget evicts the least recently used data
+    cache.put(third, verify_key, array(800))
+    cache.put(UID(), verify_key, array(800))
+    assert isinstance(cache.get(second, verify_key), ActionDataEmpty)
+    assert len(list(tmp_path.iterdir())) == cache.stats["disk_entries"] == 2
+
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_action_data_cache_reader_copies():
+    cache = ActionDataCache(max_size=10_000, disk_dir=None)
+    array_uid, list_uid = UID(), UID()
+    cache.put(array_uid, verify_key, np.arange(100))
+    cache.put(list_uid, verify_key, [1, 2, 3])
+
+    cache.get(array_uid, verify_key)[0] = -1
+    cache.get(list_uid, verify_key).append(4)
+    assert cache.get(array_uid, verify_key)[0] == 0
+    assert cache.get(list_uid, verify_key) == [1, 2, 3]
+
+
+def test_action_data_cache_invalidate(tmp_path):
+    cache = ActionDataCache(max_size=1_000, disk_dir=tmp_path)
+    uid, other = UID(), UID()
+    other_key = SyftSigningKey.generate().verify_key
+    cache.put(uid, verify_key, array(800))
+    # spills the data of the first reader to disk
+    cache.put(uid, other_key, array(800))
+    cache.put(other, verify_key, array(80))
+
+    cache.invalidate(uid)
+    assert isinstance(cache.get(uid, verify_key), ActionDataEmpty)
+    assert isinstance(cache.get(uid, other_key), ActionDataEmpty)
+    assert cache.get(other, verify_key).nbytes == 80
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    cache = ActionDataCache(max_size=10**6)
+    monkeypatch.setattr(action_object, "ACTION_DATA_CACHE", cache)
+    monkeypatch.setattr(blob_storage_service, "ACTION_DATA_CACHE", cache)
+    read = BlobStorageService._read
+    uids = []
+
+    def counting_read(self, context, uid, *args, **kwargs):
+        uids.append(uid)
+        return read(self, context, uid, *args, **kwargs)
+
+    monkeypatch.setattr(BlobStorageService, "_read", counting_read)
+    yield uids
+
+
+def test_action_object_reads_cached_data(worker, reads):
+    root_client = worker.root_client
+    data = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(data).send(root_client)
+
+    for _ in range(3):
+        # a new object for the same data, like a pointer fetched again
+        reader = sy.ActionObject.empty()
+        reader.syft_blob_storage_entry_id = obj.syft_blob_storage_entry_id
+        reader._set_obj_location_(worker.id, root_client.verify_key)
+        assert reader.reload_cache() is None
+        assert (reader.syft_action_data_cache == data).all()
+
+    assert reads.count(obj.syft_blob_storage_entry_id) == 1
+    assert action_object.ACTION_DATA_CACHE.hits == 2
+
+
+def read(worker, obj):
+    # a new object for the same data, like a pointer fetched again
+    reader = sy.ActionObject.empty()
+    reader.syft_blob_storage_entry_id = obj.syft_blob_storage_entry_id
+    reader._set_obj_location_(worker.id, worker.root_client.verify_key)
+    reader.reload_cache()
+    return reader.syft_action_data_cache
+
+
+def test_action_object_cached_data_is_not_shared(worker, reads):
+    data = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(data).send(worker.root_client)
+
+    # neither the reader that cached the data nor the next ones modify it
+    for _ in range(2):
+        read(worker, obj)[0] = -1
+    assert (read(worker, obj) == data).all()
+
+
+def test_blob_storage_delete_invalidates_cached_data(worker, reads):
+    data = np.arange(10_000)
+    obj = sy.ActionObject.from_obj(data).send(worker.root_client)
+    assert (read(worker, obj) == data).all()
+
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.root_client.verify_key
+    )
+    blob_storage = worker.get_service("BlobStorageService")
+    result = blob_storage.delete(context, obj.syft_blob_storage_entry_id)
+    assert isinstance(result, SyftSuccess)
+    assert isinstance(
+        action_object.ACTION_DATA_CACHE.get(
+            obj.syft_blob_storage_entry_id, worker.root_client.verify_key
+        ),
+        ActionDataEmpty,
+    )
@@ -1,13 +1,23 @@
 # stdlib
 from datetime import datetime
 from datetime import timedelta
+from threading import Thread
+from time import perf_counter
+from time import sleep
 
 # third party
 import pytest
 
 # syft absolute
+from syft.service.context import AuthedServiceContext
+from syft.service.job.job_stash import JOB_WAIT_TIMEOUT_SEC
 from syft.service.job.job_stash import Job
+from syft.service.job.job_stash import JobResultNotifier
 from syft.service.job.job_stash import JobStatus
+from syft.service.job.job_stash import wait_until_resolved
+from syft.service.response import SyftError
+from syft.service.service import UserServiceConfigRegistry
+from syft.service.user.user_roles import ServiceRole
 from syft.types.uid import UID
 
 
@@ -43,3 +53,97 @@ def test_eta_string(current_iter, n_iters, status, creation_time_delta, expected
         assert job.eta_string is not None
         assert isinstance(job.eta_string, str)
         assert expected in job.eta_string
+
+
+@pytest.fixture
+def authed_context(worker):
+    yield AuthedServiceContext(node=worker, credentials=worker.signing_key.verify_key)
+
+
+@pytest.fixture
+def job(worker, authed_context):
+    job = Job(id=UID(), node_uid=worker.id)
+    worker.job_stash.set(authed_context.credentials, job)
+    yield job
+
+
+def test_job_wait_for_wakes_up_on_set_result(worker, authed_context, job):
+    job_service = worker.get_service("JobService")
+    result = {}
+
+    def wait_for() -> None:
+        start = perf_counter()
+        result["job"] = job_service.wait_for(authed_context, job.id, timeout=30)
+        result["duration"] = perf_counter() - start
+
+    thread = Thread(target=wait_for)
+    thread.start()
+    sleep(0.5)
+    job.resolved = True
+    job.status = JobStatus.COMPLETED
+    worker.job_stash.set_result(authed_context.credentials, job)
+    thread.join()
+
+    assert result["job"].resolved
+    assert result["duration"] < 5
+
+
+def test_job_wait_for_timeout(worker, authed_context, job):
+    job_service = worker.get_service("JobService")
+
+    start = perf_counter()
+    result = job_service.wait_for(authed_context, job.id, timeout=0.5)
+
+    assert not result.resolved
+    assert perf_counter() - start >= 0.5
+
+
+def test_job_wait_for_limits_waiters():
+    notifier = JobResultNotifier(max_waiters=1)
+    thread = Thread(target=notifier.wait_until, args=(lambda: False, 1))
+    thread.start()
+    sleep(0.1)
+    assert notifier.waiters == 1
+
+    # over the limit, the condition is checked once instead of blocking
+    start = perf_counter()
+    assert not notifier.wait_until(lambda: False, timeout=30)
+    assert perf_counter() - start < 1
+    thread.join()
+    assert notifier.waiters == 0
+
+
+@pytest.mark.parametrize("path", ["job.wait_for", "action.wait_for"])
+def test_wait_for_needs_data_scientist_role(path):
+    assert path not in UserServiceConfigRegistry.from_role(ServiceRole.GUEST)
+    assert path in UserServiceConfigRegistry.from_role(ServiceRole.DATA_SCIENTIST)
+
+
+def test_wait_until_resolved_polls_with_backoff():
+    calls = []
+
+    def is_resolved() -> bool:
+        calls.append(perf_counter())
+        return len(calls) == 4
+
+    assert wait_until_resolved(wait_for=None, is_resolved=is_resolved)
+    gaps = [b - a for a, b in zip(calls, calls[1:])]
+    assert gaps == sorted(gaps)
+
+    assert not wait_until_resolved(
+        wait_for=None, is_resolved=lambda: False, timeout=0.2
+    )
+
+
+def test_wait_until_resolved_uses_wait_for():
+    timeouts = []
+
+    def wait_for(timeout: float) -> bool:
+        timeouts.append(timeout)
+        return len(timeouts) == 2
+
+    assert wait_until_resolved(wait_for=wait_for, is_resolved=lambda: False)
+    assert timeouts == [JOB_WAIT_TIMEOUT_SEC, JOB_WAIT_TIMEOUT_SEC]
+
+    error = SyftError(message="no permission")
+    assert wait_until_resolved(wait_for=lambda _: error, is_resolved=None) is error
@@ -0,0 +1,204 @@
+# stdlib
+from time import perf_counter
+from time import sleep
+
+# third party
+import pytest
+
+# syft absolute
+from syft.service.context import AuthedServiceContext
+from syft.service.log.log_service import LogBuffer
+from syft.service.log.log_service import LogFlusher
+from syft.service.log.log_service import LogService
+from syft.service.response import SyftError
+from syft.types.uid import UID
+
+
+@pytest.fixture
+def authed_context(worker):
+    yield AuthedServiceContext(node=worker, credentials=worker.signing_key.verify_key)
+
+
+@pytest.fixture
+def log_service(worker) -> LogService:
+    yield worker.get_service("LogService")
+
+
+@pytest.fixture
+def log_id(log_service, authed_context) -> UID:
+    uid = UID()
+    log_service.add(authed_context, uid, UID())
+    yield uid
+
+
+def chunks(log_service: LogService, log_id: UID) -> list:
+    return log_service.chunk_stash.get_by_log_id(
+        log_service.stash.partition.root_verify_key, log_id
+    ).ok()
+
+
+def test_log_append_adds_chunks(log_service, authed_context, log_id):
+    for i in range(3):
+        log_service.append(authed_context, log_id, new_str=f"line {i}\n")
+    log_service.append(authed_context, log_id, new_err="error\n")
+
+    stdout = log_service.get_stdout(authed_context, log_id).ok()
+    assert stdout == "line 0\nline 1\nline 2\n"
+    assert log_service.get_error(authed_context, log_id).ok() == "error\n"
+    assert log_service.get(authed_context, log_id).ok().stdout == stdout
+
+    # the log itself is not rewritten
+    log = log_service.stash.get_by_uid(authed_context.credentials, log_id).ok()
+    assert log.stdout == ""
+    assert [chunk.offset for chunk in chunks(log_service, log_id)] == [0, 0, 7, 14]
+
+
+@pytest.mark.parametrize(
+    "offset, expected",
+    [
+        (0, "line 0\nline 1\n"),
+        (7, "line 1\n"),
+        (10, "e 1\n"),
+        (14, ""),
+        (100, ""),
+    ],
+)
+def test_log_tail_from_offset(log_service, authed_context, log_id, offset, expected):
+    log_service.append(authed_context, log_id, new_str="line 0\n")
+    log_service.append(authed_context, log_id, new_str="line 1\n")
+
+    result = log_service.get_stdout(authed_context, log_id, offset=offset)
+    assert result.ok() == expected
+
+
+def test_log_compact(log_service, authed_context, log_id):
+    log_service.append(authed_context, log_id, new_str="line 0\n", new_err="error\n")
+    log_service.append(authed_context, log_id, new_str="line 1\n")
+    log_service.compact(authed_context, log_id)
+
+    log = log_service.stash.get_by_uid(authed_context.credentials, log_id).ok()
+    assert log.stdout == "line 0\nline 1\n"
+    assert log.stderr == "error\n"
+    assert chunks(log_service, log_id) == []
+
+    # appending continues after the compacted output
+    log_service.append(authed_context, log_id, new_str="line 2\n")
+    assert chunks(log_service, log_id)[0].offset == 14
+    result = log_service.get_stdout(authed_context, log_id, offset=7)
+    assert result.ok() == "line 1\nline 2\n"
+
+
+def test_log_compact_keeps_chunks_appended_meanwhile(
+    log_service, authed_context, log_id, monkeypatch
+):
+    log_service.append(authed_context, log_id, new_str="line 0\n")
+    merge_chunks = log_service._merge_chunks
+
+    def merge_then_append(context, log):
+        result = merge_chunks(context, log)
+        # a job appends output while the log is compacted
+        log_service.append(authed_context, log_id, new_str="line 1\n")
+        return result
+
+    monkeypatch.setattr(log_service, "_merge_chunks", merge_then_append)
+    log_service.compact(authed_context, log_id)
+    monkeypatch.undo()
+
+    assert [chunk.data for chunk in chunks(log_service, log_id)] == ["line 1\n"]
+    stdout = log_service.get_stdout(authed_context, log_id).ok()
+    assert stdout == "line 0\nline 1\n"
+
+
+def test_log_restart_drops_chunks(log_service, authed_context, log_id):
+    log_service.append(authed_context, log_id, new_str="line 0\n")
+    log_service.restart(authed_context, log_id)
+
+    assert log_service.get_stdout(authed_context, log_id).ok() == ""
+    assert chunks(log_service, log_id) == []
+
+
+def test_log_buffer_flushes_on_size(log_service, authed_context, log_id):
+    log_buffer = LogBuffer(
+        context=authed_context, uid=log_id, flush_size=10, flusher=None
+    )
+    log_buffer.write("12345")
+    assert chunks(log_service, log_id) == []
+
+    log_buffer.write("67890")
+    log_buffer.write("x")
+    assert len(chunks(log_service, log_id)) == 1
+
+    log_buffer.close()
+    assert len(chunks(log_service, log_id)) == 2
+    assert log_service.get_stdout(authed_context, log_id).ok() == "1234567890x"
+
+
+def test_log_buffer_retries_failed_append(
+    log_service, authed_context, log_id, monkeypatch
+):
+    log_buffer = LogBuffer(context=authed_context, uid=log_id, flusher=None)
+    log_buffer.write("line 0\n")
+
+    monkeypatch.setattr(
+        log_service, "append_at", lambda **kwargs: SyftError(message="failed")
+    )
+    assert isinstance(log_buffer.flush(), SyftError)
+    monkeypatch.undo()
+
+    log_buffer.write("line 1\n")
+    log_buffer.close()
+    stdout = log_service.get_stdout(authed_context, log_id).ok()
+    assert stdout == "line 0\nline 1\n"
+
+
+def test_log_buffer_flushes_on_interval(log_service, authed_context, log_id):
+    log_buffer = LogBuffer(
+        context=authed_context,
+        uid=log_id,
+        flush_interval=0,
+        flusher=LogFlusher(tick=0.01),
+    )
+    log_buffer.write("line 0\n")
+
+    # nothing else is written, the flusher thread appends the pending output
+    deadline = perf_counter() + 10
+    while not chunks(log_service, log_id) and perf_counter() < deadline:
+        sleep(0.01)
+    assert log_service.get_stdout(authed_context, log_id).ok() == "line 0\n"
+    log_buffer.close()
+    assert log_buffer not in log_buffer.flusher._buffers
+
+
+def test_log_buffer_tracks_offset(log_service, authed_context, log_id, monkeypatch):
+    log_service.append(authed_context, log_id, new_str="before\n")
+
+    lookups = []
+    get_by_log_id = log_service.chunk_stash.get_by_log_id
+
+    def counting_get_by_log_id(*args, **kwargs):
+        lookups.append(args)
+        return get_by_log_id(*args, **kwargs)
+
+    monkeypatch.setattr(
+        log_service.chunk_stash, "get_by_log_id", counting_get_by_log_id
+    )
+    log_buffer = LogBuffer(
+        context=authed_context, uid=log_id, flush_size=1, flusher=None
+    )
+    for i in range(3):
+        log_buffer.write(f"line {i}\n")
+    log_buffer.close()
+
+    # the end of the stream is looked up once, not once per append
+    assert len(lookups) == 1
+    monkeypatch.undo()
+    assert [chunk.offset for chunk in chunks(log_service, log_id)] == [0, 7, 14, 21]
+    stdout = log_service.get_stdout(authed_context, log_id, offset=7).ok()
+    assert stdout == "line 0\nline 1\nline 2\n"
+
+
+def test_log_tail_through_api(worker, log_service, authed_context, log_id):
+    log_service.append(authed_context, log_id, new_str="line 0\nline 1\n")
+    log_api = worker.root_client.api.services.log
+    assert log_api.get_stdout(log_id) == "line 0\nline 1\n"
+    assert log_api.get_stdout(log_id, offset=len("line 0\n")) == "line 1\n"
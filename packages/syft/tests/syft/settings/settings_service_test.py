@@ -365,3 +365,43 @@ def test_user_register_for_role(monkeypatch: MonkeyPatch, faker: Faker):
             [u.email in emails_added for u in root_client.users.get_all()]
         )
         assert users_created_count == len(emails_added)
+
+
+def test_node_settings_and_metadata_are_cached(
+    monkeypatch: MonkeyPatch, worker: syft.Worker
+) -> None:
+    settings = worker.settings
+    metadata = worker.metadata
+    metadata_bytes = worker.metadata_bytes
+
+    # no store I/O once the settings are cached
+    def mock_stash_get_all(*args, **kwargs) -> Err:
+        raise AssertionError("settings were read from the store")
+
+    monkeypatch.setattr(SettingsStash, "get_all", mock_stash_get_all)
+    assert worker.settings is settings
+    assert worker.metadata is metadata
+    assert worker.metadata_bytes is metadata_bytes
+    assert syft.deserialize(metadata_bytes, from_bytes=True) == metadata
+
+
+def test_node_settings_cache_cleared_on_update(worker: syft.Worker) -> None:
+    assert worker.metadata.name == worker.settings.name
+    metadata_bytes = worker.metadata_bytes
+
+    root_client = worker.root_client
+    assert root_client.api.services.settings.update(
+        NodeSettingsUpdate(name="new name", description="new description")
+    )
+
+    assert worker.settings.name == "new name"
+    assert worker.metadata.name == "new name"
+    assert worker.metadata.description == "new description"
+    metadata = syft.deserialize(worker.metadata_bytes, from_bytes=True)
+    assert metadata.name == "new name"
+    assert worker.metadata_bytes != metadata_bytes
+
+    root_client.settings.allow_guest_signup(enable=True)
+    assert worker.settings.signup_enabled
+    root_client.settings.allow_guest_signup(enable=False)
+    assert not worker.settings.signup_enabled
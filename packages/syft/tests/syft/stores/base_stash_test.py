@@ -12,6 +12,7 @@ from typing_extensions import ParamSpec
 
 # syft absolute
 from syft.serde.serializable import serializable
+from syft.service.action.action_permissions import ActionObjectREAD
 from syft.service.response import SyftSuccess
 from syft.store.dict_document_store import DictDocumentStore
 from syft.store.document_store import BaseUIDStoreStash
@@ -265,6 +266,21 @@ def test_basestash_delete_by_uid(
     assert result.ok() is None
 
 
+def test_basestash_delete_keeps_objects_with_same_searchable_value(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    first, second = mock_objects[:2]
+    second.desc = first.desc
+    for obj in (first, second):
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    result = base_stash.delete_by_uid(root_verify_key, first.id)
+    assert result.is_ok()
+
+    result = base_stash.query_all_kwargs(root_verify_key, desc=first.desc)
+    assert result.ok() == [second]
+
+
 def test_basestash_query_one(
     root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker: Faker
 ) -> None:
@@ -444,3 +460,54 @@ def test_basestash_cannot_query_non_searchable(
     assert base_stash.query_all(
         root_verify_key, QueryKeys(qks=[qk, UIDPartitionKey.with_obj(obj.id)])
     ).is_err()
+
+
+def test_basestash_get_all_paginated(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    pages = [
+        base_stash.get_all(root_verify_key, page_size=4, page_index=idx).ok()
+        for idx in range(4)
+    ]
+    assert [len(page) for page in pages] == [4, 4, 2, 0]
+    assert [obj.id for page in pages for obj in page] == [
+        obj.id for obj in mock_objects
+    ]
+
+    ordered = sorted(mock_objects, key=lambda obj: obj.importance)
+    page = base_stash.get_all(
+        root_verify_key, order_by=ImportancePartitionKey, page_size=3, page_index=1
+    ).ok()
+    assert [obj.importance for obj in page] == [obj.importance for obj in ordered[3:6]]
+
+
+def test_basestash_get_all_paginated_checks_permissions(
+    root_verify_key,
+    guest_verify_key,
+    base_stash: MockStash,
+    mock_objects: list[MockObject],
+) -> None:
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    readable = mock_objects[1::2]
+    base_stash.add_permissions(
+        [ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in readable]
+    )
+
+    page = base_stash.get_all(guest_verify_key, page_size=2, page_index=1).ok()
+    assert [obj.id for obj in page] == [obj.id for obj in readable[2:4]]
+
+
+def test_basestash_iter_all(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    for obj in mock_objects:
+        add_mock_object(root_verify_key, base_stash, obj)
+
+    objs = base_stash.iter_all(root_verify_key, page_size=3)
+    assert next(objs).id == mock_objects[0].id
+    assert [obj.id for obj in objs] == [obj.id for obj in mock_objects[1:]]
@@ -1,6 +1,7 @@
 # stdlib
 from secrets import token_hex
 from threading import Thread
+from time import perf_counter
 
 # third party
 from pymongo.collection import Collection as MongoCollection
@@ -25,6 +26,7 @@ from syft.store.mongo_document_store import MongoStorePartition
 from syft.types.uid import UID
 
 # relative
+from ...utils.custom_markers import large_benchmark
 from .store_constants_test import TEST_VERIFY_KEY_STRING_HACKER
 from .store_fixtures_test import mongo_store_partition_fn
 from .store_mocks_test import MockObjectType
@@ -1035,3 +1037,106 @@ def test_mongo_store_partition_permissions_update(
         assert res.is_ok()
         # the id of the object in the permission collection should not be changed
         assert permsissions.find_one(qk.as_dict_mongo)["_id"] == obj.id
+
+
+def test_mongo_store_partition_permissions_checked_in_batches(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+    monkeypatch,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+    objs = [MockSyftObject(data=i) for i in range(10)]
+    for obj in objs:
+        mongo_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+    readable = objs[::3]
+    mongo_store_partition.add_permissions(
+        [ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in readable]
+    )
+
+    permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs
+    ]
+    assert mongo_store_partition._has_permissions(permissions) == [
+        mongo_store_partition.has_permission(permission) for permission in permissions
+    ]
+    assert mongo_store_partition.has_permissions(permissions[::3])
+    assert not mongo_store_partition.has_permissions(permissions[:2])
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("permissions should not be checked one by one")
+
+    monkeypatch.setattr(MongoStorePartition, "has_permission", _fail)
+    res = mongo_store_partition.all(guest_verify_key)
+    assert {obj.id for obj in res.ok()} == {obj.id for obj in readable}
+
+
+def test_mongo_store_partition_add_permissions_merges_existing(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+    permissions_collection: MongoCollection = mongo_store_partition.permissions.ok()
+    obj = MockSyftObject(data=1)
+
+    mongo_store_partition.add_permission(
+        ActionObjectWRITE(uid=obj.id, credentials=root_verify_key)
+    )
+    mongo_store_partition.add_permissions(
+        [
+            ActionObjectREAD(uid=obj.id, credentials=guest_verify_key),
+            ActionObjectREAD(uid=obj.id, credentials=guest_verify_key),
+        ]
+    )
+
+    assert permissions_collection.count_documents({}) == 1
+    find_res = permissions_collection.find_one({"_id": obj.id})
+    assert find_res["permissions"] == {
+        ActionObjectWRITE(uid=obj.id, credentials=root_verify_key).permission_string,
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key).permission_string,
+    }
+
+
+@large_benchmark()
+def test_mongo_store_partition_get_all_permissions_benchmark(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+    monkeypatch,
+) -> None:
+    n_objs = 10_000
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+    collection: MongoCollection = mongo_store_partition.collection.ok()
+    objs = [MockSyftObject(data=i) for i in range(n_objs)]
+    collection.insert_many([obj.to(mongo_store_partition.storage_type) for obj in objs])
+
+    start = perf_counter()
+    mongo_store_partition.add_permissions(
+        [ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs]
+    )
+    bulk_add = perf_counter() - start
+
+    start = perf_counter()
+    assert len(mongo_store_partition.all(guest_verify_key).ok()) == n_objs
+    batched = perf_counter() - start
+
+    # one find_one per object, as before permissions were checked in batches
+    monkeypatch.setattr(
+        MongoStorePartition,
+        "_has_permissions",
+        lambda self, permissions: [
+            self.has_permission(permission) for permission in permissions
+        ],
+    )
+    start = perf_counter()
+    assert len(mongo_store_partition.all(guest_verify_key).ok()) == n_objs
+    per_object = perf_counter() - start
+
+    print(
+        f"\n{n_objs} objects: add_permissions {bulk_add:.3f}s, get_all "
+        f"{per_object:.3f}s checking each object, {batched:.3f}s in batches"
+    )
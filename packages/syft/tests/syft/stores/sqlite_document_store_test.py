@@ -1,14 +1,26 @@
 # stdlib
+from contextlib import nullcontext
 from threading import Thread
+from time import perf_counter
 
 # third party
 import pytest
 
 # syft absolute
+from syft.store import sqlite_document_store as sqlite_document_store_module
+from syft.store.document_store import QueryKey
 from syft.store.document_store import QueryKeys
+from syft.store.kv_document_store import KeyValueStorePartition
+from syft.store.sqlite_document_store import INDEX_UNIQUE
+from syft.store.sqlite_document_store import SQLiteDocumentStore
 from syft.store.sqlite_document_store import SQLiteStorePartition
 
 # relative
+from .base_stash_test import DescPartitionKey
+from .base_stash_test import MockObject
+from .base_stash_test import MockStash
+from .base_stash_test import NamePartitionKey
+from .store_fixtures_test import sqlite_document_store_fn
 from .store_fixtures_test import sqlite_store_partition_fn
 from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockSyftObject
@@ -518,3 +530,218 @@ def test_sqlite_store_partition_set_delete_threading(
 #         ).ok()
 #     )
 #     assert stored_cnt == 0
+
+
+def count_commits(sqlite_store_partition: SQLiteStorePartition) -> list[str]:
+    commits: list[str] = []
+
+    def _trace(statement: str) -> None:
+        if statement.strip().upper() == "COMMIT":
+            commits.append(statement)
+
+    sqlite_store_partition.data.db.set_trace_callback(_trace)
+    return commits
+
+
+def test_sqlite_store_partition_set_commits_once(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    commits = count_commits(sqlite_store_partition)
+
+    obj = MockSyftObject(data=1)
+    res = sqlite_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+    assert res.is_ok()
+    assert len(commits) == 1
+
+    # reads don't commit
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == 1
+    assert len(commits) == 1
+
+    sqlite_store_partition.data.db.set_trace_callback(None)
+
+
+def test_sqlite_store_partition_transaction_rollback(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    obj = MockSyftObject(data=1)
+    with pytest.raises(RuntimeError):
+        with sqlite_store_partition.transaction():
+            sqlite_store_partition.data[obj.id] = obj
+            sqlite_store_partition.permissions[obj.id] = {"permission"}
+            raise RuntimeError("abort")
+
+    assert obj.id not in sqlite_store_partition.data
+    assert obj.id not in sqlite_store_partition.permissions
+
+
+def _concurrent_set_benchmark(
+    root_verify_key, sqlite_workspace: tuple, thread_cnt: int, repeats: int
+) -> float:
+    errs = []
+
+    def _kv_cbk(tid: int) -> None:
+        sqlite_store_partition = sqlite_store_partition_fn(
+            root_verify_key, sqlite_workspace
+        )
+        for idx in range(repeats):
+            obj = MockObjectType(data=tid * repeats + idx)
+            res = sqlite_store_partition.set(
+                root_verify_key, obj, ignore_duplicates=False
+            )
+            if res.is_err():
+                errs.append(res)
+
+    threads = [Thread(target=_kv_cbk, args=(tid,)) for tid in range(thread_cnt)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - start
+
+    assert not errs, errs
+    return elapsed
+
+
+def test_sqlite_store_partition_concurrent_set_benchmark(
+    root_verify_key,
+    sqlite_workspace: tuple,
+    monkeypatch,
+) -> None:
+    thread_cnt = 4
+    repeats = 25
+
+    batched = _concurrent_set_benchmark(
+        root_verify_key, sqlite_workspace, thread_cnt, repeats
+    )
+
+    # a commit after every statement, as before transactions were added
+    monkeypatch.setattr(
+        KeyValueStorePartition, "transaction", lambda self: nullcontext()
+    )
+    per_statement = _concurrent_set_benchmark(
+        root_verify_key, sqlite_workspace, thread_cnt, repeats
+    )
+
+    print(
+        f"\n{thread_cnt * repeats} concurrent sets from {thread_cnt} threads: "
+        f"{per_statement:.3f}s committing every statement, "
+        f"{batched:.3f}s committing once per set"
+    )
+
+    sqlite_store_partition = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace
+    )
+    stored_cnt = len(sqlite_store_partition.all(root_verify_key).ok())
+    assert stored_cnt == 2 * thread_cnt * repeats
+
+
+def mock_objects(n: int) -> list[MockObject]:
+    return [
+        MockObject(
+            name=f"name-{idx}", desc=f"desc-{idx % 2}", importance=idx, value=idx
+        )
+        for idx in range(n)
+    ]
+
+
+def test_sqlite_store_partition_index_queries(
+    root_verify_key,
+    sqlite_document_store: SQLiteDocumentStore,
+) -> None:
+    stash = MockStash(store=sqlite_document_store)
+    objs = mock_objects(4)
+    for obj in objs:
+        assert stash.set(root_verify_key, obj).is_ok()
+
+    res = stash.query_one(root_verify_key, NamePartitionKey.with_obj("name-2"))
+    assert res.ok() == objs[2]
+
+    res = stash.query_all(root_verify_key, DescPartitionKey.with_obj("desc-1"))
+    assert {obj.id for obj in res.ok()} == {objs[1].id, objs[3].id}
+
+    qks = QueryKeys(
+        qks=[
+            QueryKey.from_obj(DescPartitionKey, "desc-1"),
+            QueryKey.from_obj(NamePartitionKey, "name-3"),
+        ]
+    )
+    assert stash.query_one(root_verify_key, qks).ok() == objs[3]
+
+    # unique keys are still enforced
+    duplicate = MockObject(name="name-0", desc="other", importance=0, value=0)
+    assert stash.set(root_verify_key, duplicate).is_err()
+
+    # updates move the keys
+    objs[2].name = "renamed"
+    objs[2].desc = "desc-1"
+    assert stash.update(root_verify_key, objs[2]).is_ok()
+    res = stash.query_one(root_verify_key, NamePartitionKey.with_obj("name-2"))
+    assert res.ok() is None
+    res = stash.query_one(root_verify_key, NamePartitionKey.with_obj("renamed"))
+    assert res.ok().id == objs[2].id
+    res = stash.query_all(root_verify_key, DescPartitionKey.with_obj("desc-1"))
+    assert len(res.ok()) == 3
+
+    # deletes remove them
+    assert stash.delete_by_uid(root_verify_key, objs[3].id).is_ok()
+    res = stash.query_one(root_verify_key, NamePartitionKey.with_obj("name-3"))
+    assert res.ok() is None
+    res = stash.query_all(root_verify_key, DescPartitionKey.with_obj("desc-1"))
+    assert len(res.ok()) == 2
+
+
+def test_sqlite_store_partition_index_lookup_uses_sql_index(
+    root_verify_key,
+    sqlite_document_store: SQLiteDocumentStore,
+) -> None:
+    stash = MockStash(store=sqlite_document_store)
+    index = stash.partition.index
+
+    res = index._execute(
+        f"explain query plan select uid from {index.table_name} "  # nosec
+        "where kind = ? and key = ? and value in (?)",
+        [INDEX_UNIQUE, "name", "name-0"],
+    )
+    plan = " ".join(str(row) for row in res.ok().fetchall())
+    assert f"{index.table_name}_lookup" in plan
+
+
+def test_sqlite_store_partition_index_rebuilt_for_existing_data(
+    root_verify_key,
+    sqlite_workspace: tuple,
+) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    stash = MockStash(store=store)
+    objs = mock_objects(3)
+    for obj in objs:
+        assert stash.set(root_verify_key, obj).is_ok()
+
+    # simulate a partition written before the index table existed
+    stash.partition.index._delete_all()
+
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    stash = MockStash(store=store)
+    res = stash.query_one(root_verify_key, NamePartitionKey.with_obj("name-1"))
+    assert res.ok() == objs[1]
+
+
+def test_sqlite_store_partition_all_paginated(
+    root_verify_key,
+    sqlite_document_store: SQLiteDocumentStore,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(sqlite_document_store_module, "SQLITE_PAGE_SIZE", 2)
+    stash = MockStash(store=sqlite_document_store)
+    objs = mock_objects(7)
+    for obj in objs:
+        assert stash.set(root_verify_key, obj).is_ok()
+
+    page = stash.get_all(root_verify_key, page_size=3, page_index=1).ok()
+    assert [obj.id for obj in page] == [obj.id for obj in objs[3:6]]
+
+    assert [obj.id for obj in stash.iter_all(root_verify_key, page_size=2)] == [
+        obj.id for obj in objs
+    ]
@@ -20,6 +20,7 @@ from syft.service.user.user import UserCreate
 from syft.service.user.user import UserPrivateKey
 from syft.service.user.user import UserUpdate
 from syft.service.user.user import UserView
+from syft.service.user.user import UserViewPage
 from syft.service.user.user_roles import ServiceRole
 from syft.service.user.user_service import UserService
 from syft.types.uid import UID
@@ -196,6 +197,25 @@ def test_userservice_get_all_success(
     )
 
 
+def test_userservice_get_all_pages(
+    monkeypatch: MonkeyPatch,
+    user_service: UserService,
+    authed_context: AuthedServiceContext,
+    guest_user: User,
+    admin_user: User,
+) -> None:
+    def mock_get_all(credentials: SyftVerifyKey) -> Ok:
+        return Ok([guest_user, admin_user])
+
+    monkeypatch.setattr(user_service.stash, "get_all", mock_get_all)
+    page = user_service.get_all(authed_context, page_size=1, page_index=1)
+    assert isinstance(page, UserViewPage)
+    assert page.total == 2
+    assert [user.email for user in page.users] == [admin_user.email]
+
+    assert user_service.get_all(authed_context, page_size=1, page_index=2) == []
+
+
 def test_userservice_get_all_error(
     monkeypatch: MonkeyPatch,
     user_service: UserService,
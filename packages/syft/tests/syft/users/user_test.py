@@ -423,3 +423,22 @@ def test_user_view_set_role_admin(faker: Faker) -> None:
 
     node.python_node.cleanup()
     node.land()
+
+
+def test_user_role_changes_apply_to_next_call(worker, ds_client):
+    # the role of the caller is cached, updating or deleting the user clears it
+    assert isinstance(
+        manually_call_service(worker, ds_client, "user.get_all"), SyftError
+    )
+
+    assert worker.root_client.api.services.user.update(
+        ds_client.user_id, UserUpdate(role=ServiceRole.DATA_OWNER)
+    )
+    assert not isinstance(
+        manually_call_service(worker, ds_client, "user.get_all"), SyftError
+    )
+
+    assert worker.root_client.api.services.user.delete(ds_client.user_id)
+    result = manually_call_service(worker, ds_client, "user.get_all")
+    assert isinstance(result, SyftError)
+    assert str(ServiceRole.GUEST) in result.message
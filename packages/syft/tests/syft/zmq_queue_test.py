@@ -1,7 +1,10 @@
 # stdlib
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from secrets import token_hex
 import sys
+from textwrap import dedent
+from time import perf_counter
 from time import sleep
 
 # third party
@@ -11,6 +14,8 @@ from zmq import Socket
 
 # syft absolute
 import syft
+from syft.service.queue import queue
+from syft.service.queue import zmq_queue
 from syft.service.queue.base_queue import AbstractMessageHandler
 from syft.service.queue.queue import QueueManager
 from syft.service.queue.zmq_queue import ZMQClient
@@ -20,9 +25,11 @@ from syft.service.queue.zmq_queue import ZMQProducer
 from syft.service.queue.zmq_queue import ZMQQueueConfig
 from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
+from syft.store import sqlite_document_store
 from syft.util.util import get_queue_address
 
 # relative
+from ..utils.custom_markers import large_benchmark
 from ..utils.random_port import get_random_port
 
 
@@ -278,3 +285,183 @@ def test_zmq_client_serde():
     deser = syft.deserialize(bytes_data, from_bytes=True)
 
     assert type(deser) == type(client)
+
+
+def _run_tiny_jobs(n_jobs: int, timeout: float, **worker_kwargs) -> float:
+    """Run `n_jobs` cached code calls as jobs and time until they all resolve."""
+    worker = syft.Worker(
+        name=token_hex(8),
+        local_db=True,
+        n_consumers=1,
+        create_producer=True,
+        queue_port=None,
+        in_memory_workers=True,
+        **worker_kwargs,
+    )
+    try:
+        root_client = worker.root_client
+
+        @syft.syft_function_single_use()
+        def tiny_job() -> int:
+            return 1
+
+        tiny_job.code = dedent(tiny_job.code)
+        root_client.code.request_code_execution(tiny_job)
+        root_client.requests[-1].approve()
+
+        start = perf_counter()
+        job_ids = [root_client.code.tiny_job(blocking=False).id for _ in range(n_jobs)]
+        while job_ids:
+            if perf_counter() - start > timeout:
+                raise TimeoutError(f"{len(job_ids)} jobs not resolved in {timeout}s")
+            sleep(0.01)
+            job_ids = [
+                job_id
+                for job_id in job_ids
+                if not worker.job_stash.get_by_uid(worker.verify_key, job_id)
+                .ok()
+                .resolved
+            ]
+        return perf_counter() - start
+    finally:
+        worker.cleanup()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_dispatches_notified_items(monkeypatch):
+    # the stash scan alone would not pick these items up before the timeout
+    monkeypatch.setattr(zmq_queue, "QUEUE_SWEEP_INTERVAL_SEC", 600)
+    _run_tiny_jobs(n_jobs=3, timeout=60)
+
+
+@large_benchmark()
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_dispatch_latency_benchmark(monkeypatch):
+    n_jobs = 1_000
+    notified = _run_tiny_jobs(n_jobs, timeout=3600)
+
+    # dispatch from the stash scan only, once per second as before notifications
+    monkeypatch.setattr(zmq_queue, "QUEUE_SWEEP_INTERVAL_SEC", 1)
+    monkeypatch.setattr(ZMQProducer, "notify", lambda self, item: None)
+    polled = _run_tiny_jobs(n_jobs, timeout=3600)
+
+    print(
+        f"\n{n_jobs} tiny jobs: {polled:.3f}s polling the stash, "
+        f"{notified:.3f}s notifying the producer"
+    )
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+@pytest.mark.parametrize("thread_workers", [True, False])
+def test_zmq_consumer_warm_workers(thread_workers):
+    n_jobs = 3
+    n_setup_times = len(queue.JOB_SETUP_TIMES)
+    _run_tiny_jobs(n_jobs, timeout=60, thread_workers=thread_workers, warm_workers=True)
+    # the consumer records the setup time after the job has resolved
+    sleep(1)
+    assert len(queue.JOB_SETUP_TIMES) == n_setup_times + n_jobs
+    assert queue.job_setup_stats()["count"] == len(queue.JOB_SETUP_TIMES)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_consumer_forks_warm_process_on_start():
+    worker = syft.Worker(
+        name=token_hex(8),
+        local_db=True,
+        n_consumers=1,
+        create_producer=True,
+        queue_port=None,
+        in_memory_workers=True,
+        warm_workers=True,
+    )
+    try:
+        (consumer,) = worker.queue_manager.consumers["api_call"]
+        # the process is running before the consumer receives a job
+        pool = queue.WARM_WORKER_PROCESS_POOLS[consumer.syft_worker_id]
+        assert len(pool._processes) == 1
+
+        stats = worker.root_client.api.services.queue.get_job_setup_stats()
+        assert stats["count"] == len(queue.JOB_SETUP_TIMES)
+    finally:
+        worker.cleanup()
+
+
+def _sqlite_pool_size() -> int:
+    return len(sqlite_document_store.SQLITE_CONNECTION_POOL_DB)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_warm_process_drops_parent_connections():
+    worker = syft.Worker(name=token_hex(8), local_db=True)
+    try:
+        assert _sqlite_pool_size() > 0
+        with ProcessPoolExecutor(
+            max_workers=1, initializer=queue.init_warm_process
+        ) as pool:
+            assert pool.submit(_sqlite_pool_size).result() == 0
+    finally:
+        worker.cleanup()
+
+
+@large_benchmark()
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+@pytest.mark.parametrize("thread_workers", [True, False])
+def test_zmq_consumer_warm_workers_benchmark(thread_workers):
+    n_jobs = 100
+    cold = _run_tiny_jobs(n_jobs, timeout=3600, thread_workers=thread_workers)
+    warm = _run_tiny_jobs(
+        n_jobs, timeout=3600, thread_workers=thread_workers, warm_workers=True
+    )
+    setup_times = list(queue.JOB_SETUP_TIMES)[-n_jobs:]
+
+    print(
+        f"\n{n_jobs} tiny jobs, thread_workers={thread_workers}: {cold:.3f}s with a "
+        f"new node per job, {warm:.3f}s with warm workers, "
+        f"mean setup {sum(setup_times) / len(setup_times) * 1000:.1f}ms"
+    )
+
+
+def _run_print_job(n_lines: int, timeout: float) -> tuple[str, float]:
+    """Run a job printing `n_lines` lines, returns its stdout and how long the
+    job took to resolve."""
+    worker = syft.Worker(
+        name=token_hex(8),
+        local_db=True,
+        n_consumers=1,
+        create_producer=True,
+        queue_port=None,
+        in_memory_workers=True,
+    )
+    try:
+        root_client = worker.root_client
+
+        @syft.syft_function_single_use()
+        def print_lines() -> int:
+            for i in range(N_LINES):  # noqa: F821
+                print(f"line {i}")
+            return 1
+
+        print_lines.code = dedent(print_lines.code).replace("N_LINES", str(n_lines))
+        root_client.code.request_code_execution(print_lines)
+        root_client.requests[-1].approve()
+
+        start = perf_counter()
+        job = root_client.code.print_lines(blocking=False)
+        result = job.wait(timeout=timeout)
+        duration = perf_counter() - start
+        assert result.get() == 1
+
+        stdout = job.logs(stderr=False, _print=False)
+        return stdout, duration
+    finally:
+        worker.cleanup()
+
+
+@large_benchmark()
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_job_logs_benchmark():
+    n_lines = 100_000
+    stdout, duration = _run_print_job(n_lines, timeout=3600)
+
+    print(f"\njob printing {n_lines} lines resolved in {duration:.3f}s")
+    assert stdout.count("\n") == n_lines
@@ -1,5 +1,6 @@
 # stdlib
 from functools import partial
+import os
 import sys
 
 # third party
@@ -13,3 +14,14 @@ currently_fail_on_python_3_12 = partial(
     PYTHON_AT_LEAST_3_12,
     reason=FAIL_ON_PYTHON_3_12_REASON,
 )
+
+# large payload benchmarks need several GB of memory and minutes of runtime,
+# so they only run when explicitly requested
+RUN_LARGE_BENCHMARKS = os.getenv("SYFT_RUN_LARGE_BENCHMARKS", "false").lower() == "true"
+LARGE_BENCHMARK_REASON = "Set SYFT_RUN_LARGE_BENCHMARKS=true to run large benchmarks"
+
+large_benchmark = partial(
+    pytest.mark.skipif,
+    not RUN_LARGE_BENCHMARKS,
+    reason=LARGE_BENCHMARK_REASON,
+)